@@ -1,23 +1,27 @@
 ## Developer Note: Update Pydar's backend when new features are updated
 ## New officially named features: https://planetarynames.wr.usgs.gov/#nomenclature-news
 
-# Standard Library Imports
-import os
-
 # Related Third Party Imports
 import pandas as pd
 
 # Internal Local Imports
 import pydar
+import pydar.updateCsvCatalog
 
 if __name__ == "__main__":
-    os.system('python pydar/updateCsvCORADRJPLOptions.py')
-    os.system('python pydar/updateCsvSwathCoverage.py')
-    os.system('python pydar/updateCsvFeatureNameDetails.py')
+    # refresh coradr_jpl_options.csv -> swath_coverage_by_time_position.csv and feature_name_details.csv
+    catalog_diff = pydar.updateCsvCatalog._refresh_catalog()
 
     print("New Features (diff):")
-    os.system(
-        "git diff pydar/data/feature_name_details.csv | grep '^[+-][^+-]'")
+    feature_diff = catalog_diff["feature_name_details.csv"]
+    for feature_row in feature_diff["added"]:
+        print(f"+ {list(feature_row.values())}")
+    for feature_row in feature_diff["removed"]:
+        print(f"- {list(feature_row.values())}")
+    for feature_row in feature_diff["changed"]:
+        print(
+            f"~ {feature_row['key']['Feature Name']}: {feature_row['columns']}"
+        )
 
     # read in all feature names from CSV
     features_df = pd.read_csv("pydar/data/feature_name_details.csv")
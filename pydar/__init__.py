@@ -1,9 +1,62 @@
+# async_downloader.py function calls
+from .async_downloader import _async_lock
+from .async_downloader import _ahttp_session
+from .async_downloader import _ahttp_request
+from .async_downloader import _aread_url
+from .async_downloader import _adownload_file
+from .async_downloader import _adownload_cached_file
+from .async_downloader import _adownload_files
+from .async_downloader import _adownload_missing_files
+
+# batch_extraction.py function calls
+from .batch_extraction import _extract_request_rows
+from .batch_extraction import _extract_request_arguments
+from .batch_extraction import extract_many
+
+# catalog.py function calls
+from .catalog import _catalog_csv_path
+from .catalog import _read_catalog_csv
+from .catalog import _read_catalog_derived
+from .catalog import _write_catalog_csv
+from .catalog import _clear_catalog_cache
+
 # display_image.py function calls
 from .display_image import display_all_images
 
+# directory_listing.py function calls
+from .directory_listing import _parse_directory_listing
+from .directory_listing import _read_directory_listing
+from .directory_listing import _aread_directory_listing
+from .directory_listing import _prefetch_directory_listings
+
+# downloader.py function calls
+from .downloader import _http_pool
+from .downloader import _reset_http_pool
+from .downloader import _http_request
+from .downloader import _read_url
+from .downloader import _read_url_head
+from .downloader import _report_download_event
+from .downloader import _download_file
+from .downloader import _link_cached_file
+from .downloader import _download_cache_path
+from .downloader import _link_valid_cached_file
+from .downloader import _download_cached_file
+from .downloader import _remove_downloaded_file
+from .downloader import _read_manifest
+from .downloader import _update_manifest
+from .downloader import _manifest_entry
+from .downloader import _manifest_urls_current
+from .downloader import _manifest_file_is_current
+from .downloader import _manifest_files_extracted
+from .downloader import _missing_download_jobs
+from .downloader import _download_missing_files
+from .downloader import _download_files
+
 # error_handling.py function calls for testing
 from .error_handling import _error_handling_extract_flyby_images
+from .error_handling import _error_handling_extract_many
 from .error_handling import _error_handling_display_all_images
+from .error_handling import _error_handling_read_zip_image
 from .error_handling import _error_handling_convert_id_to_observation_num
 from .error_handling import _error_handling_convert_observation_num_to_id
 from .error_handling import _error_handling_readme_options
@@ -12,17 +65,28 @@ from .error_handling import _error_handling_id_from_lat_lon
 from .error_handling import _error_handling_id_from_lat_lon_range
 from .error_handling import _error_handling_id_from_time
 from .error_handling import _error_handling_id_from_time_range
+from .error_handling import _error_handling_id_from_lat_lon_many
+from .error_handling import _error_handling_id_from_time_many
 
 # extract_flyby_parameters.py function calls
 from .extract_flyby_parameters import _retrieve_flyby_data
 from .extract_flyby_parameters import _return_segment_options
+from .extract_flyby_parameters import _retrieve_flyby_lookup
+from .extract_flyby_parameters import _retrieve_most_recent_version_number
+from .extract_flyby_parameters import _retrieve_coradr_without_bidr
+from .extract_flyby_parameters import _aareadme_download_jobs
+from .extract_flyby_parameters import _bidr_download_jobs
+from .extract_flyby_parameters import _sbdr_download_jobs
+from .extract_flyby_parameters import _pending_download_jobs
 from .extract_flyby_parameters import extract_flyby_images
+from .extract_flyby_parameters import aextract_flyby_images
 from .extract_flyby_parameters import id_to_observation
 from .extract_flyby_parameters import observation_to_id
 
 # extract_flyby_parameters.py data
 from .extract_flyby_parameters import RESOLUTION_TYPES
 from .extract_flyby_parameters import DATAFILE_TYPES
+from .extract_flyby_parameters import CASSINI_ORBITER_URL
 
 # read_readme.py function calls
 from .read_readme import aareadme_options
@@ -34,10 +98,19 @@ from .read_readme import read_lbl_readme
 from .retrieve_ids_by_time_position import ids_from_feature_name
 from .retrieve_ids_by_time_position import ids_from_latlon
 from .retrieve_ids_by_time_position import ids_from_latlon_range
+from .retrieve_ids_by_time_position import ids_from_latlon_many
 from .retrieve_ids_by_time_position import ids_from_time
 from .retrieve_ids_by_time_position import ids_from_time_range
+from .retrieve_ids_by_time_position import ids_from_time_many
+from .retrieve_ids_by_time_position import _time_query_epoch_ms
 from .retrieve_ids_by_time_position import features_from_latlon
 from .retrieve_ids_by_time_position import features_from_latlon_range
+from .retrieve_ids_by_time_position import features_from_latlon_many
+
+# zip_extraction.py function calls
+from .zip_extraction import _extract_zip_file
+from .zip_extraction import _extract_zip_files
+from .zip_extraction import read_zip_image
 
 ## Version 2:
 
@@ -0,0 +1,490 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      async_downloader.py sends pydar HTTP requests and downloads files with asyncio,            #
+#          through an aiohttp client session (optional dependency: pip install pydar[async])      #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _async_loop_state: backend to return the                #
+#                                              semaphores and locks of the running event          #
+#                                              loop                                               #
+#                                                                                                 #
+#                                       - _async_host_semaphore: backend to return a              #
+#                                              semaphore to limit the connections open            #
+#                                              to a single host within an event loop              #
+#                                                                                                 #
+#                                       - _async_lock: backend to return a lock shared            #
+#                                              within the running event loop                      #
+#                                                                                                 #
+#                                       - _ahttp_session: backend to return an aiohttp            #
+#                                              client session for the requests of a               #
+#                                              single call                                        #
+#                                                                                                 #
+#                                       - _retry_backoff: backend to return the                   #
+#                                              seconds to wait before a retry                     #
+#                                                                                                 #
+#                                       - _ahttp_request: backend to send a request,              #
+#                                              retrying failed connections and 429/5xx            #
+#                                              responses                                          #
+#                                                                                                 #
+#                                       - _aread_url: backend to return the contents              #
+#                                              of a URL                                           #
+#                                                                                                 #
+#                                       - _adownload_file: backend to download a single           #
+#                                              file from a URL to a file path in chunks,          #
+#                                              resuming interrupted downloads                     #
+#                                                                                                 #
+#                                       - _adownload_cached_file: backend to download             #
+#                                              a file through the download cache                  #
+#                                                                                                 #
+#                                       - _adownload_files: backend to download a list            #
+#                                              of files concurrently with a bounded               #
+#                                              number of tasks                                    #
+#                                                                                                 #
+#                                       - _adownload_missing_files: backend to download           #
+#                                              only the files that are missing or                 #
+#                                              incomplete in a results directory                  #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Send HTTP requests and download files from the PDS imaging node with asyncio
+
+# Standard Library Imports
+import asyncio
+import logging
+import os
+import time
+from urllib import error, parse
+import weakref
+
+# Related Third Party Imports
+try:
+    import aiohttp  # optional, only required by aextract_flyby_images()
+except ImportError:
+    aiohttp = None
+
+# Internal Local Imports
+import pydar
+import pydar.downloader
+
+########################################################################
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+HTTP_RETRY_STATUSES = [429, 500, 502, 503,
+                       504]  # responses retried with backoff
+
+_event_loop_states = weakref.WeakKeyDictionary()
+
+
+def _async_loop_state() -> dict:
+    # Return the host semaphores and locks of the running event loop (asyncio semaphores and
+    # locks can only be used within the event loop that created them)
+    #   Returns a dictionary of the state of the running event loop
+    event_loop = asyncio.get_running_loop()
+    if event_loop not in _event_loop_states:
+        _event_loop_states[event_loop] = {"host_semaphores": {}, "locks": {}}
+    return _event_loop_states[event_loop]
+
+
+def _async_host_semaphore(
+        url: str = None,
+        max_connections_per_host: int = None) -> asyncio.BoundedSemaphore:
+    # Return a semaphore shared by all downloads to the host of a URL within the running event loop
+    #   Returns a BoundedSemaphore that allows max_connections_per_host connections at once
+    host_key = (parse.urlsplit(url).netloc, max_connections_per_host)
+    host_semaphores = _async_loop_state()["host_semaphores"]
+    if host_key not in host_semaphores:
+        host_semaphores[host_key] = asyncio.BoundedSemaphore(
+            max_connections_per_host)
+    return host_semaphores[host_key]
+
+
+def _async_lock(lock_key: str = None) -> asyncio.Lock:
+    # Return a lock shared by all tasks of the running event loop, such as the lock of a file path
+    #   Returns an asyncio.Lock
+    return _async_loop_state()["locks"].setdefault(lock_key, asyncio.Lock())
+
+
+def _ahttp_session() -> "aiohttp.ClientSession":
+    # Return an aiohttp client session for the requests of a single call (used as
+    # "async with pydar._ahttp_session() as session:"), where its keep-alive connections are
+    # only shared by that call and closed when it finishes. Proxies are read from the
+    # http_proxy and https_proxy environment variables (the same as pydar._http_request)
+    #   Returns an aiohttp.ClientSession
+    if aiohttp is None:
+        raise ImportError(
+            "aextract_flyby_images() requires aiohttp, install with: pip install pydar[async]"
+        )
+    return aiohttp.ClientSession(
+        headers={
+            "User-Agent": pydar.downloader.HTTP_USER_AGENT,
+            "Accept-Encoding": "identity"
+        },
+        timeout=aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=pydar.downloader.HTTP_TIMEOUT,
+            sock_read=pydar.downloader.HTTP_TIMEOUT),
+        auto_decompress=False,
+        trust_env=True)
+
+
+def _retry_backoff(retries: int = None, headers: dict = None) -> float:
+    # Return the seconds to wait before a retry, from the Retry-After header of a 429/503 response
+    # or HTTP_BACKOFF_FACTOR doubled after each retry (the first retry does not wait)
+    #   Returns the seconds to wait
+    if headers is not None and headers.get("Retry-After", "").isdigit():
+        return float(headers["Retry-After"])
+    if retries == 0:
+        return 0
+    return pydar.downloader.HTTP_BACKOFF_FACTOR * (2**retries)
+
+
+async def _ahttp_request(session: "aiohttp.ClientSession" = None,
+                         url: str = None,
+                         headers: dict = None,
+                         method: str = "GET",
+                         allowed_status: list = [],
+                         open_body_file=None,
+                         on_body_chunk=None,
+                         request_metrics: dict = None) -> tuple:
+    # Send a request through an aiohttp client session (redirects are followed by the session),
+    # retrying failed connections and 429/5xx responses (HTTP_RETRIES times), where an error
+    # status (400 or above) not in allowed_status raises an HTTPError. The body is written to the
+    # file returned by open_body_file(status, headers), where a connection that closes early only
+    # ends the file (checked by the caller), or read into memory when open_body_file is None or
+    # returns None. on_body_chunk(chunk size) is called after each chunk written to the file, and
+    # request_metrics (when given) records the "retries" and the "response_start" time of the
+    # final response and whether the body written to the file ended normally ("body_complete")
+    #   Returns a tuple of (status, headers, body as bytes or None)
+    retries = 0
+    while True:
+        try:
+            async with session.request(method, url,
+                                       headers=headers) as response:
+                status = response.status
+                if status in HTTP_RETRY_STATUSES and retries < pydar.downloader.HTTP_RETRIES:
+                    logger.debug(f"Retrying ({status}): {url}")
+                    retry_backoff = _retry_backoff(retries, response.headers)
+                elif status >= 400 and status not in allowed_status:
+                    raise error.HTTPError(
+                        url, status,
+                        f"Unable to access: {url}\nError (and exiting): '{status}'",
+                        response.headers, None)
+                else:
+                    if request_metrics is not None:
+                        request_metrics["retries"] = retries
+                        request_metrics["response_start"] = time.perf_counter()
+                    body_file = None
+                    if open_body_file is not None and method != "HEAD":
+                        body_file = open_body_file(status, response.headers)
+                    if body_file is None:
+                        return status, response.headers, await response.read()
+                    body_complete = False
+                    with body_file:
+                        try:
+                            async for chunk in response.content.iter_chunked(
+                                    pydar.downloader.DOWNLOAD_CHUNK_SIZE):
+                                body_file.write(chunk)
+                                if on_body_chunk is not None:
+                                    on_body_chunk(len(chunk))
+                            body_complete = True
+                        except (aiohttp.ClientError, asyncio.TimeoutError):
+                            pass  # connection closed early, the file is checked against the expected size by the caller
+                    if request_metrics is not None:
+                        request_metrics["body_complete"] = body_complete
+                    return status, response.headers, None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            if retries >= pydar.downloader.HTTP_RETRIES:
+                raise error.URLError(
+                    f"Unable to access: {url}\nError: '{err}'")
+            retry_backoff = _retry_backoff(retries)
+        await asyncio.sleep(retry_backoff)
+        retries += 1
+
+
+async def _aread_url(session: "aiohttp.ClientSession" = None,
+                     url: str = None) -> bytes:
+    # Retrieve the full contents of a URL, such as the HTML of a directory listing
+    #   Returns the response body as bytes
+    _, _, body = await _ahttp_request(session=session, url=url)
+    return body
+
+
+async def _adownload_file(session: "aiohttp.ClientSession" = None,
+                          url: str = None,
+                          file_path: str = None,
+                          max_connections_per_host: int = None,
+                          response_validators: dict = None) -> str:
+    # Download a single file from a URL to file_path in chunks through a file_path.part file, where
+    # an existing .part file is resumed with a Range request and the .part file is only renamed to
+    # file_path once its size matches the Content-Length, or without a Content-Length once the
+    # response has ended normally (the same as pydar._download_file). response_validators (when
+    # given) is updated with the ETag and Last-Modified of the response
+    #   Returns the file path of the downloaded file
+    if max_connections_per_host is None:
+        max_connections_per_host = pydar.downloader.DOWNLOAD_CONNECTIONS_PER_HOST
+
+    part_path = f"{file_path}.part"
+    async with _async_host_semaphore(url, max_connections_per_host):
+        # restart from the beginning once if the .part file does not match the server
+        for _ in range(2):
+            resume_from = os.path.getsize(part_path) if os.path.exists(
+                part_path) else 0
+            download_state = {
+                "resume_from": resume_from,
+                "expected_size": None,
+                "bytes_transferred": 0,
+                "range_mismatch": False
+            }
+            headers = {
+                "Range": f"bytes={resume_from}-"
+            } if resume_from > 0 else {}
+
+            def _open_part_file(status, response_headers):
+                if status == 416:  # Range Not Satisfiable
+                    return None
+                if status == 206 and pydar.downloader._content_range_start(
+                        response_headers) != download_state["resume_from"]:
+                    download_state["range_mismatch"] = True
+                    raise error.ContentTooShortError(
+                        f"Range does not continue '{part_path}': {url}", None)
+                if download_state["resume_from"] > 0 and status != 206:
+                    download_state[
+                        "resume_from"] = 0  # server sent the full file instead of the requested range
+                content_length = response_headers.get("Content-Length")
+                if content_length is not None:
+                    download_state["expected_size"] = download_state[
+                        "resume_from"] + int(content_length)
+                return open(
+                    part_path,
+                    "ab" if download_state["resume_from"] > 0 else "wb")
+
+            def _report_chunk(chunk_size):
+                download_state["bytes_transferred"] += chunk_size
+                pydar.downloader._report_download_progress(
+                    url, file_path, download_state["resume_from"] +
+                    download_state["bytes_transferred"],
+                    download_state["expected_size"])
+
+            request_start = time.perf_counter()
+            request_metrics = {}
+            try:
+                status, response_headers, _ = await _ahttp_request(
+                    session=session,
+                    url=url,
+                    headers=headers,
+                    allowed_status=[416],
+                    open_body_file=_open_part_file,
+                    on_body_chunk=_report_chunk,
+                    request_metrics=request_metrics)
+            except error.ContentTooShortError:
+                if not download_state["range_mismatch"]:
+                    raise
+                os.remove(part_path)  # range does not continue the .part file
+                continue
+            if status == 416:
+                os.remove(part_path)
+                continue
+
+            downloaded_size = os.path.getsize(part_path)
+            expected_size = download_state["expected_size"]
+            if expected_size is None:
+                # without a Content-Length, only a response that ended normally is complete
+                download_complete = request_metrics["body_complete"]
+            else:
+                download_complete = downloaded_size == expected_size
+            if download_complete or expected_size is None or downloaded_size < expected_size:
+                pydar.downloader._report_download_event(
+                    pydar.downloader._download_event(
+                        url, file_path,
+                        "complete" if download_complete else "incomplete",
+                        download_state["resume_from"],
+                        download_state["bytes_transferred"], request_start,
+                        request_metrics["response_start"],
+                        request_metrics["retries"]))
+            if download_complete:
+                os.replace(part_path, file_path)
+                if response_validators is not None:
+                    response_validators.update(
+                        pydar.downloader._response_validators(
+                            response_headers))
+                return file_path
+            if expected_size is None:
+                raise error.ContentTooShortError(
+                    f"Incomplete download: {url}\nConnection closed after {downloaded_size} bytes, download again to resume from '{part_path}'",
+                    None)
+            if downloaded_size > expected_size:
+                os.remove(part_path)
+                continue
+            raise error.ContentTooShortError(
+                f"Incomplete download: {url}\nRetrieved {downloaded_size} of {expected_size} bytes, download again to resume from '{part_path}'",
+                None)
+
+    raise error.ContentTooShortError(
+        f"Unable to resume download: {url}\n'{part_path}' does not match the file on the server",
+        None)
+
+
+async def _adownload_cached_file(session: "aiohttp.ClientSession" = None,
+                                 url: str = None,
+                                 file_path: str = None,
+                                 max_connections_per_host: int = None,
+                                 response_validators: dict = None) -> str:
+    # Download a file into the download cache (keyed by URL and ETag/Last-Modified) and link it
+    # into file_path, where a file already in the cache is not downloaded again and the cache is
+    # linked, copied and evicted in a thread to not block the event loop. response_validators
+    # (when given) is updated with the ETag and Last-Modified of the file
+    #   Returns the file path of the downloaded file
+    if not pydar.downloader.DOWNLOAD_CACHE_ENABLED:
+        return await _adownload_file(
+            session=session,
+            url=url,
+            file_path=file_path,
+            max_connections_per_host=max_connections_per_host,
+            response_validators=response_validators)
+
+    async with _async_host_semaphore(
+            url, max_connections_per_host
+            or pydar.downloader.DOWNLOAD_CONNECTIONS_PER_HOST):
+        _, headers, _ = await _ahttp_request(session=session,
+                                             url=url,
+                                             method="HEAD")
+    cache_path = pydar._download_cache_path(url, headers)
+    if cache_path is None:
+        return await _adownload_file(
+            session=session,
+            url=url,
+            file_path=file_path,
+            max_connections_per_host=max_connections_per_host,
+            response_validators=response_validators)
+
+    def _link_downloaded_file():
+        with pydar.downloader._download_cache_file_lock():
+            pydar._link_cached_file(cache_path, file_path)
+
+    async with _async_lock(
+            cache_path
+    ):  # only one task downloads the same file into the cache
+        if await asyncio.to_thread(pydar._link_valid_cached_file, cache_path,
+                                   file_path, headers):
+            pydar.downloader._report_download_event({
+                "event":
+                "cache_hit",
+                "url":
+                url,
+                "file_path":
+                file_path,
+                "size":
+                os.path.getsize(file_path)
+            })
+            if response_validators is not None:
+                response_validators.update(
+                    pydar.downloader._response_validators(headers))
+            return file_path
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        await _adownload_file(
+            session=session,
+            url=url,
+            file_path=cache_path,
+            max_connections_per_host=max_connections_per_host,
+            response_validators=response_validators)
+        await asyncio.to_thread(_link_downloaded_file)
+
+    await asyncio.to_thread(pydar.downloader._evict_download_cache,
+                            pydar.downloader.DOWNLOAD_CACHE_MAX_BYTES)
+    return file_path
+
+
+async def _adownload_files(session: "aiohttp.ClientSession" = None,
+                           download_jobs: list = None,
+                           max_workers: int = None,
+                           max_connections_per_host: int = None,
+                           download_validators: dict = None) -> list:
+    # Download a list of (url, file_path) jobs concurrently with up to max_workers tasks at once,
+    # where the first failed download cancels all other downloads and raises its error.
+    # download_validators (when given) is updated with {file_path: {"etag", "last_modified"}}
+    #   Returns a list of the downloaded file paths in the order of download_jobs (without repeats)
+    if max_workers is None:
+        max_workers = pydar.downloader.DOWNLOAD_WORKERS
+
+    # Only download each file path once (to avoid two tasks writing the same file)
+    unique_jobs = []
+    file_paths_found = set()
+    for url, file_path in download_jobs:
+        if file_path not in file_paths_found:
+            file_paths_found.add(file_path)
+            unique_jobs.append((url, file_path))
+
+    worker_semaphore = asyncio.Semaphore(max_workers)
+
+    async def _adownload_job(job_number, url, file_path):
+        async with worker_semaphore:
+            logger.info(f"Retrieving [{job_number}/{len(unique_jobs)}]: {url}")
+            response_validators = {}
+            await _adownload_cached_file(
+                session=session,
+                url=url,
+                file_path=file_path,
+                max_connections_per_host=max_connections_per_host,
+                response_validators=response_validators)
+            if download_validators is not None:
+                download_validators[file_path] = response_validators
+            return file_path
+
+    download_tasks = [
+        asyncio.ensure_future(_adownload_job(i + 1, url, file_path))
+        for i, (url, file_path) in enumerate(unique_jobs)
+    ]
+    try:
+        return await asyncio.gather(*download_tasks)
+    finally:
+        for download_task in download_tasks:
+            download_task.cancel()
+        await asyncio.gather(*download_tasks, return_exceptions=True)
+
+
+async def _adownload_missing_files(session: "aiohttp.ClientSession" = None,
+                                   download_jobs: list = None,
+                                   results_directory: str = None,
+                                   max_workers: int = None,
+                                   max_connections_per_host: int = None,
+                                   check_manifest: bool = True) -> list:
+    # Download the (url, file_path) jobs that are missing, incomplete or changed in a results
+    # directory and record the downloaded files in the manifest of the results directory, where
+    # the manifest is checked (HEAD requests and checksums) and its checksums are computed in a
+    # thread to not block the event loop and check_manifest=False downloads all jobs (already
+    # compared against the manifest by the caller)
+    #   Returns a list of the file paths downloaded
+    missing_jobs = download_jobs
+    if check_manifest:
+        missing_jobs = await asyncio.to_thread(pydar._missing_download_jobs,
+                                               results_directory,
+                                               download_jobs, max_workers)
+    if len(missing_jobs) == 0:
+        return []
+
+    download_validators = {}
+    downloaded_files = await _adownload_files(
+        session=session,
+        download_jobs=missing_jobs,
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host,
+        download_validators=download_validators)
+
+    def _record_manifest_entries():
+        manifest_entries = {}
+        for url, file_path in missing_jobs:
+            manifest_entries[os.path.basename(
+                file_path)] = pydar._manifest_entry(
+                    url, file_path, download_validators[file_path])
+        pydar._update_manifest(results_directory, manifest_entries)
+
+    await asyncio.to_thread(_record_manifest_entries)
+    return downloaded_files
@@ -0,0 +1,335 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      batch_extraction.py extracts many flyby images at the same time by scheduling              #
+#          the downloads and unzips of all flybys in a single worker pool                         #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _extract_request_rows: backend to return the            #
+#                                              (flyby, segment, resolution) of each               #
+#                                              extract request                                    #
+#                                                                                                 #
+#                                       - _extract_request_arguments: backend to convert          #
+#                                              an extract request into the arguments              #
+#                                              of extract_flyby_images                            #
+#                                                                                                 #
+#                                       - _plan_extract_job: backend to select the files          #
+#                                              to download and extract for a flyby job            #
+#                                                                                                 #
+#                                       - _timed_task: backend to run a task and return           #
+#                                              its start and end times                            #
+#                                                                                                 #
+#                                       - _download_shared_file: backend to download a            #
+#                                              file once and link it into each results            #
+#                                              directory that requires it                         #
+#                                                                                                 #
+#                                       - extract_many: extract flyby data BIDR and SBDR          #
+#                                              data for many flybys, segments, and                #
+#                                              resolutions to pydar_results/ and return           #
+#                                              a report for each flyby job                        #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Extract many flybys concurrently with a shared worker pool
+
+# Standard Library Imports
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import logging
+import os
+import time
+import zipfile
+
+# Related Third Party Imports
+import pandas as pd
+
+# Internal Local Imports
+import pydar
+import pydar.zip_extraction
+
+########################################################################
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+EXTRACT_REPORT_COLUMNS = [
+    "flyby_observation_num", "flyby_id", "segment_num", "resolution",
+    "results_directory", "files_downloaded", "files_skipped",
+    "files_extracted", "bytes_downloaded", "duration_seconds", "status",
+    "error"
+]
+
+
+def _extract_request_rows(requests=None) -> list:
+    # Return the (flyby, segment, resolution) of each extract request from a list of tuples or a
+    # DataFrame with the columns "flyby", "segment", and "resolution" (resolution defaults to 'I')
+    #   Returns a list of (flyby, segment, resolution) tuples
+    if isinstance(requests, pd.DataFrame):
+        if "resolution" in requests.columns:
+            resolutions = requests["resolution"]
+        else:
+            resolutions = ['I'] * len(requests)
+        return list(zip(requests["flyby"], requests["segment"], resolutions))
+    return [
+        tuple(request) if len(request) == 3 else (*request, 'I')
+        for request in requests
+    ]
+
+
+def _extract_request_arguments(flyby: str = None,
+                               segment_num: str = None,
+                               resolution: str = None) -> dict:
+    # Convert an extract request into the arguments of extract_flyby_images, where a flyby of only
+    # digits is an observation number (for example: '0211' or '211') and otherwise a flyby ID (for example: 'T65')
+    #   Returns a dictionary of {"flyby_observation_num", "flyby_id", "segment_num", "resolution"}
+    flyby_observation_num = None
+    flyby_id = None
+    if flyby.isdigit():
+        flyby_observation_num = flyby.zfill(4)
+    else:
+        flyby_id = flyby.capitalize()
+    return {
+        "flyby_observation_num": flyby_observation_num,
+        "flyby_id": flyby_id,
+        "segment_num": segment_num,
+        "resolution": resolution
+    }
+
+
+def _plan_extract_job(extract_job: dict = None) -> None:
+    # Select the AAREADME, BIDR, and SBDR files to download and the ZIPs to extract for a flyby job,
+    # skipping the files already in the manifest of the results directory
+    extract_job["start"] = time.perf_counter()
+    try:
+        flyby_observation_num = extract_job["flyby_observation_num"]
+        segment_num = extract_job["segment_num"]
+        flyby_observation_cordar_name = pydar._retrieve_most_recent_version_number(
+            flyby_observation_num)
+        results_directory = f"pydar_results/{flyby_observation_cordar_name}_{segment_num}"
+        extract_job["results_directory"] = results_directory
+        os.makedirs(results_directory, exist_ok=True)
+
+        download_jobs = pydar._aareadme_download_jobs(
+            flyby_observation_cordar_name, segment_num)
+        no_associated_bidr_values = pydar._retrieve_coradr_without_bidr()
+        if flyby_observation_num not in no_associated_bidr_values:  # only attempt to download BIDR files for flybys that have BIDR files
+            download_jobs += pydar._bidr_download_jobs(
+                flyby_observation_cordar_name, segment_num,
+                extract_job["resolution"])
+        download_jobs += pydar._sbdr_download_jobs(
+            flyby_observation_cordar_name, segment_num)
+
+        missing_jobs, zipfile_jobs, files_skipped = pydar._pending_download_jobs(
+            results_directory, download_jobs)
+        extract_job["download_jobs"] += missing_jobs
+        extract_job["zipfile_jobs"] += zipfile_jobs
+        extract_job["files_skipped"] += files_skipped
+    finally:
+        extract_job["end"] = time.perf_counter()
+
+
+def _timed_task(task_function=None, *task_args) -> tuple:
+    # Run a task in the worker pool and time it
+    #   Returns a tuple of (start time, end time, task result)
+    task_start = time.perf_counter()
+    task_result = task_function(*task_args)
+    return task_start, time.perf_counter(), task_result
+
+
+def _download_shared_file(url: str = None,
+                          file_paths: list = None,
+                          max_connections_per_host: int = None) -> dict:
+    # Download a file once and link it into each results directory that requires it (for example,
+    # the SBDR files shared by multiple resolutions of a segment)
+    #   Returns the manifest entry of the file (before a ZIP can be removed once extracted)
+    logger.info(f"Retrieving: {url}")
+    response_validators = {}
+    pydar._download_cached_file(
+        url=url,
+        file_path=file_paths[0],
+        max_connections_per_host=max_connections_per_host,
+        response_validators=response_validators)
+    for file_path in file_paths[1:]:
+        pydar._link_cached_file(file_paths[0], file_path)
+    return pydar._manifest_entry(url, file_paths[0], response_validators)
+
+
+def extract_many(requests=None,
+                 max_workers: int = None,
+                 max_connections_per_host: int = None) -> pd.DataFrame:
+    # Extract flyby data for many (flyby, segment, resolution) requests, where repeated requests and
+    # files shared between requests are only downloaded once and all listings, downloads, and unzips
+    # share one worker pool of max_workers
+    #   Returns a DataFrame report with one row for each flyby job
+
+    # Error handling:
+    pydar._error_handling_extract_many(
+        requests=requests,
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host)
+
+    if max_workers is None:
+        max_workers = pydar.downloader.DOWNLOAD_WORKERS
+
+    # Only extract each (observation number, segment, resolution) once
+    extract_jobs = []
+    extract_jobs_found = set()
+    for flyby, segment_num, resolution in _extract_request_rows(requests):
+        request_arguments = _extract_request_arguments(flyby, segment_num,
+                                                       resolution)
+        flyby_observation_num = request_arguments["flyby_observation_num"]
+        if flyby_observation_num is None:
+            flyby_observation_num = pydar.id_to_observation(
+                request_arguments["flyby_id"])
+        extract_job_key = (flyby_observation_num, segment_num, resolution)
+        if extract_job_key in extract_jobs_found:
+            continue
+        extract_jobs_found.add(extract_job_key)
+        extract_jobs.append({
+            "flyby_observation_num":
+            flyby_observation_num,
+            "flyby_id":
+            pydar.observation_to_id(flyby_observation_num),
+            "segment_num":
+            segment_num,
+            "resolution":
+            resolution,
+            "results_directory":
+            None,
+            "download_jobs": [],
+            "zipfile_jobs": [],
+            "files_skipped":
+            0,
+            "errors": []
+        })
+    logger.info(f"Extracting {len(extract_jobs)} flyby jobs")
+
+    if not os.path.exists('pydar_results'): os.makedirs('pydar_results')
+    extract_start = time.perf_counter()
+    task_times = {}
+    task_results = {}
+    task_errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="pydar_extract") as executor:
+        # Select the files of each flyby job (directory listings are retrieved concurrently)
+        plan_futures = [
+            executor.submit(_plan_extract_job, extract_job)
+            for extract_job in extract_jobs
+        ]
+        for extract_job, plan_future in zip(extract_jobs, plan_futures):
+            try:
+                plan_future.result()
+            except (OSError, ValueError) as plan_error:
+                extract_job["errors"].append(str(plan_error))
+                extract_job["download_jobs"] = []
+                extract_job["zipfile_jobs"] = []
+
+        # Download each URL once for all flyby jobs, extracting each ZIP as soon as it is downloaded
+        url_file_paths = {}
+        zipfile_names = {}
+        for extract_job in extract_jobs:
+            for url, file_path in extract_job["download_jobs"]:
+                if file_path not in url_file_paths.setdefault(url, []):
+                    url_file_paths[url].append(file_path)
+            if pydar.zip_extraction.ZIP_EXTRACT_ENABLED:  # otherwise ZIPs are kept as is
+                for url, zipfile_name in extract_job["zipfile_jobs"]:
+                    zipfile_names.setdefault(url, set()).add(zipfile_name)
+
+        pending_tasks = {}
+        for url, file_paths in url_file_paths.items():
+            pending_tasks[executor.submit(
+                _timed_task, _download_shared_file, url, file_paths,
+                max_connections_per_host)] = ("download", url)
+        for url in zipfile_names:
+            if url not in url_file_paths:  # ZIP downloaded before, but not extracted
+                for zipfile_name in zipfile_names[url]:
+                    pending_tasks[executor.submit(
+                        _timed_task, pydar._extract_zip_file,
+                        zipfile_name)] = ("extract", zipfile_name)
+        while len(pending_tasks) > 0:
+            done_tasks, _ = wait(pending_tasks, return_when=FIRST_COMPLETED)
+            for done_task in done_tasks:
+                task = pending_tasks.pop(done_task)
+                try:
+                    task_start, task_end, task_result = done_task.result()
+                except (OSError, ValueError, zipfile.BadZipFile) as task_error:
+                    task_errors[task] = str(task_error)
+                    continue
+                task_times[task] = (task_start, task_end)
+                task_results[task] = task_result
+                if task[0] == "download":
+                    for zipfile_name in zipfile_names.get(task[1], []):
+                        pending_tasks[executor.submit(
+                            _timed_task, pydar._extract_zip_file,
+                            zipfile_name)] = ("extract", zipfile_name)
+
+    # Record the downloaded and extracted files in the manifest of each results directory
+    manifest_entries = {}
+    for extract_job in extract_jobs:
+        results_directory = extract_job["results_directory"]
+        if results_directory is None:
+            continue
+        manifest = pydar._read_manifest(results_directory)
+        directory_entries = manifest_entries.setdefault(results_directory, {})
+        for url, file_path in extract_job["download_jobs"]:
+            if ("download", url) in task_times:
+                directory_entries[os.path.basename(file_path)] = dict(
+                    task_results[("download", url)])
+        for url, zipfile_name in extract_job["zipfile_jobs"]:
+            if ("extract", zipfile_name) in task_times:
+                zipfile_entry = directory_entries.get(
+                    os.path.basename(zipfile_name),
+                    manifest.get(os.path.basename(zipfile_name)))
+                zipfile_entry = dict(zipfile_entry)
+                zipfile_entry["extracted"] = task_results[("extract",
+                                                           zipfile_name)]
+                directory_entries[os.path.basename(
+                    zipfile_name)] = zipfile_entry
+    for results_directory, directory_entries in manifest_entries.items():
+        if len(directory_entries) > 0:
+            pydar._update_manifest(results_directory, directory_entries)
+
+    # Build the report for each flyby job
+    extract_report = []
+    for extract_job in extract_jobs:
+        job_tasks = [("download", url)
+                     for url, _ in extract_job["download_jobs"]]
+        job_tasks += [("extract", zipfile_name)
+                      for _, zipfile_name in extract_job["zipfile_jobs"]]
+        for job_task in job_tasks:
+            if job_task in task_errors:
+                extract_job["errors"].append(task_errors[job_task])
+        downloaded_sizes = [
+            task_results[("download", url)]["size"]
+            for url, _ in extract_job["download_jobs"]
+            if ("download", url) in task_times
+        ]
+        files_extracted = sum(
+            ("extract", zipfile_name) in task_times
+            for _, zipfile_name in extract_job["zipfile_jobs"])
+        bytes_downloaded = sum(downloaded_sizes)
+        job_end = max([extract_job["end"]] + [
+            task_times[job_task][1]
+            for job_task in job_tasks if job_task in task_times
+        ])
+        job_error = None
+        if len(extract_job["errors"]) > 0:
+            job_error = "\n".join(extract_job["errors"])
+        extract_report.append([
+            extract_job["flyby_observation_num"], extract_job["flyby_id"],
+            extract_job["segment_num"], extract_job["resolution"],
+            extract_job["results_directory"],
+            len(downloaded_sizes), extract_job["files_skipped"],
+            files_extracted, bytes_downloaded, job_end - extract_job["start"],
+            "complete" if job_error is None else "failed", job_error
+        ])
+    extract_report = pd.DataFrame(extract_report,
+                                  columns=EXTRACT_REPORT_COLUMNS)
+    logger.info(
+        f"Extracted {(extract_report['status'] == 'complete').sum()}/{len(extract_report)} flyby jobs in {time.perf_counter() - extract_start:.1f} seconds"
+    )
+    return extract_report
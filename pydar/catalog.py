@@ -0,0 +1,194 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      catalog.py loads the bundled data/*.csv files once and caches them                         #
+#          in memory for all pydar lookups                                                        #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _catalog_csv_path: backend to return the                #
+#                                              path of a bundled data/*.csv file                  #
+#                                                                                                 #
+#                                       - _read_catalog_csv: backend to return a                  #
+#                                              cached dataframe of a bundled data/*.csv           #
+#                                              file, reloaded when the file changes               #
+#                                                                                                 #
+#                                       - _read_catalog_derived: backend to return a              #
+#                                              cached structure built from a bundled              #
+#                                              data/*.csv file (arrays, lookup tables)            #
+#                                                                                                 #
+#                                       - _write_catalog_csv: backend to replace a                #
+#                                              bundled data/*.csv file without leaving            #
+#                                              a half-written file                                #
+#                                                                                                 #
+#                                       - _clear_catalog_cache: backend to drop the               #
+#                                              cached dataframes and derived structures           #
+#                                              of one or all bundled data/*.csv files             #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Load bundled CSV data files once and share them between pydar lookups
+
+# Standard Library Imports
+import logging
+import os
+import threading
+
+# Related Third Party Imports
+import pandas as pd
+
+########################################################################
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+CATALOG_DIRECTORY = os.path.join(os.path.dirname(__file__),
+                                 'data')  # get file's directory, /data/*.csv
+
+# Explicit column types for each bundled CSV (skips pandas type inference on every load)
+CATALOG_DTYPES = {
+    "swath_coverage_by_time_position.csv": {
+        "CORADR ID": str,
+        "FLYBY ID": str,
+        "SEGMENT NUMBER": "int64",
+        "FILENAME": str,
+        "DATE TYPE SYMBOL": str,
+        "DATE TYPE": str,
+        "RESOLUTION (pixels/degrees)": "int64",
+        "TARGET_NAME": str,
+        "MAXIMUM_LATITUDE (Degrees)": "float64",
+        "MINIMUM_LATITUDE (Degrees)": "float64",
+        "EASTERNMOST_LONGITUDE (Degrees)": "float64",
+        "WESTERNMOST_LONGITUDE (Degrees)": "float64",
+        "START_TIME": str,
+        "STOP_TIME": str
+    },
+    "cassini_flyby.csv": {
+        "Titan flyby id": str,
+        "Radar Data Take Number": str,
+        "Sequence number": str,
+        "Orbit Number/ID": str
+    },
+    "coradr_jpl_options.csv": {
+        "CORADR ID": str,
+        "Is a Titan Flyby": "bool",
+        "Contains ABDR": "bool",
+        "Contains ASUM": "bool",
+        "Contains BIDR": "bool",
+        "Contains LBDR": "bool",
+        "Contains SBDR": "bool",
+        "Contains STDR": "bool"
+    },
+    "feature_name_details.csv": {
+        "Feature Name": str,
+        "Northmost Latitude": "float64",
+        "Southmost Latitude": "float64",
+        "Eastmost Longitude": "float64",
+        "Westmost Longitude": "float64",
+        "Center Latitude": "float64",
+        "Center Longitude": "float64",
+        "URL": str
+    },
+    "sar_swath_details.csv": {
+        "INDEX": "int64",
+        "SWATH": str,
+        "SEGMENT": "int64"
+    }
+}
+
+# {csv_path: (modified time in ns, file size, dataframe)}
+_catalog_cache = {}
+# {(csv_name, derived_name): (dataframe it was built from, derived structure)}
+_catalog_derived_cache = {}
+_catalog_lock = threading.Lock()
+
+
+def _catalog_csv_path(csv_name: str = None,
+                      catalog_directory: str = None) -> str:
+    # Return the path to a bundled CSV file in catalog_directory (CATALOG_DIRECTORY when None)
+    if catalog_directory is None:
+        catalog_directory = CATALOG_DIRECTORY
+    return os.path.join(catalog_directory, csv_name)
+
+
+def _read_catalog_csv(csv_name: str = None,
+                      catalog_directory: str = None) -> pd.DataFrame:
+    # Return the dataframe for a bundled CSV in catalog_directory (CATALOG_DIRECTORY when None),
+    # only parsing the file when it is first requested or when the file has been modified on
+    # disk since it was last read
+    #   Returns a shared dataframe that must not be modified in place by the caller
+    if csv_name not in CATALOG_DTYPES:
+        raise ValueError(
+            f"[csv_name]: '{csv_name}' not in available catalog files {list(CATALOG_DTYPES.keys())}"
+        )
+
+    csv_path = _catalog_csv_path(csv_name, catalog_directory)
+    csv_stat = os.stat(csv_path)
+    with _catalog_lock:
+        cached = _catalog_cache.get(csv_path)
+        if cached is not None and cached[0] == csv_stat.st_mtime_ns and cached[
+                1] == csv_stat.st_size:
+            return cached[2]
+
+        logger.debug(f"Loading catalog file: {csv_path}")
+        catalog_dataframe = pd.read_csv(csv_path,
+                                        dtype=CATALOG_DTYPES[csv_name])
+        _catalog_cache[csv_path] = (csv_stat.st_mtime_ns, csv_stat.st_size,
+                                    catalog_dataframe)
+        return catalog_dataframe
+
+
+def _read_catalog_derived(csv_name: str = None,
+                          derived_name: str = None,
+                          builder=None):
+    # Return a structure built from a bundled CSV by builder(dataframe), such as
+    # precomputed arrays or lookup tables, only rebuilding it when the CSV is reloaded
+    #   Returns a shared structure that must not be modified in place by the caller
+    catalog_dataframe = _read_catalog_csv(csv_name)
+    with _catalog_lock:
+        cached = _catalog_derived_cache.get((csv_name, derived_name))
+        if cached is not None and cached[0] is catalog_dataframe:
+            return cached[1]
+
+    derived = builder(catalog_dataframe)
+    with _catalog_lock:
+        _catalog_derived_cache[(csv_name, derived_name)] = (catalog_dataframe,
+                                                            derived)
+    return derived
+
+
+def _write_catalog_csv(csv_name: str = None,
+                       dataframe: pd.DataFrame = None,
+                       catalog_directory: str = None) -> None:
+    # Write a bundled CSV in catalog_directory (CATALOG_DIRECTORY when None) through a .part file
+    # that is renamed over the CSV, so readers only ever see the previous or the new file (never
+    # a half-written CSV), and drop its cached lookups
+    csv_path = _catalog_csv_path(csv_name, catalog_directory)
+    part_path = f"{csv_path}.part"
+    try:
+        dataframe.to_csv(part_path, index=False)
+        os.replace(part_path, csv_path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+    _clear_catalog_cache(csv_name)
+
+
+def _clear_catalog_cache(csv_name: str = None) -> None:
+    # Drop the cached dataframes (from any catalog directory) and derived structures of csv_name
+    # (or all bundled CSV files when csv_name is None), the next read will reload from disk
+    with _catalog_lock:
+        if csv_name is None:
+            _catalog_cache.clear()
+            _catalog_derived_cache.clear()
+        else:
+            for csv_path in list(_catalog_cache):
+                if os.path.basename(csv_path) == csv_name:
+                    del _catalog_cache[csv_path]
+            for cached_key in list(_catalog_derived_cache):
+                if cached_key[0] == csv_name:
+                    del _catalog_derived_cache[cached_key]
@@ -0,0 +1,220 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      directory_listing.py parses and caches the file names in the directory                     #
+#          listings (indexlist tables) of the PDS imaging node                                    #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _listing_cache_path: backend to return the              #
+#                                              JSON file of a cached directory listing            #
+#                                                                                                 #
+#                                       - _parse_directory_listing: backend to return             #
+#                                              the file names linked in an indexlist              #
+#                                              table                                              #
+#                                                                                                 #
+#                                       - _read_listing_cache: backend to read a cached           #
+#                                              directory listing that is not older than           #
+#                                              the TTL                                            #
+#                                                                                                 #
+#                                       - _write_listing_cache: backend to write the              #
+#                                              file names of a directory listing to the           #
+#                                              listing cache                                      #
+#                                                                                                 #
+#                                       - _read_directory_listing: backend to return              #
+#                                              the cached file names of a directory               #
+#                                              listing, retrieved again when older                #
+#                                              than the TTL                                       #
+#                                                                                                 #
+#                                       - _aread_directory_listing: backend to return             #
+#                                              the file names of a directory listing              #
+#                                              with asyncio                                       #
+#                                                                                                 #
+#                                       - _prefetch_directory_listings: backend to                #
+#                                              cache the BIDR and SBDR listings of all            #
+#                                              CORADR IDs in coradr_jpl_options.csv               #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Parse and cache directory listings from the PDS imaging node
+
+# Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import os
+import re
+import threading
+import time
+from urllib import parse
+
+# Internal Local Imports
+import pydar
+
+########################################################################
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+LISTING_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache",
+                                       "pydar", "listings")
+LISTING_CACHE_TTL = 24 * 60 * 60  # seconds before a cached listing is retrieved again
+LISTING_HREF_PATTERN = re.compile(rb'<a\s[^>]*href="([^"]*)"', re.IGNORECASE)
+
+_listing_locks = {}
+_listing_lock = threading.Lock()
+
+
+def _listing_cache_path(url: str = None) -> str:
+    # Return the JSON file of a cached directory listing, saved by host and path
+    # (for example: planetarydata.jpl.nasa.gov/.../CORADR_0035_V03/DATA/BIDR.json)
+    #   Returns the file path of the cached listing
+    split_url = parse.urlsplit(url)
+    path_parts = [split_url.netloc.replace(":", "_")
+                  ] + [part for part in split_url.path.split("/") if part]
+    return os.path.join(LISTING_CACHE_DIRECTORY, *path_parts) + ".json"
+
+
+def _parse_directory_listing(listing_html: bytes = None) -> list:
+    # Return the file names linked in the indexlist table of a directory listing (directories
+    # end with '/'), without the sort links in the header or the link to the parent directory
+    #   Returns a list of file names or None when the listing does not have an indexlist table
+    table_start = listing_html.find(b'id="indexlist"')
+    if table_start == -1:
+        return None
+    table_end = listing_html.find(b"</table>", table_start)
+    if table_end == -1:
+        table_end = len(listing_html)
+    filenames = []
+    for href in LISTING_HREF_PATTERN.findall(listing_html, table_start,
+                                             table_end):
+        if href.startswith((b"?", b"/")) or b"://" in href:
+            continue
+        filenames.append(parse.unquote(href.decode("UTF-8")))
+    return filenames
+
+
+def _read_listing_cache(cache_path: str = None, ttl: float = None) -> list:
+    # Read a cached directory listing that was retrieved less than ttl seconds ago
+    #   Returns a list of file names or None when the listing is not cached or too old
+    if ttl <= 0 or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r") as listing_file:
+            cached_listing = json.load(listing_file)
+        if time.time() - cached_listing["retrieved"] < ttl:
+            return cached_listing["filenames"]
+    except (OSError, ValueError, KeyError):
+        logger.debug(f"Unable to read {cache_path}")
+    return None
+
+
+def _write_listing_cache(url: str = None,
+                         cache_path: str = None,
+                         filenames: list = None) -> None:
+    # Write the file names of a directory listing to the listing cache as compact JSON, through a
+    # .part file so other readers do not see a partial listing
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(f"{cache_path}.part", "w") as listing_file:
+        json.dump(
+            {
+                "url": url,
+                "retrieved": time.time(),
+                "filenames": filenames
+            },
+            listing_file,
+            separators=(",", ":"))
+    os.replace(f"{cache_path}.part", cache_path)
+
+
+def _read_directory_listing(url: str = None, ttl: float = None) -> list:
+    # Return the file names of a directory listing from the listing cache, where listings
+    # older than ttl seconds (defaults to LISTING_CACHE_TTL, 0 always retrieves the listing) are
+    # retrieved and parsed again
+    #   Returns a list of file names
+    if ttl is None:
+        ttl = LISTING_CACHE_TTL
+
+    cache_path = _listing_cache_path(url)
+    with _listing_lock:
+        url_lock = _listing_locks.setdefault(cache_path, threading.Lock())
+    with url_lock:  # only one thread retrieves the same listing
+        filenames = _read_listing_cache(cache_path, ttl)
+        if filenames is not None:
+            return filenames
+        filenames = _parse_directory_listing(pydar._read_url(url))
+        if filenames is None:
+            raise ValueError(f"Unable to find a directory listing at: {url}")
+        _write_listing_cache(url, cache_path, filenames)
+    return filenames
+
+
+async def _aread_directory_listing(session: "aiohttp.ClientSession" = None,
+                                   url: str = None,
+                                   ttl: float = None) -> list:
+    # Return the file names of a directory listing from the listing cache with asyncio, where
+    # listings older than ttl seconds are retrieved with the client session of the call (see
+    # pydar._ahttp_session) and parsed again
+    #   Returns a list of file names
+    if ttl is None:
+        ttl = LISTING_CACHE_TTL
+
+    cache_path = _listing_cache_path(url)
+    async with pydar._async_lock(
+            cache_path):  # only one task retrieves the same listing
+        filenames = _read_listing_cache(cache_path, ttl)
+        if filenames is not None:
+            return filenames
+        listing_html = await pydar._aread_url(session=session, url=url)
+        filenames = _parse_directory_listing(listing_html)
+        if filenames is None:
+            raise ValueError(f"Unable to find a directory listing at: {url}")
+        _write_listing_cache(url, cache_path, filenames)
+    return filenames
+
+
+def _prefetch_directory_listings(cassini_orbiter_url: str = None,
+                                 max_workers: int = None,
+                                 ttl: float = None) -> int:
+    # Cache the DATA/BIDR and DATA/SBDR directory listings of all CORADR IDs in coradr_jpl_options.csv
+    # concurrently, so later downloads do not need to retrieve the listings
+    #   Returns the number of directory listings cached
+    if cassini_orbiter_url is None:
+        cassini_orbiter_url = pydar.CASSINI_ORBITER_URL
+    if max_workers is None:
+        max_workers = pydar.downloader.DOWNLOAD_WORKERS
+
+    listing_urls = []
+    coradr_dataframe = pydar._read_catalog_csv("coradr_jpl_options.csv")
+    for coradr_id, contains_bidr, contains_sbdr in zip(
+            coradr_dataframe["CORADR ID"], coradr_dataframe["Contains BIDR"],
+            coradr_dataframe["Contains SBDR"]):
+        if contains_bidr:
+            listing_urls.append(
+                f"{cassini_orbiter_url}/{coradr_id}/DATA/BIDR/")
+        if contains_sbdr:
+            listing_urls.append(
+                f"{cassini_orbiter_url}/{coradr_id}/DATA/SBDR/")
+
+    def _prefetch_listing(listing_number, listing_url):
+        logger.info(
+            f"Caching listing [{listing_number}/{len(listing_urls)}]: {listing_url}"
+        )
+        return _read_directory_listing(url=listing_url, ttl=ttl)
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="pydar_listing") as executor:
+        list(
+            executor.map(_prefetch_listing, range(1,
+                                                  len(listing_urls) + 1),
+                         listing_urls))
+    return len(listing_urls)
+
+
+if __name__ == '__main__':
+    _prefetch_directory_listings(
+    )  #  caches the BIDR and SBDR listings of all CORADR IDs
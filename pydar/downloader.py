@@ -0,0 +1,932 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      downloader.py sends all pydar HTTP requests through a shared connection pool               #
+#          and downloads files concurrently with a bounded number of workers                      #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _http_proxy: backend to return the proxy                #
+#                                              for a URL from the http_proxy and                  #
+#                                              https_proxy environment variables                  #
+#                                                                                                 #
+#                                       - _http_pool: backend to return the HTTP                  #
+#                                              connection pool shared by all requests             #
+#                                                                                                 #
+#                                       - _reset_http_pool: backend to close the                  #
+#                                              shared HTTP connection pool                        #
+#                                                                                                 #
+#                                       - _http_request: backend to send a request                #
+#                                              with the shared HTTP connection pool               #
+#                                                                                                 #
+#                                       - _read_url: backend to return the contents               #
+#                                              of a URL                                           #
+#                                                                                                 #
+#                                       - _read_url_head: backend to return the first             #
+#                                              bytes of a URL with a Range request                #
+#                                                                                                 #
+#                                       - _host_semaphore: backend to return a shared             #
+#                                              semaphore to limit the connections open            #
+#                                              to a single host                                   #
+#                                                                                                 #
+#                                       - _report_download_event: backend to send a               #
+#                                              download event to the progress hook and            #
+#                                              the JSON-lines metrics log                         #
+#                                                                                                 #
+#                                       - _report_download_progress: backend to send              #
+#                                              the progress of a download to the                  #
+#                                              progress hook                                      #
+#                                                                                                 #
+#                                       - _download_event: backend to return the bytes,           #
+#                                              latency, duration, throughput, and                 #
+#                                              retries of a download                              #
+#                                                                                                 #
+#                                       - _download_file: backend to download a single            #
+#                                              file from a URL to a file path in chunks,          #
+#                                              resuming interrupted downloads                     #
+#                                                                                                 #
+#                                       - _content_range_start: backend to return the             #
+#                                              first byte of a 206 response                       #
+#                                                                                                 #
+#                                       - _download_cache_key: backend to return the              #
+#                                              cache key of a URL from its ETag or                #
+#                                              Last-Modified header                               #
+#                                                                                                 #
+#                                       - _download_cache_file_lock: backend to                   #
+#                                              lock the download cache for all threads            #
+#                                              and processes                                      #
+#                                                                                                 #
+#                                       - _link_cached_file: backend to link a cached             #
+#                                              file into a results directory                      #
+#                                                                                                 #
+#                                       - _evict_download_cache: backend to remove the            #
+#                                              least recently used files from the                 #
+#                                              download cache                                     #
+#                                                                                                 #
+#                                       - _download_cache_path: backend to return the             #
+#                                              path of a URL in the download cache                #
+#                                                                                                 #
+#                                       - _link_valid_cached_file: backend to link a              #
+#                                              cached file that matches the server into           #
+#                                              a results directory                                #
+#                                                                                                 #
+#                                       - _download_cached_file: backend to download              #
+#                                              a file through the download cache                  #
+#                                                                                                 #
+#                                       - _remove_downloaded_file: backend to remove              #
+#                                              a downloaded file and its copy in the              #
+#                                              download cache                                     #
+#                                                                                                 #
+#                                       - _download_files: backend to download a list             #
+#                                              of files concurrently with a bounded               #
+#                                              thread pool                                        #
+#                                                                                                 #
+#                                       - _file_checksum: backend to return the sha256            #
+#                                              checksum of a file                                 #
+#                                                                                                 #
+#                                       - _read_manifest: backend to read the manifest            #
+#                                              of the files downloaded into a results             #
+#                                              directory                                          #
+#                                                                                                 #
+#                                       - _update_manifest: backend to add entries to             #
+#                                              the manifest of a results directory                #
+#                                                                                                 #
+#                                       - _response_validators: backend to return the ETag        #
+#                                              and Last-Modified headers of a response            #
+#                                                                                                 #
+#                                       - _url_validators: backend to return the ETag,            #
+#                                              Last-Modified and Content-Length of a URL          #
+#                                                                                                 #
+#                                       - _manifest_entry: backend to return the                  #
+#                                              manifest entry of a downloaded file                #
+#                                                                                                 #
+#                                       - _manifest_url_is_current: backend to check              #
+#                                              if a file in the manifest is unchanged             #
+#                                              on the server                                      #
+#                                                                                                 #
+#                                       - _manifest_urls_current: backend to revalidate           #
+#                                              the manifest entries of a list of files            #
+#                                              against the server concurrently                    #
+#                                                                                                 #
+#                                       - _manifest_file_is_current: backend to check if a        #
+#                                              file in a results directory is unchanged           #
+#                                              since it was downloaded                            #
+#                                                                                                 #
+#                                       - _manifest_files_extracted: backend to check if          #
+#                                              all files extracted from a ZIP exist in            #
+#                                              a results directory                                #
+#                                                                                                 #
+#                                       - _missing_download_jobs: backend to return the           #
+#                                              download jobs that are missing,                    #
+#                                              incomplete or changed in a results                 #
+#                                              directory                                          #
+#                                                                                                 #
+#                                       - _download_missing_files: backend to download            #
+#                                              only the files that are missing or                 #
+#                                              incomplete in a results directory                  #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Send HTTP requests and download files from the PDS imaging node
+
+# Standard Library Imports
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from urllib import error, parse, request
+
+# Related Third Party Imports
+import urllib3
+
+try:
+    import fcntl  # lock file shared by processes (not available on Windows)
+except ImportError:
+    fcntl = None
+
+########################################################################
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+DOWNLOAD_WORKERS = 4  # files downloaded at the same time
+DOWNLOAD_CONNECTIONS_PER_HOST = 4  # connections open to a single host at the same time
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes written to the .part file at a time
+HTTP_USER_AGENT = "Mozilla/5.0 (compatible; pydar; +https://github.com/unaschneck/pydar)"
+HTTP_RETRIES = 3  # retries for failed connections and 429/5xx responses
+HTTP_BACKOFF_FACTOR = 0.5  # seconds, doubled after each retry
+HTTP_TIMEOUT = 60  # seconds to connect and between bytes received
+DOWNLOAD_CACHE_ENABLED = True  # reuse files downloaded before (for example, shared by all segments of a CORADR)
+DOWNLOAD_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache",
+                                        "pydar", "downloads")
+DOWNLOAD_CACHE_MAX_BYTES = 10 * 1024**3  # least recently used files are removed above 10 GB
+DOWNLOAD_CACHE_LOCK_FILENAME = ".lock"  # locked while cached files are linked or removed
+MANIFEST_FILENAME = "pydar_manifest.json"  # files downloaded into a results directory
+DOWNLOAD_PROGRESS_HOOK = None  # function called with a dictionary for each download event
+DOWNLOAD_METRICS_LOG = None  # JSON-lines file that each download, cache hit, and extract is appended to
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+_http_pool_managers = {
+}  # {proxy URL (None for a direct connection): PoolManager}
+_http_pool_lock = threading.Lock()
+_download_cache_locks = {}
+_download_cache_lock = threading.Lock()
+_manifest_lock = threading.Lock()
+_metrics_log_lock = threading.Lock()
+
+
+def _http_proxy(url: str = None) -> str:
+    # Return the proxy to send a request for a URL through, from the http_proxy/https_proxy
+    # environment variables (hosts in no_proxy are not sent through the proxy)
+    #   Returns the proxy URL or None for a direct connection
+    split_url = parse.urlsplit(url)
+    proxy_url = request.getproxies().get(split_url.scheme)
+    if proxy_url is None or request.proxy_bypass(split_url.netloc):
+        return None
+    return proxy_url
+
+
+def _http_pool(url: str = None) -> urllib3.PoolManager:
+    # Return the HTTP connection pool shared by all pydar requests to a URL (created on first
+    # use), which keeps connections alive between requests to the same host and retries failed
+    # requests, and sends requests through the proxy of the URL (see _http_proxy) when one is set
+    #   Returns a urllib3.PoolManager (urllib3.ProxyManager for a proxy)
+    proxy_url = _http_proxy(url) if url is not None else None
+    with _http_pool_lock:
+        if proxy_url not in _http_pool_managers:
+            pool_class, pool_args = urllib3.PoolManager, []
+            if proxy_url is not None:
+                pool_class, pool_args = urllib3.ProxyManager, [proxy_url]
+            _http_pool_managers[proxy_url] = pool_class(
+                *pool_args,
+                num_pools=10,
+                maxsize=DOWNLOAD_CONNECTIONS_PER_HOST,
+                headers={"User-Agent": HTTP_USER_AGENT},
+                timeout=urllib3.Timeout(connect=HTTP_TIMEOUT,
+                                        read=HTTP_TIMEOUT),
+                retries=urllib3.Retry(
+                    total=HTTP_RETRIES,
+                    backoff_factor=HTTP_BACKOFF_FACTOR,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET", "HEAD"],
+                    raise_on_status=False))
+        return _http_pool_managers[proxy_url]
+
+
+def _reset_http_pool() -> None:
+    # Close the shared HTTP connection pools, the next request creates a new pool with the
+    # current HTTP_USER_AGENT, HTTP_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_TIMEOUT and proxy settings
+    with _http_pool_lock:
+        for pool_manager in _http_pool_managers.values():
+            pool_manager.clear()
+        _http_pool_managers.clear()
+
+
+def _http_request(url: str = None,
+                  headers: dict = None,
+                  method: str = "GET",
+                  preload_content: bool = True,
+                  allowed_status: list = []) -> urllib3.BaseHTTPResponse:
+    # Send a request with the shared HTTP connection pool, where an error status (400 or
+    # above) not in allowed_status raises an HTTPError
+    #   Returns a urllib3 response
+    try:
+        # headers replace the default headers of the pool, so the User-Agent is always sent
+        response = _http_pool(url).request(method,
+                                           url,
+                                           headers={
+                                               "User-Agent": HTTP_USER_AGENT,
+                                               **(headers or {})
+                                           },
+                                           preload_content=preload_content)
+    except urllib3.exceptions.HTTPError as err:
+        raise error.URLError(f"Unable to access: {url}\nError: '{err}'")
+    if response.status >= 400 and response.status not in allowed_status:
+        response.release_conn()
+        raise error.HTTPError(
+            url, response.status,
+            f"Unable to access: {url}\nError (and exiting): '{response.status}'",
+            response.headers, None)
+    return response
+
+
+def _read_url(url: str = None) -> bytes:
+    # Retrieve the full contents of a URL, such as the HTML of a directory listing
+    #   Returns the response body as bytes
+    return _http_request(url=url).data
+
+
+def _read_url_head(url: str = None, max_bytes: int = None) -> tuple:
+    # Retrieve the first max_bytes of a URL with a Range request, such as the header of a .LBL
+    # file, where a server that ignores the Range header returns the full contents
+    #   Returns the bytes retrieved and True when the bytes are the full contents of the URL
+    response = _http_request(url=url,
+                             headers={"Range": f"bytes=0-{max_bytes - 1}"},
+                             allowed_status=[416])
+    if response.status == 416:  # Range Not Satisfiable, the URL is empty
+        return b"", True
+    if response.status != 206:
+        return response.data, True
+    content_size = response.headers.get("Content-Range", "").split("/")[-1]
+    return response.data, content_size.isdigit() and len(
+        response.data) >= int(content_size)
+
+
+def _host_semaphore(
+        url: str = None,
+        max_connections_per_host: int = None) -> threading.BoundedSemaphore:
+    # Return a semaphore shared by all downloads to the host of a URL
+    #   Returns a BoundedSemaphore that allows max_connections_per_host connections at once
+    host_key = (parse.urlsplit(url).netloc, max_connections_per_host)
+    with _host_semaphores_lock:
+        if host_key not in _host_semaphores:
+            _host_semaphores[host_key] = threading.BoundedSemaphore(
+                max_connections_per_host)
+        return _host_semaphores[host_key]
+
+
+def _report_download_event(download_event: dict = None) -> None:
+    # Send a download event to DOWNLOAD_PROGRESS_HOOK and append it to the DOWNLOAD_METRICS_LOG
+    # JSON-lines file, where "progress" events (sent for each chunk) are only sent to the hook
+    download_event["time"] = time.time()
+    if DOWNLOAD_PROGRESS_HOOK is not None:
+        DOWNLOAD_PROGRESS_HOOK(download_event)
+    if DOWNLOAD_METRICS_LOG is not None and download_event[
+            "event"] != "progress":
+        with _metrics_log_lock:
+            with open(DOWNLOAD_METRICS_LOG, "a") as metrics_log:
+                metrics_log.write(json.dumps(download_event) + "\n")
+
+
+def _report_download_progress(url: str = None,
+                              file_path: str = None,
+                              bytes_downloaded: int = None,
+                              total_bytes: int = None) -> None:
+    # Send a "progress" event to DOWNLOAD_PROGRESS_HOOK after each chunk of a download, where
+    # total_bytes is None when the server does not send a Content-Length
+    if DOWNLOAD_PROGRESS_HOOK is not None:
+        _report_download_event({
+            "event": "progress",
+            "url": url,
+            "file_path": file_path,
+            "bytes_downloaded": bytes_downloaded,
+            "total_bytes": total_bytes
+        })
+
+
+def _download_event(url: str = None,
+                    file_path: str = None,
+                    status: str = None,
+                    resume_from: int = None,
+                    bytes_transferred: int = None,
+                    request_start: float = None,
+                    response_start: float = None,
+                    retries: int = None) -> dict:
+    # Build the "download" event of a file, where latency_seconds is the time until the response
+    # headers arrive (server and network latency) and throughput is measured after the headers
+    #   Returns a dictionary of the download metrics
+    download_end = time.perf_counter()
+    transfer_seconds = download_end - response_start
+    throughput = None
+    if transfer_seconds > 0:
+        throughput = bytes_transferred / transfer_seconds
+    return {
+        "event": "download",
+        "url": url,
+        "file_path": file_path,
+        "status": status,
+        "resumed_from": resume_from,
+        "bytes_transferred": bytes_transferred,
+        "latency_seconds": response_start - request_start,
+        "duration_seconds": download_end - request_start,
+        "throughput_bytes_per_second": throughput,
+        "retries": retries
+    }
+
+
+def _download_file(url: str = None,
+                   file_path: str = None,
+                   max_connections_per_host: int = None,
+                   response_validators: dict = None) -> str:
+    # Download a single file from a URL to file_path in chunks through a file_path.part file,
+    # where an existing .part file (from an interrupted download) is resumed with a Range
+    # request and the .part file is only renamed to file_path once its size matches the
+    # Content-Length (or, without a Content-Length, once the server has ended the response).
+    # response_validators (when given) is updated with the ETag and Last-Modified of the response
+    #   Returns the file path of the downloaded file
+    if max_connections_per_host is None:
+        max_connections_per_host = DOWNLOAD_CONNECTIONS_PER_HOST
+
+    part_path = f"{file_path}.part"
+    with _host_semaphore(url, max_connections_per_host):
+        # restart from the beginning once if the .part file does not match the server
+        for _ in range(2):
+            resume_from = os.path.getsize(part_path) if os.path.exists(
+                part_path) else 0
+            headers = {
+                "Range": f"bytes={resume_from}-"
+            } if resume_from > 0 else {}
+            request_start = time.perf_counter()
+            response = _http_request(url=url,
+                                     headers=headers,
+                                     preload_content=False,
+                                     allowed_status=[416])
+            response_start = time.perf_counter()
+            if response.status == 416:  # Range Not Satisfiable
+                response.release_conn()
+                os.remove(part_path)
+                continue
+            if response.status == 206 and _content_range_start(
+                    response.headers) != resume_from:
+                # range does not continue the .part file
+                response.release_conn()
+                os.remove(part_path)
+                continue
+
+            retries = len(response.retries.history
+                          ) if response.retries is not None else 0
+            bytes_transferred = 0
+            stream_ended = False
+            try:
+                if resume_from > 0 and response.status != 206:
+                    resume_from = 0  # server sent the full file instead of the requested range
+                content_length = response.headers.get("Content-Length")
+                expected_size = resume_from + int(
+                    content_length) if content_length is not None else None
+                with open(part_path,
+                          "ab" if resume_from > 0 else "wb") as part_file:
+                    try:
+                        while True:
+                            # read1() returns the bytes already received, so a broken connection
+                            # only loses the bytes that have not arrived yet
+                            chunk = response.read1(DOWNLOAD_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            part_file.write(chunk)
+                            bytes_transferred += len(chunk)
+                            _report_download_progress(
+                                url, file_path,
+                                resume_from + bytes_transferred, expected_size)
+                        stream_ended = True
+                    except (urllib3.exceptions.ProtocolError,
+                            urllib3.exceptions.ReadTimeoutError):
+                        pass  # connection closed early, checked against the expected size below
+            finally:
+                response.release_conn()
+
+            downloaded_size = os.path.getsize(part_path)
+            if expected_size is None:
+                # without a Content-Length, only a response that ended normally is complete
+                download_complete = stream_ended
+            else:
+                download_complete = downloaded_size == expected_size
+            if download_complete or expected_size is None or downloaded_size < expected_size:
+                _report_download_event(
+                    _download_event(
+                        url, file_path,
+                        "complete" if download_complete else "incomplete",
+                        resume_from, bytes_transferred, request_start,
+                        response_start, retries))
+            if download_complete:
+                os.replace(part_path, file_path)
+                if response_validators is not None:
+                    response_validators.update(
+                        _response_validators(response.headers))
+                return file_path
+            if expected_size is None:
+                raise error.ContentTooShortError(
+                    f"Incomplete download: {url}\nConnection closed after {downloaded_size} bytes, download again to resume from '{part_path}'",
+                    None)
+            if downloaded_size > expected_size:
+                os.remove(part_path)
+                continue
+            raise error.ContentTooShortError(
+                f"Incomplete download: {url}\nRetrieved {downloaded_size} of {expected_size} bytes, download again to resume from '{part_path}'",
+                None)
+
+    raise error.ContentTooShortError(
+        f"Unable to resume download: {url}\n'{part_path}' does not match the file on the server",
+        None)
+
+
+def _content_range_start(headers: dict = None) -> int:
+    # Return the first byte of a 206 response from its Content-Range header ("bytes 100-199/200")
+    #   Returns the position of the first byte or None when the header is missing or invalid
+    content_range = headers.get("Content-Range", "")
+    range_start = content_range.removeprefix("bytes ").split("-")[0]
+    return int(range_start) if range_start.strip().isdigit() else None
+
+
+def _download_cache_key(url: str = None, headers: dict = None) -> str:
+    # Return the cache key of a URL from its ETag (or Last-Modified) and Content-Length headers,
+    # so a file changed on the server is downloaded again
+    #   Returns a sha256 hex digest or None when the server does not send a validator
+    validator = headers.get("ETag") or headers.get("Last-Modified")
+    if validator is None:
+        return None
+    return hashlib.sha256(
+        f"{url}\n{validator}\n{headers.get('Content-Length')}".encode(
+            "UTF-8")).hexdigest()
+
+
+@contextlib.contextmanager
+def _download_cache_file_lock():
+    # Hold the lock file of the download cache while cached files are linked or removed, shared
+    # by the threads of this process and (where fcntl is available) all other processes using
+    # DOWNLOAD_CACHE_DIRECTORY, so a file is never removed while it is being linked
+    os.makedirs(DOWNLOAD_CACHE_DIRECTORY, exist_ok=True)
+    with _download_cache_lock, open(
+            os.path.join(DOWNLOAD_CACHE_DIRECTORY,
+                         DOWNLOAD_CACHE_LOCK_FILENAME), "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # released on close
+        yield
+
+
+def _link_cached_file(cache_path: str = None, file_path: str = None) -> str:
+    # Link a cached file into a results directory as a hardlink (or a copy when hardlinks are
+    # not supported, so the results directory never depends on a file the cache may remove)
+    #   Returns the file path of the linked file
+    if os.path.lexists(file_path):
+        os.remove(file_path)
+    try:
+        os.link(cache_path, file_path)
+    except OSError:
+        shutil.copy2(cache_path, file_path)
+    return file_path
+
+
+def _evict_download_cache(max_bytes: int = None) -> None:
+    # Remove the least recently used files from the download cache until the cache is at most
+    # max_bytes, where files still hardlinked into a results directory count towards max_bytes
+    # but are never removed (removed once no results directory links to them)
+    with _download_cache_file_lock():
+        cache_files = []
+        for cache_root, _, cache_filenames in os.walk(
+                DOWNLOAD_CACHE_DIRECTORY):
+            for cache_filename in cache_filenames:
+                if cache_filename.endswith(".part"):
+                    continue  # download in progress
+                if cache_filename == DOWNLOAD_CACHE_LOCK_FILENAME:
+                    continue
+                cache_path = os.path.join(cache_root, cache_filename)
+                try:
+                    cache_stat = os.stat(cache_path)
+                except FileNotFoundError:
+                    continue
+                cache_files.append((cache_stat.st_mtime_ns, cache_stat.st_size,
+                                    cache_path, cache_stat.st_nlink))
+
+        cache_size = sum(file_size for _, file_size, _, _ in cache_files)
+        for _, file_size, cache_path, link_count in sorted(cache_files):
+            if link_count > 1:
+                continue  # linked into a results directory
+            if cache_size <= max_bytes:
+                break
+            try:
+                os.remove(cache_path)
+            except FileNotFoundError:
+                pass
+            cache_size -= file_size
+
+
+def _download_cache_path(url: str = None, headers: dict = None) -> str:
+    # Return the path of a URL in the download cache from the headers of a HEAD response
+    #   Returns a file path or None when the server does not send a validator
+    cache_key = _download_cache_key(url, headers)
+    if cache_key is None:
+        return None
+    return os.path.join(DOWNLOAD_CACHE_DIRECTORY, cache_key[:2], cache_key)
+
+
+def _link_valid_cached_file(cache_path: str = None,
+                            file_path: str = None,
+                            headers: dict = None) -> bool:
+    # Link a cached file into file_path when its size matches the Content-Length of the HEAD
+    # response, where a cached file that does not match is removed
+    #   Returns True when the cached file was linked
+    with _download_cache_file_lock():
+        if not os.path.exists(cache_path):
+            return False
+        if headers.get("Content-Length") not in [
+                None, str(os.path.getsize(cache_path))
+        ]:
+            # cached file changed through a hardlink in a results directory
+            os.remove(cache_path)
+            return False
+        logger.debug(f"Using cached download: {cache_path}")
+        os.utime(cache_path)  # mark as recently used
+        _link_cached_file(cache_path, file_path)
+    return True
+
+
+def _download_cached_file(url: str = None,
+                          file_path: str = None,
+                          max_connections_per_host: int = None,
+                          response_validators: dict = None) -> str:
+    # Download a file into the download cache (keyed by URL and ETag/Last-Modified) and link
+    # it into file_path, where a file already in the cache is not downloaded again.
+    # response_validators (when given) is updated with the ETag and Last-Modified of the file
+    #   Returns the file path of the downloaded file
+    if not DOWNLOAD_CACHE_ENABLED:
+        return _download_file(
+            url=url,
+            file_path=file_path,
+            max_connections_per_host=max_connections_per_host,
+            response_validators=response_validators)
+
+    with _host_semaphore(
+            url, max_connections_per_host or DOWNLOAD_CONNECTIONS_PER_HOST):
+        response = _http_request(url=url, method="HEAD")
+    cache_path = _download_cache_path(url, response.headers)
+    if cache_path is None:
+        return _download_file(
+            url=url,
+            file_path=file_path,
+            max_connections_per_host=max_connections_per_host,
+            response_validators=response_validators)
+
+    with _download_cache_lock:
+        cache_path_lock = _download_cache_locks.setdefault(
+            cache_path, threading.Lock())
+    with cache_path_lock:  # only one worker downloads the same file into the cache
+        if _link_valid_cached_file(cache_path, file_path, response.headers):
+            _report_download_event({
+                "event": "cache_hit",
+                "url": url,
+                "file_path": file_path,
+                "size": os.path.getsize(file_path)
+            })
+            if response_validators is not None:
+                response_validators.update(
+                    _response_validators(response.headers))
+            return file_path
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        _download_file(url=url,
+                       file_path=cache_path,
+                       max_connections_per_host=max_connections_per_host,
+                       response_validators=response_validators)
+        with _download_cache_file_lock():
+            _link_cached_file(cache_path, file_path)
+
+    _evict_download_cache(max_bytes=DOWNLOAD_CACHE_MAX_BYTES)
+    return file_path
+
+
+def _remove_downloaded_file(file_path: str = None,
+                            file_changed: bool = False) -> None:
+    # Remove a downloaded file from a results directory together with the file in the download
+    # cache that it is hardlinked to (unless another results directory still links to it), so a
+    # removed file does not keep using disk space in the download cache. A file changed locally
+    # (file_changed=True) always removes the cached file, as it was changed through the hardlink
+    if os.stat(file_path).st_nlink == 1:  # not linked from the download cache
+        os.remove(file_path)
+        return
+
+    with _download_cache_file_lock():
+        file_stat = os.stat(file_path)
+        os.remove(file_path)
+        if not file_changed and file_stat.st_nlink != 2:  # still linked into another results directory
+            return
+        for cache_root, _, cache_filenames in os.walk(
+                DOWNLOAD_CACHE_DIRECTORY):
+            for cache_filename in cache_filenames:
+                cache_path = os.path.join(cache_root, cache_filename)
+                try:
+                    cache_stat = os.stat(cache_path)
+                except FileNotFoundError:
+                    continue
+                if os.path.samestat(cache_stat, file_stat):
+                    logger.debug(f"Removing cached download: {cache_path}")
+                    os.remove(cache_path)
+                    return
+
+
+def _download_files(download_jobs: list = None,
+                    max_workers: int = None,
+                    max_connections_per_host: int = None,
+                    download_validators: dict = None) -> list:
+    # Download a list of (url, file_path) jobs concurrently, where the first failed download
+    # cancels all downloads that have not started and raises its error. download_validators
+    # (when given) is updated with {file_path: {"etag", "last_modified"}} of each downloaded file
+    #   Returns a list of the downloaded file paths in the order of download_jobs (without repeats)
+    if max_workers is None:
+        max_workers = DOWNLOAD_WORKERS
+
+    # Only download each file path once (to avoid two workers writing the same file)
+    unique_jobs = []
+    file_paths_found = set()
+    for url, file_path in download_jobs:
+        if file_path not in file_paths_found:
+            file_paths_found.add(file_path)
+            unique_jobs.append((url, file_path))
+
+    def _download_job(job_number, url, file_path):
+        logger.info(f"Retrieving [{job_number}/{len(unique_jobs)}]: {url}")
+        response_validators = {}
+        _download_cached_file(
+            url=url,
+            file_path=file_path,
+            max_connections_per_host=max_connections_per_host,
+            response_validators=response_validators)
+        if download_validators is not None:
+            download_validators[file_path] = response_validators
+        return file_path
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="pydar_download") as executor:
+        download_futures = [
+            executor.submit(_download_job, i + 1, url, file_path)
+            for i, (url, file_path) in enumerate(unique_jobs)
+        ]
+        _, not_done = wait(download_futures, return_when=FIRST_EXCEPTION)
+        for download_future in not_done:
+            download_future.cancel()
+
+    for download_future in download_futures:
+        if not download_future.cancelled() and download_future.exception(
+        ) is not None:
+            raise download_future.exception()
+    return [download_future.result() for download_future in download_futures]
+
+
+def _file_checksum(file_path: str = None) -> str:
+    # Return the sha256 checksum of a file, read in chunks
+    #   Returns a sha256 hex digest
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as checksum_file:
+        for file_chunk in iter(lambda: checksum_file.read(DOWNLOAD_CHUNK_SIZE),
+                               b""):
+            file_hash.update(file_chunk)
+    return file_hash.hexdigest()
+
+
+def _read_manifest(results_directory: str = None) -> dict:
+    # Read the manifest of the files downloaded into a results directory
+    #   Returns a dictionary of {filename: {"url", "size", "sha256", "etag", "last_modified",
+    #           ("extracted")}}
+    manifest_path = os.path.join(results_directory, MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, "r") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        logger.warning(
+            f"Unable to read {manifest_path}, downloading all files again")
+        return {}
+
+
+def _update_manifest(results_directory: str = None,
+                     manifest_entries: dict = None) -> dict:
+    # Add or replace entries in the manifest of a results directory, where the manifest
+    # is written to a .part file first so an interrupted write keeps the previous manifest
+    #   Returns the updated manifest
+    manifest_path = os.path.join(results_directory, MANIFEST_FILENAME)
+    with _manifest_lock:
+        manifest = _read_manifest(results_directory)
+        manifest.update(manifest_entries)
+        with open(f"{manifest_path}.part", "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+        os.replace(f"{manifest_path}.part", manifest_path)
+    return manifest
+
+
+def _response_validators(headers: dict = None) -> dict:
+    # Return the ETag and Last-Modified headers of a response, to revalidate the file it was
+    # downloaded from against the server later
+    #   Returns {"etag", "last_modified"} with None for the headers the server does not send
+    return {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified")
+    }
+
+
+def _url_validators(url: str = None) -> dict:
+    # Retrieve the ETag, Last-Modified and Content-Length headers of a URL with a HEAD request
+    #   Returns {"etag", "last_modified", "size"} with None for the headers the server does not send
+    with _host_semaphore(url, DOWNLOAD_CONNECTIONS_PER_HOST):
+        response = _http_request(url=url, method="HEAD")
+    content_length = response.headers.get("Content-Length")
+    return {
+        **_response_validators(response.headers), "size":
+        int(content_length) if content_length is not None else None
+    }
+
+
+def _manifest_entry(url: str = None,
+                    file_path: str = None,
+                    validators: dict = None) -> dict:
+    # Return the manifest entry of a file downloaded into a results directory, with the ETag and
+    # Last-Modified headers of the response it was downloaded from (validators) to revalidate the
+    # file against the server. Without validators, the headers are retrieved with a HEAD request
+    # and not recorded when the Content-Length no longer matches the downloaded file (changed on
+    # the server after the download), so the file is downloaded again next time
+    #   Returns a dictionary of {"url", "size", "mtime_ns", "sha256", "etag", "last_modified"}
+    file_stat = os.stat(file_path)
+    if validators is None:
+        validators = _url_validators(url)
+        if validators["size"] not in [None, file_stat.st_size]:
+            validators = {"etag": None, "last_modified": None}
+    return {
+        "url": url,
+        "size": file_stat.st_size,
+        "mtime_ns": file_stat.st_mtime_ns,
+        "sha256": _file_checksum(file_path),
+        "etag": validators["etag"],
+        "last_modified": validators["last_modified"]
+    }
+
+
+def _manifest_url_is_current(manifest_entry: dict = None,
+                             url: str = None) -> bool:
+    # Revalidate a manifest entry against the server with a HEAD request, where the ETag and
+    # Last-Modified recorded when the file was downloaded must be unchanged (or the Content-Length
+    # must match the recorded size when the server sent neither header)
+    #   Returns True when the file has not changed on the server
+    validators = _url_validators(url)
+    if manifest_entry.get("etag") is None and manifest_entry.get(
+            "last_modified") is None:
+        return validators["etag"] is None and validators[
+            "last_modified"] is None and validators["size"] in [
+                None, manifest_entry["size"]
+            ]
+    return (validators["etag"] == manifest_entry.get("etag") and
+            validators["last_modified"] == manifest_entry.get("last_modified"))
+
+
+def _manifest_urls_current(manifest: dict = None,
+                           download_jobs: list = None,
+                           max_workers: int = None) -> set:
+    # Revalidate the manifest entries of (url, file_path) jobs against the server concurrently,
+    # with one HEAD request per file on a thread pool of up to max_workers (defaults to
+    # DOWNLOAD_WORKERS) threads
+    #   Returns a set of the file paths unchanged on the server
+    if len(download_jobs) == 0:
+        return set()
+    if max_workers is None:
+        max_workers = DOWNLOAD_WORKERS
+
+    def _url_is_current(download_job):
+        url, file_path = download_job
+        if _manifest_url_is_current(manifest[os.path.basename(file_path)],
+                                    url):
+            return True
+        logger.info(f"Changed on the server: {url}")
+        return False
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(download_jobs)),
+                            thread_name_prefix="pydar_revalidate") as executor:
+        urls_current = list(executor.map(_url_is_current, download_jobs))
+    return {
+        file_path
+        for (_, file_path), url_is_current in zip(download_jobs, urls_current)
+        if url_is_current
+    }
+
+
+def _manifest_file_is_current(manifest: dict = None,
+                              url: str = None,
+                              file_path: str = None) -> bool:
+    # Check if a file was downloaded from the same URL and is unchanged in the results directory,
+    # where the sha256 checksum is only compared when the size matches the manifest but the
+    # modification time does not and a file that does not match is removed (the server is
+    # revalidated by _manifest_urls_current)
+    #   Returns True when the file does not need to be downloaded again (if unchanged on the server)
+    manifest_entry = manifest.get(os.path.basename(file_path))
+    if manifest_entry is None or manifest_entry["url"] != url:
+        return False
+    if not os.path.isfile(file_path):
+        return False
+    file_stat = os.stat(file_path)
+    if file_stat.st_size != manifest_entry["size"]:
+        return False
+    if file_stat.st_mtime_ns == manifest_entry.get("mtime_ns"):
+        return True
+    if _file_checksum(file_path) != manifest_entry["sha256"]:
+        logger.info(f"Checksum does not match the manifest: {file_path}")
+        # also removes the cached file it is hardlinked to, so the change is not linked again
+        _remove_downloaded_file(file_path, file_changed=True)
+        return False
+    return True
+
+
+def _manifest_files_extracted(manifest: dict = None,
+                              url: str = None,
+                              file_path: str = None) -> bool:
+    # Check if all files extracted from a ZIP downloaded from the same URL exist in the results
+    # directory (the server is revalidated by _manifest_urls_current)
+    #   Returns True when the ZIP does not need to be downloaded or extracted again (if unchanged
+    #           on the server)
+    manifest_entry = manifest.get(os.path.basename(file_path))
+    if manifest_entry is None or manifest_entry["url"] != url:
+        return False
+    if "extracted" not in manifest_entry:
+        return False
+    for extracted_name, extracted_size in manifest_entry["extracted"].items():
+        extracted_path = os.path.join(os.path.dirname(file_path),
+                                      extracted_name)
+        if not os.path.isfile(extracted_path) or os.path.getsize(
+                extracted_path) != extracted_size:
+            return False
+    return True
+
+
+def _missing_download_jobs(results_directory: str = None,
+                           download_jobs: list = None,
+                           max_workers: int = None) -> list:
+    # Compare (url, file_path) download jobs against the manifest of a results directory, where
+    # the files unchanged locally are revalidated against the server concurrently
+    #   Returns a list of the download jobs missing, incomplete or changed (on the server or locally)
+    manifest = _read_manifest(results_directory)
+    local_jobs = [(url, file_path) for url, file_path in download_jobs
+                  if _manifest_file_is_current(manifest, url, file_path)]
+    current_files = _manifest_urls_current(manifest, local_jobs, max_workers)
+    missing_jobs = []
+    for url, file_path in download_jobs:
+        if file_path in current_files:
+            logger.info(f"Already downloaded: {file_path}")
+        else:
+            missing_jobs.append((url, file_path))
+    return missing_jobs
+
+
+def _download_missing_files(download_jobs: list = None,
+                            results_directory: str = None,
+                            max_workers: int = None,
+                            max_connections_per_host: int = None,
+                            check_manifest: bool = True) -> list:
+    # Download the (url, file_path) jobs that are missing, incomplete or changed (on the server or
+    # locally) in a results directory and record the downloaded files in the manifest of the
+    # results directory, where check_manifest=False downloads all jobs (already compared against
+    # the manifest by the caller)
+    #   Returns a list of the file paths downloaded
+    missing_jobs = download_jobs
+    if check_manifest:
+        missing_jobs = _missing_download_jobs(results_directory, download_jobs,
+                                              max_workers)
+    if len(missing_jobs) == 0:
+        return []
+
+    download_validators = {}
+    downloaded_files = _download_files(
+        download_jobs=missing_jobs,
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host,
+        download_validators=download_validators)
+    manifest_entries = {}
+    for url, file_path in missing_jobs:
+        manifest_entries[os.path.basename(file_path)] = _manifest_entry(
+            url, file_path, download_validators[file_path])
+    _update_manifest(results_directory, manifest_entries)
+    return downloaded_files
@@ -8,6 +8,7 @@ import logging
 import os
 
 # Related Third Party Imports
+import numpy as np
 import pandas as pd
 
 # Internal Local Imports
@@ -19,14 +20,17 @@ def _error_handling_extract_flyby_images(flyby_observation_num=None,
                                          segment_num=None,
                                          additional_data_types_to_download=[],
                                          resolution=None,
-                                         top_x_resolutions=None):
+                                         top_x_resolutions=None,
+                                         max_workers=None,
+                                         max_connections_per_host=None):
     # Error Handling for extract_flyby_parameters variables: extract_flyby_images()
     available_flyby_id, available_observation_numbers = pydar._retrieve_flyby_data(
     )
+    flyby_lookup = pydar._retrieve_flyby_lookup()
 
     if flyby_observation_num is None and flyby_id is None:
         raise ValueError(
-            f"Requires either a flyby_observation_num OR flyby_id.\nAvailable flyby_observation_num: {available_flyby_id}\nAvailable flyby_id: {available_observation_numbers}"
+            f"Requires either a flyby_observation_num OR flyby_id.\nAvailable flyby_observation_num: {list(available_flyby_id)}\nAvailable flyby_id: {list(available_observation_numbers)}"
         )
 
     if flyby_observation_num is not None and flyby_id is not None:
@@ -38,9 +42,9 @@ def _error_handling_extract_flyby_images(flyby_observation_num=None,
             raise ValueError(
                 f"[flyby_id]: Must be a str, current type = '{type(flyby_id)}'"
             )
-        if flyby_id not in available_flyby_id:
+        if flyby_id not in flyby_lookup["id_to_observation"]:
             raise ValueError(
-                f"[flyby_id]: '{flyby_id}' not in available ids options '{available_flyby_id}'"
+                f"[flyby_id]: '{flyby_id}' not in available ids options '{list(available_flyby_id)}'"
             )
 
     if flyby_observation_num is not None:
@@ -48,9 +52,9 @@ def _error_handling_extract_flyby_images(flyby_observation_num=None,
             raise ValueError(
                 f"[flyby_observation_num]: Must be a str, current type = '{type(flyby_observation_num)}'"
             )
-        if flyby_observation_num not in available_observation_numbers:
+        if flyby_observation_num not in flyby_lookup["observation_to_id"]:
             raise ValueError(
-                f"[flyby_observation_num]: '{flyby_observation_num}' not in available observation options '{available_observation_numbers}'"
+                f"[flyby_observation_num]: '{flyby_observation_num}' not in available observation options '{list(available_observation_numbers)}'"
             )
 
     if segment_num is None:
@@ -61,9 +65,10 @@ def _error_handling_extract_flyby_images(flyby_observation_num=None,
         raise ValueError(
             f"[segment_num]: Must be a str, current type = '{type(segment_num)}'"
         )
-    if segment_num not in pydar._return_segment_options():
+    segment_options = pydar._return_segment_options()
+    if segment_num not in segment_options:
         raise ValueError(
-            f"[segment_num]: '{segment_num}' not an available segment options: '{pydar._return_segment_options()}'"
+            f"[segment_num]: '{segment_num}' not an available segment options: '{list(segment_options)}'"
         )
 
     if len(additional_data_types_to_download) != 0:
@@ -123,6 +128,89 @@ def _error_handling_extract_flyby_images(flyby_observation_num=None,
                 f"[top_x_resolutions]: Must be a value from 1 to 5, not '{top_x_resolutions}'"
             )
 
+    if max_workers is not None:
+        if type(max_workers) != int:
+            raise ValueError(
+                f"[max_workers]: Must be a int, current type = '{type(max_workers)}'"
+            )
+        if max_workers < 1:
+            raise ValueError(
+                f"[max_workers]: Must be greater than or equal to 1, not '{max_workers}'"
+            )
+
+    if max_connections_per_host is not None:
+        if type(max_connections_per_host) != int:
+            raise ValueError(
+                f"[max_connections_per_host]: Must be a int, current type = '{type(max_connections_per_host)}'"
+            )
+        if max_connections_per_host < 1:
+            raise ValueError(
+                f"[max_connections_per_host]: Must be greater than or equal to 1, not '{max_connections_per_host}'"
+            )
+
+
+def _error_handling_extract_many(requests=None,
+                                 max_workers=None,
+                                 max_connections_per_host=None):
+    # Error Handling for extracting many flybys: extract_many()
+    request_columns = ["flyby", "segment"]
+
+    if requests is None:
+        raise ValueError("[requests]: requests is required")
+    if isinstance(requests, pd.DataFrame):
+        if not all(column in requests.columns for column in request_columns):
+            raise ValueError(
+                f"[requests]: Requires the columns {request_columns} (and optional 'resolution'), current columns = {list(requests.columns)}"
+            )
+    elif isinstance(requests, list):
+        for i, request in enumerate(requests):
+            if type(request) not in [tuple, list
+                                     ] or len(request) not in [2, 3]:
+                raise ValueError(
+                    f"[requests]: Each request must be a tuple of (flyby, segment) or (flyby, segment, resolution), invalid at request index {i}"
+                )
+    else:
+        raise ValueError(
+            f"[requests]: Must be a list or pd.DataFrame, current type = '{type(requests)}'"
+        )
+    if len(requests) == 0:
+        raise ValueError("[requests]: Requires at least one request")
+
+    for i, (flyby, segment_num,
+            resolution) in enumerate(pydar._extract_request_rows(requests)):
+        if type(flyby) != str:
+            raise ValueError(
+                f"[requests]: flyby must be a str, current type = '{type(flyby)}' at request index {i}"
+            )
+        try:
+            pydar._error_handling_extract_flyby_images(
+                **pydar._extract_request_arguments(flyby, segment_num,
+                                                   resolution))
+        except ValueError as request_error:
+            raise ValueError(
+                f"[requests]: Invalid request at request index {i}\n{request_error}"
+            ) from request_error
+
+    if max_workers is not None:
+        if type(max_workers) != int:
+            raise ValueError(
+                f"[max_workers]: Must be a int, current type = '{type(max_workers)}'"
+            )
+        if max_workers < 1:
+            raise ValueError(
+                f"[max_workers]: Must be greater than or equal to 1, not '{max_workers}'"
+            )
+
+    if max_connections_per_host is not None:
+        if type(max_connections_per_host) != int:
+            raise ValueError(
+                f"[max_connections_per_host]: Must be a int, current type = '{type(max_connections_per_host)}'"
+            )
+        if max_connections_per_host < 1:
+            raise ValueError(
+                f"[max_connections_per_host]: Must be greater than or equal to 1, not '{max_connections_per_host}'"
+            )
+
 
 def _error_handling_convert_id_to_observation_num(flyby_id=None):
     # Error Handling for Converting a Flyby ID into an Observation Number: id_to_observation()
@@ -133,20 +221,10 @@ def _error_handling_convert_id_to_observation_num(flyby_id=None):
         raise ValueError(
             f"[flyby_id]: Must be a str, current type = '{type(flyby_id)}'")
 
-    flyby_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data',
-        'cassini_flyby.csv')  # get file's directory, up one level, /data/*.csv
-    flyby_dataframe = pd.read_csv(flyby_csv_file)
-    valid_flyby_ids = []
-    flyby_id_found = False
-    for index, row in flyby_dataframe.iterrows():
-        valid_flyby_ids.append(row.iloc[0])
-        if row.iloc[0] == flyby_id:
-            flyby_id_found = True
-            break
-    if not flyby_id_found:
-        raise ValueError(
-            f"[flyby_id]: Invalid flyby_id, '{flyby_id}', choose from:\n{valid_flyby_ids}"
+    id_to_observation_num = pydar._retrieve_flyby_lookup()["id_to_observation"]
+    if flyby_id not in id_to_observation_num:
+        raise ValueError(
+            f"[flyby_id]: Invalid flyby_id, '{flyby_id}', choose from:\n{list(id_to_observation_num)}"
         )
 
 
@@ -162,21 +240,10 @@ def _error_handling_convert_observation_num_to_id(flyby_observation_num=None):
             f"[flyby_observation_num]: Must be a str, current type = '{type(flyby_observation_num)}'"
         )
 
-    flyby_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data',
-        'cassini_flyby.csv')  # get file's directory, up one level, /data/*.csv
-    flyby_dataframe = pd.read_csv(flyby_csv_file)
-    valid_observation_nums = []
-    observation_num_found = False
-    for index, row in flyby_dataframe.iterrows():
-        take_ob_num = "0" + row.iloc[1].split(" ")[1]
-        valid_observation_nums.append(take_ob_num)
-        if take_ob_num == flyby_observation_num:
-            observation_num_found = True
-            break
-    if not observation_num_found:
-        raise ValueError(
-            f"[flyby_observation_num]: Invalid flyby_observation_num, '{flyby_observation_num}', choose from:\n{valid_observation_nums}"
+    observation_num_to_id = pydar._retrieve_flyby_lookup()["observation_to_id"]
+    if flyby_observation_num not in observation_num_to_id:
+        raise ValueError(
+            f"[flyby_observation_num]: Invalid flyby_observation_num, '{flyby_observation_num}', choose from:\n{list(observation_num_to_id)}"
         )
 
 
@@ -221,6 +288,25 @@ def _error_handling_display_all_images(image_directory=None,
             )
 
 
+def _error_handling_read_zip_image(zipfile_name=None, image_name=None):
+    # Error Handling for Reading an IMG within a ZIP: read_zip_image()
+    if zipfile_name is None:
+        raise ValueError("[zipfile_name]: zipfile_name is required")
+    else:
+        if type(zipfile_name) != str:
+            raise ValueError(
+                f"[zipfile_name]: Must be a str, current type = '{type(zipfile_name)}'"
+            )
+        if not os.path.isfile(zipfile_name):
+            raise ValueError(
+                f"[zipfile_name]: '{zipfile_name}' does not exist")
+
+    if image_name is not None and type(image_name) != str:
+        raise ValueError(
+            f"[image_name]: Must be a str, current type = '{type(image_name)}'"
+        )
+
+
 def _error_handling_readme_options(coradr_results_directory=None,
                                    section_to_print=None,
                                    print_to_console=True):
@@ -485,6 +571,173 @@ def _error_handling_id_from_time_range(start_year=None,
                     )
 
 
+def _invalid_query_index(invalid_rows=None) -> list:
+    # Return the first query indices that failed a check (to keep error messages short)
+    return np.flatnonzero(invalid_rows)[:10].tolist()
+
+
+def _error_handling_id_from_lat_lon_many(points=None):
+    # Error Handling for retrieving IDs for many latitude/longitude points or ranges: ids_from_latlon_many(), features_from_latlon_many()
+    point_columns = ["latitude", "longitude"]
+    range_columns = [
+        "min_latitude", "max_latitude", "min_longitude", "max_longitude"
+    ]
+
+    if points is None:
+        raise ValueError("[points]: points is required")
+    if isinstance(points, pd.DataFrame):
+        if all(column in points.columns for column in point_columns):
+            columns = {column: points[column] for column in point_columns}
+        elif all(column in points.columns for column in range_columns):
+            columns = {column: points[column] for column in range_columns}
+        else:
+            raise ValueError(
+                f"[points]: Requires the columns {point_columns} or {range_columns}, current columns = {list(points.columns)}"
+            )
+    elif isinstance(points, np.ndarray):
+        if points.ndim != 2 or points.shape[1] not in [2, 4]:
+            raise ValueError(
+                f"[points]: Must have the shape (N, 2) for {point_columns} or (N, 4) for {range_columns}, current shape = {points.shape}"
+            )
+        column_names = point_columns if points.shape[1] == 2 else range_columns
+        columns = {
+            column: points[:, i]
+            for i, column in enumerate(column_names)
+        }
+    else:
+        raise ValueError(
+            f"[points]: Must be a pd.DataFrame or np.ndarray, current type = '{type(points)}'"
+        )
+
+    for column_name, column in columns.items():
+        column = np.asarray(column)
+        if column.dtype == bool or not np.issubdtype(column.dtype, np.number):
+            raise ValueError(
+                f"[{column_name}]: Must be a float or int, current dtype = '{column.dtype}'"
+            )
+        column = column.astype(np.float64)
+        if np.isnan(column).any():
+            raise ValueError(
+                f"[{column_name}]: {column_name} is required, missing at query index {_invalid_query_index(np.isnan(column))}"
+            )
+        if "latitude" in column_name:
+            invalid_rows = (column > 90) | (column < -90)
+            if invalid_rows.any():
+                raise ValueError(
+                    f"[{column_name}]: Latitude must be between 90 and -90, invalid at query index {_invalid_query_index(invalid_rows)}"
+                )
+        else:
+            invalid_rows = (column < 0) | (column > 360)
+            if invalid_rows.any():
+                raise ValueError(
+                    f"[{column_name}]: Longitude must be between 0 and 360, invalid at query index {_invalid_query_index(invalid_rows)}"
+                )
+        columns[column_name] = column
+
+    if "min_latitude" in columns:
+        invalid_rows = columns["max_latitude"] < columns["min_latitude"]
+        if invalid_rows.any():
+            raise ValueError(
+                f"[latitude]: max_latitude must be greater than min_latitude, invalid at query index {_invalid_query_index(invalid_rows)}"
+            )
+        invalid_rows = columns["max_longitude"] < columns["min_longitude"]
+        if invalid_rows.any():
+            raise ValueError(
+                f"[longitude]: max_longitude must be greater than min_longtiude, invalid at query index {_invalid_query_index(invalid_rows)}"
+            )
+
+
+def _error_handling_id_from_time_many(timestamps=None):
+    # Error handling for retrieving IDs for many timestamps or time ranges: ids_from_time_many()
+    time_fields = ["year", "doy", "hour", "minute", "second", "millisecond"]
+    field_ranges = {
+        "year": (2004, 2014, "[{0}]: {0} must be between 2004-2014"),
+        "doy": (0, 365, "[{0}]: {0} must be between 0-365"),
+        "hour": (0, 23, "[{0}]: {0} must be within UTC range between 0 to 23"),
+        "minute": (0, 59, "[{0}]: {0} must be within range between 0 to 59"),
+        "second": (0, 59, "[{0}]: {0} must be within range between 0 to 59"),
+        "millisecond":
+        (0, 999, "[{0}]: {0} must be a positive value from 0 to 999")
+    }
+
+    if timestamps is None:
+        raise ValueError("[timestamps]: timestamps is required")
+    if isinstance(timestamps, dict):
+        timestamps = pd.DataFrame(timestamps)
+    if not isinstance(timestamps, pd.DataFrame):
+        raise ValueError(
+            f"[timestamps]: Must be a pd.DataFrame or dict, current type = '{type(timestamps)}'"
+        )
+
+    if "year" in timestamps.columns:
+        prefixes = [""]
+    elif "start_year" in timestamps.columns:
+        prefixes = ["start_", "end_"]
+    else:
+        raise ValueError(
+            f"[timestamps]: Requires the columns ['year', 'doy'] or ['start_year', 'start_doy', 'end_year', 'end_doy'], current columns = {list(timestamps.columns)}"
+        )
+
+    for prefix in prefixes:
+        for field in time_fields:
+            column_name = prefix + field
+            if column_name not in timestamps.columns:
+                if field in ["year", "doy"]:
+                    raise ValueError(
+                        f"[{column_name}]: {column_name} is required")
+                continue
+            column = np.asarray(timestamps[column_name])
+            if column.dtype == bool or not np.issubdtype(
+                    column.dtype, np.number):
+                raise ValueError(
+                    f"[{column_name}]: Must be an int, current dtype = '{column.dtype}'"
+                )
+            column = column.astype(np.float64)
+            missing_rows = np.isnan(column)
+            if field in ["year", "doy"] and missing_rows.any():
+                raise ValueError(
+                    f"[{column_name}]: {column_name} is required, missing at query index {_invalid_query_index(missing_rows)}"
+                )
+            column = np.where(missing_rows, field_ranges[field][0], column)
+            if (column != np.floor(column)).any():
+                raise ValueError(
+                    f"[{column_name}]: Must be an int, invalid at query index {_invalid_query_index(column != np.floor(column))}"
+                )
+            lower, upper, message = field_ranges[field]
+            invalid_rows = (column < lower) | (column > upper)
+            if invalid_rows.any():
+                raise ValueError(
+                    message.format(column_name) +
+                    f", invalid at query index {_invalid_query_index(invalid_rows)}"
+                )
+
+    if prefixes == ["start_", "end_"]:
+        # Compare the start and end of each row field by field with the same rules as
+        # _error_handling_id_from_time_range(), where a later field is only compared while all
+        # earlier fields are equal (hour and minute are equal when both are missing, and the
+        # millisecond is only compared when both seconds are given)
+        tied_rows = np.ones(len(timestamps), dtype=bool)
+        missing_column = np.full(len(timestamps), np.nan)
+        for field in time_fields:
+            start_column = np.asarray(timestamps.get(f"start_{field}",
+                                                     missing_column),
+                                      dtype=np.float64)
+            end_column = np.asarray(timestamps.get(f"end_{field}",
+                                                   missing_column),
+                                    dtype=np.float64)
+            both_given = ~np.isnan(start_column) & ~np.isnan(end_column)
+            invalid_rows = tied_rows & both_given & (start_column > end_column)
+            if invalid_rows.any():
+                raise ValueError(
+                    f"[{field}]: start_{field} must be less than/equal to end_{field}, invalid at query index {_invalid_query_index(invalid_rows)}"
+                )
+            if field in ["hour", "minute"]:
+                tied_rows &= (start_column == end_column) | (
+                    np.isnan(start_column) & np.isnan(end_column))
+            else:
+                tied_rows &= start_column == end_column
+
+
 def _error_handling_sbdr_make_shapefile(filename=None,
                                         fields=[],
                                         write_files=False,
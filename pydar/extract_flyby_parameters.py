@@ -9,10 +9,21 @@
 #                                              list of flyby IDs and associated Radar             #
 #                                              Data Take Number the images                        #
 #                                                                                                 #
+#                                       - _build_segment_options: backend to build                #
+#                                              the segment options from sar_swath_details.csv     #
+#                                                                                                 #
 #                                       - _return_segment_options: backend to return              #
 #                                              a list of available segment numbers from           #
 #                                              sar_swath_details.csv                              #
 #                                                                                                 #
+#                                       - _build_flyby_lookup: backend to build                   #
+#                                              dictionaries between flyby IDs and                 #
+#                                              observation numbers                                #
+#                                                                                                 #
+#                                       - _retrieve_flyby_lookup: backend to return               #
+#                                              the cached flyby ID/observation number             #
+#                                              dictionaries                                       #
+#                                                                                                 #
 #                                       - id_to_observation: converts between a flyby             #
 #                                              ID and an observation number                       #
 #                                                                                                 #
@@ -27,42 +38,71 @@
 #                                              to return the possible CORADR version              #
 #                                              number                                             #
 #                                                                                                 #
+#                                       - _build_coradr_without_bidr: backend to build            #
+#                                              the valid flyby observation numbers that           #
+#                                              do not contain BIDR                                #
+#                                                                                                 #
 #                                       - _retrieve_coradr_without_bidr: backend to               #
 #                                              return a list of valid flyby observation           #
 #                                              numbers that do not contain BIDR to track          #
 #                                              where gaps in data exist                           #
 #                                                                                                 #
+#                                       - _aareadme_download_jobs: backend to select              #
+#                                              the AAREADME.txt within a CORADR directory         #
+#                                                                                                 #
 #                                       - _download_aareadme: backend to download the             #
 #                                              AAREADME.txt within a CORADR directory             #
 #                                                                                                 #
+#                                       - _bidr_download_jobs: backend to select the              #
+#                                              BIDR files of a segment and resolutions            #
+#                                              from the BIDR directory listing                    #
+#                                                                                                 #
+#                                       - _pending_download_jobs: backend to compare              #
+#                                              download jobs against the manifest of a            #
+#                                              results directory                                  #
+#                                                                                                 #
 #                                       - _download_bidr_coradr_data: backend to download         #
 #                                              BIDR data within CORADR results directory          #
 #                                                                                                 #
+#                                       - _sbdr_download_jobs: backend to select the              #
+#                                              SBDR files from the SBDR directory listing         #
+#                                                                                                 #
 #                                       - _download_sbdr_coradr_data: backend to download         #
 #                                              SBDR data within CORADR results directory          #
 #                                                                                                 #
 #                                       - _download_additional_data_types: (TODO) backend         #
 #                                              to download additional data (TODO)                 #
 #                                                                                                 #
+#                                       - _prepare_flyby_extraction: backend to check             #
+#                                              the parameters of extract_flyby_images             #
+#                                              and create the results directory                   #
+#                                                                                                 #
+#                                       - _finish_flyby_extraction: backend to download           #
+#                                              additional data types and report an empty          #
+#                                              results directory                                  #
+#                                                                                                 #
 #                                       - extract_flyby_images: extract flyby data BIDR           #
 #                                              and SBDR data based on flyby ID or                 #
 #                                              observation number  to pydar_results/              #
 #                                                                                                 #
+#                                       - aextract_flyby_images: extract_flyby_images             #
+#                                              with asyncio, retrieving the directory             #
+#                                              listings and files concurrently                    #
+#                                                                                                 #
 #                                                                                                 #
 #                                                                                                 #
 
 # Extract flyby parameters from CASSINI
 
 # Standard Library Imports
+import asyncio
 from datetime import datetime, timedelta
 import logging
 import os
-import zipfile
+from types import MappingProxyType
 
 # Related Third Party Imports
-from bs4 import BeautifulSoup
 import pandas as pd
-from urllib import request, error
 
 # Internal Local Imports
 import pydar
@@ -78,57 +118,63 @@ logger.addHandler(stream_handler)
 RESOLUTION_TYPES = ["B", "D", "F", "H",
                     "I"]  # 2, 8, 32, 128, 256 pixels/degree
 DATAFILE_TYPES = ["ABDR", "ASUM", "BIDR", "LBDR", "SBDR", "STDR"]
+CASSINI_ORBITER_URL = "https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter"
 
 
-def _retrieve_flyby_data() -> tuple[list, str]:
+def _retrieve_flyby_data() -> tuple[tuple, tuple]:
     # Header: Titan flyby id, Radar Data Take Number, Sequence number, Orbit Number/ID
-    flyby_id = []
-    flyby_radar_take_num = []
-    flyby_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data',
-        'cassini_flyby.csv')  # get file's directory, up one level, /data/*.csv
-    flyby_dataframe = pd.read_csv(flyby_csv_file)
-    for index, row in flyby_dataframe.iterrows():
-        row = row.tolist()
-        flyby_id.append(row[0])
-        radar_take_num = row[1].split(" ")[1]
-        while len(radar_take_num) < 4:
-            radar_take_num = "0" + radar_take_num  # set all radar take numbers to be four digits long: 229 -> 0229
-        flyby_radar_take_num.append(radar_take_num)
-    # returns a list of flyby IDs and associated Radar Data Take Number
-    return flyby_id, flyby_radar_take_num
-
-
-def _return_segment_options() -> list:
-    # return a possible list of segments from sar_swath_details.csv
-    sar_swatch_csv = os.path.join(
-        os.path.dirname(__file__), 'data', 'sar_swath_details.csv'
-    )  # get file's directory, up one level, /data/*.csv
-    sar_swath_df = pd.read_csv(sar_swatch_csv)
-    seg_num = sar_swath_df['SEGMENT'].unique()
-    seg_options = []
-    for num in seg_num:
-        if num < 10:
-            seg_options.append(f"S0{num}")
-        else:
-            seg_options.append(f"S{num}")
-    return seg_options  # ['S01', 'S02', 'S03', 'S04', 'S05', 'S06', 'S07', 'S08', 'S09']
+    flyby_lookup = _retrieve_flyby_lookup()
+    # returns a tuple of flyby IDs and associated Radar Data Take Number
+    return flyby_lookup["flyby_ids"], flyby_lookup["observation_numbers"]
+
+
+def _build_segment_options(sar_swath_df: pd.DataFrame) -> tuple:
+    # Build the possible segments from sar_swath_details.csv
+    #   Returns a tuple of segment options
+    return tuple(f"S{num:02d}" for num in sar_swath_df['SEGMENT'].unique())
+
+
+def _return_segment_options() -> tuple:
+    # return a possible tuple of segments from sar_swath_details.csv, built once per version of the CSV
+    return pydar._read_catalog_derived(
+        "sar_swath_details.csv", "segment_options", _build_segment_options
+    )  # ('S01', 'S02', 'S03', 'S04', 'S05', 'S06', 'S07', 'S08', 'S09')
+
+
+def _build_flyby_lookup(flyby_dataframe: pd.DataFrame) -> dict:
+    # Build dictionaries between flyby IDs and observation numbers, where all radar take
+    # numbers are set to be four digits long: 229 -> 0229
+    #   Returns a Dictionary of flyby ID to observation number and observation number to flyby
+    #   ID (as read-only mappings) with a tuple of all flyby IDs and observation numbers
+    flyby_ids = tuple(flyby_dataframe.iloc[:, 0].tolist())
+    observation_numbers = tuple(
+        flyby_dataframe.iloc[:, 1].str.split(" ").str[1].str.zfill(4).tolist())
+    id_to_observation_num = {}
+    observation_num_to_id = {}
+    for flyby_id, observation_number in zip(flyby_ids, observation_numbers):
+        # keep the first row for repeated flyby IDs/observation numbers
+        id_to_observation_num.setdefault(flyby_id, observation_number)
+        observation_num_to_id.setdefault(observation_number, flyby_id)
+    return {
+        "flyby_ids": flyby_ids,
+        "observation_numbers": observation_numbers,
+        "id_to_observation": MappingProxyType(id_to_observation_num),
+        "observation_to_id": MappingProxyType(observation_num_to_id)
+    }
+
+
+def _retrieve_flyby_lookup() -> dict:
+    # Retrieve the flyby ID/observation number dictionaries, built once per version of cassini_flyby.csv
+    #   Returns a Dictionary of flyby ID to observation number and observation number to flyby ID
+    return pydar._read_catalog_derived("cassini_flyby.csv", "flyby_lookup",
+                                       _build_flyby_lookup)
 
 
 def id_to_observation(flyby_id: str = None) -> str:
     # convert Flyby ID to Observation Number to find data files
     pydar._error_handling_convert_id_to_observation_num(flyby_id=flyby_id)
 
-    flyby_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data',
-        'cassini_flyby.csv')  # get file's directory, up one level, /data/*.csv
-    flyby_dataframe = pd.read_csv(flyby_csv_file)
-    for index, row in flyby_dataframe.iterrows():
-        if row.iloc[0] == flyby_id:
-            observation_number = row.iloc[1].split(" ")[1]
-            while len(observation_number) < 4:
-                observation_number = "0" + observation_number  # set all radar take numbers to be four digits long: 229 -> 0229
-            return observation_number
+    return _retrieve_flyby_lookup()["id_to_observation"][flyby_id]
 
 
 def observation_to_id(flyby_observation_num: str = None) -> str:
@@ -145,37 +191,26 @@ def observation_to_id(flyby_observation_num: str = None) -> str:
     pydar._error_handling_convert_observation_num_to_id(
         flyby_observation_num=flyby_observation_num)
 
-    flyby_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data',
-        'cassini_flyby.csv')  # get file's directory, up one level, /data/*.csv
-    flyby_dataframe = pd.read_csv(flyby_csv_file)
-    for index, row in flyby_dataframe.iterrows():
-        take_ob_num = "0" + row.iloc[1].split(" ")[1]
-        if take_ob_num == flyby_observation_num:
-            return row.iloc[0]  # returns flyby ID
+    return _retrieve_flyby_lookup()["observation_to_id"][
+        flyby_observation_num]  # returns flyby ID
 
 
 def _retrieve_jpl_coradr_options() -> pd.DataFrame:
     # Read JPL Options from CSV
-    coradr_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data', 'coradr_jpl_options.csv'
-    )  # get file's directory, up one level, /data/*.csv
-    coradr_dataframe = pd.read_csv(coradr_csv_file)
+    coradr_dataframe = pydar._read_catalog_csv("coradr_jpl_options.csv")
     return coradr_dataframe
 
 
 def _retrieve_most_recent_version_number(
         flyby_observiation_num: str = None) -> str:
     # Return the CORADAR value with the most recent version from a list of possible options
-    coradr_dataframe = _retrieve_jpl_coradr_options()
-    jpl_coradr_options = []
-    for index, row in coradr_dataframe.iterrows():
-        row = row.tolist()
-        jpl_coradr_options.append(row[0])
+    jpl_coradr_options = _retrieve_jpl_coradr_options()["CORADR ID"]
 
     find_cordar_listing = f"CORADR_{flyby_observiation_num}"
-    version_types_available = list(
-        filter(lambda x: find_cordar_listing in x, jpl_coradr_options))
+    version_types_available = [
+        coradr_id for coradr_id in jpl_coradr_options
+        if find_cordar_listing in coradr_id
+    ]
     more_accurate_model_number = version_types_available[
         -1]  # always choose the last and more up to date version number (Currently, v3)
     logger.info(
@@ -184,51 +219,61 @@ def _retrieve_most_recent_version_number(
     return more_accurate_model_number
 
 
+def _build_coradr_without_bidr(coradr_dataframe: pd.DataFrame) -> tuple:
+    # Build the valid flyby observation numbers that do not contain BIDR from coradr_jpl_options.csv
+    #   Returns a tuple of observation numbers
+    # check only flybys that are valid Titan flybys, not a version row, and does not contain BIDR
+    is_titan_flyby = coradr_dataframe["Is a Titan Flyby"]
+    is_version_row = coradr_dataframe["CORADR ID"].str.contains("V")
+    without_bidr = is_titan_flyby & ~is_version_row & ~coradr_dataframe[
+        "Contains BIDR"]
+    # store the observation number from the CORADR
+    return tuple(
+        coradr_id.split("_")[1]
+        for coradr_id in coradr_dataframe.loc[without_bidr, "CORADR ID"])
+
+
 def _retrieve_coradr_without_bidr() -> list:
     # Return a list of valid flyby observation numbers that do not contain BIDR
-    coradr_dataframe = _retrieve_jpl_coradr_options()
-    coradar_without_bidr = []
-    for index, row in coradr_dataframe.iterrows():
-        if row["Is a Titan Flyby"]:  # check only flybys that are valid Titan flybys
-            if "V" not in row["CORADR ID"] and row[
-                    "Contains BIDR"] is False:  # if not a version row, and does not contain BIDR
-                coradar_without_bidr.append(row["CORADR ID"].split(
-                    "_")[1])  # store the observation number from the CORADR
-    return coradar_without_bidr
+    return list(
+        pydar._read_catalog_derived("coradr_jpl_options.csv",
+                                    "coradr_without_bidr",
+                                    _build_coradr_without_bidr))
 
 
-def _download_aareadme(cordar_file_name: str = None,
-                       segment_id: str = None) -> None:
-    # Download AAREADME.txt within a CORADR directory
+def _aareadme_download_jobs(cordar_file_name: str = None,
+                            segment_id: str = None) -> list:
+    # Select the AAREADME.txt within a CORADR directory
+    #   Returns a list of (url, file_path) download jobs
     aareadme_name = "AAREADME.TXT"
-    aareadme_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{cordar_file_name}/{aareadme_name}"
-
-    # Retrieve a list of all elements from the base URL to download AAREADME.txt
-    logger.info(f"Retrieving {cordar_file_name} {aareadme_name}")
+    aareadme_url = f"{CASSINI_ORBITER_URL}/{cordar_file_name}/{aareadme_name}"
     aareadme_name = os.path.join(
         f"pydar_results/{cordar_file_name}_{segment_id}", aareadme_name)
-    try:
-        request.urlretrieve(aareadme_url)
-    except error.HTTPError as err:
-        raise HTTPError(
-            f"Unable to access: {aareadme_url}\nError (and exiting): '{err.code}'"
-        )
-    else:
-        response = request.urlretrieve(aareadme_url, aareadme_name)
+    return [(aareadme_url, aareadme_name)]
 
 
-def _download_bidr_coradr_data(cordar_file_name: str = None,
-                               segment_id: str = None,
-                               resolution_px: list = None) -> None:
-    # Download BDIR files
-    base_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{cordar_file_name}/DATA/BIDR/"
+def _download_aareadme(cordar_file_name: str = None,
+                       segment_id: str = None) -> None:
+    # Download AAREADME.txt within a CORADR directory
+    logger.info(f"Retrieving {cordar_file_name} AAREADME.TXT")
+    pydar._download_missing_files(
+        download_jobs=_aareadme_download_jobs(cordar_file_name, segment_id),
+        results_directory=f"pydar_results/{cordar_file_name}_{segment_id}")
+
+
+def _bidr_download_jobs(cordar_file_name: str = None,
+                        segment_id: str = None,
+                        resolution_px: list = None,
+                        table_text: list = None) -> list:
+    # Select the BIDR LBL and ZIP files of a segment and resolutions from the BIDR directory listing
+    # (or from table_text when the listing has already been retrieved)
+    #   Returns a list of (url, file_path) download jobs
+    base_url = f"{CASSINI_ORBITER_URL}/{cordar_file_name}/DATA/BIDR/"
     logger.info(f"Retrieving BIDR filenames from: {base_url}\n")
 
     # Retrieve a list of all elements from the base URL to download
-    base_html = request.urlopen(base_url).read()
-    soup = BeautifulSoup(base_html, 'html.parser')
-    table = soup.find('table', {"id": "indexlist"})
-    table_text = (table.text).split("\n")
+    if table_text is None:
+        table_text = pydar._read_directory_listing(base_url)
     url_filenames = []
     all_bidr_files = []
     for txt in table_text:
@@ -255,54 +300,95 @@ def _download_bidr_coradr_data(cordar_file_name: str = None,
             f"No BIDR files found with resolution, segment, and flyby identification. Please use different parameters to retrieve data.\nAll files found: {all_bidr_files}"
         )
 
-    for i, coradr_file in enumerate(url_filenames):
+    results_directory = f"pydar_results/{cordar_file_name}_{segment_id}"
+    download_jobs = []
+    for coradr_file in url_filenames:
+        data_url = f"{base_url}{coradr_file}"
         if 'LBL' in coradr_file:
-            label_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{cordar_file_name}/DATA/BIDR/{coradr_file}"
-            logger.info(
-                f"Retrieving [{i+1}/{len(url_filenames)}]: {label_url}")
-            label_name = label_url.split("/")[-1].split(".")[0] + ".LBL"
-            label_name = os.path.join(
-                f"pydar_results/{cordar_file_name}_{segment_id}", label_name)
-            try:
-                request.urlretrieve(label_url)
-            except error.HTTPError as err:
-                raise HTTPError(
-                    f"Unable to access: {label_url}\nError (and exiting): '{err.code}'"
-                )
-            else:
-                response = request.urlretrieve(label_url, label_name)
+            label_name = data_url.split("/")[-1].split(".")[0] + ".LBL"
+            label_name = os.path.join(results_directory, label_name)
+            download_jobs.append((data_url, label_name))
         if 'ZIP' in coradr_file:
-            data_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{cordar_file_name}/DATA/BIDR/{coradr_file}"
-            logger.info(f"Retrieving [{i+1}/{len(url_filenames)}]: {data_url}")
             zipfile_name = data_url.split("/")[-1].split(".")[0] + ".zip"
-            zipfile_name = os.path.join(
-                f"pydar_results/{cordar_file_name}_{segment_id}", zipfile_name)
-            try:
-                request.urlretrieve(data_url)
-            except error.HTTPError as err:
-                raise HTTPError(
-                    f"Unable to access: {data_url}\nError (and exiting): '{err.code}'"
-                )
-            else:
-                response = request.urlretrieve(data_url, zipfile_name)
-                zipped_image = zipfile_name.split(".")[0] + ".IMG"
-                with zipfile.ZipFile(zipfile_name, 'r') as zip_ref:
-                    zipped_image_path = os.path.join(
-                        f"pydar_results/{cordar_file_name}_{segment_id}")
-                    zip_ref.extractall(zipped_image_path)
+            zipfile_name = os.path.join(results_directory, zipfile_name)
+            download_jobs.append((data_url, zipfile_name))
+    return download_jobs
+
+
+def _pending_download_jobs(results_directory: str = None,
+                           download_jobs: list = None) -> tuple:
+    # Compare (url, file_path) download jobs against the manifest of a results directory, where
+    # ZIPs already downloaded but not extracted only need to be extracted and the files unchanged
+    # locally are revalidated against the server concurrently
+    #   Returns a tuple of (download jobs missing, ZIP jobs to extract, number of files skipped)
+    manifest = pydar._read_manifest(results_directory)
+    files_extracted = set()
+    local_jobs = []
+    for data_url, file_path in download_jobs:
+        if file_path.endswith(".zip") and pydar._manifest_files_extracted(
+                manifest, data_url, file_path):
+            files_extracted.add(file_path)
+            local_jobs.append((data_url, file_path))
+        elif pydar._manifest_file_is_current(manifest, data_url, file_path):
+            local_jobs.append((data_url, file_path))
+    current_files = pydar._manifest_urls_current(manifest, local_jobs)
+
+    missing_jobs = []
+    zipfile_jobs = []
+    files_skipped = 0
+    for data_url, file_path in download_jobs:
+        is_zipfile = file_path.endswith(".zip")
+        if file_path not in current_files:
+            missing_jobs.append((data_url, file_path))
+            if is_zipfile:
+                zipfile_jobs.append((data_url, file_path))
+        elif file_path in files_extracted:
+            logger.info(f"Already extracted: {file_path}")
+            files_skipped += 1
+        elif is_zipfile:  # ZIP downloaded before, but not extracted
+            zipfile_jobs.append((data_url, file_path))
+        else:
+            logger.info(f"Already downloaded: {file_path}")
+            files_skipped += 1
+    return missing_jobs, zipfile_jobs, files_skipped
 
 
-def _download_sbdr_coradr_data(cordar_file_name: str = None,
-                               segment_id: str = None) -> None:
-    # Download SBDR files
-    base_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{cordar_file_name}/DATA/SBDR/"
+def _download_bidr_coradr_data(cordar_file_name: str = None,
+                               segment_id: str = None,
+                               resolution_px: list = None,
+                               max_workers: int = None,
+                               max_connections_per_host: int = None) -> None:
+    # Download BDIR files
+    download_jobs = _bidr_download_jobs(cordar_file_name, segment_id,
+                                        resolution_px)
+
+    # Download the LBL and ZIP files of the segment concurrently (skipping files already downloaded)
+    results_directory = f"pydar_results/{cordar_file_name}_{segment_id}"
+    missing_jobs, zipfile_jobs, _ = _pending_download_jobs(
+        results_directory, download_jobs)
+    pydar._download_missing_files(
+        download_jobs=missing_jobs,
+        results_directory=results_directory,
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host,
+        check_manifest=False)
+
+    # Extract the IMG files and record the extracted files in the manifest
+    pydar._extract_zip_files(results_directory, zipfile_jobs)
+
+
+def _sbdr_download_jobs(cordar_file_name: str = None,
+                        segment_id: str = None,
+                        table_text: list = None) -> list:
+    # Select the SBDR TAB and FMT files from the SBDR directory listing (or from table_text when
+    # the listing has already been retrieved)
+    #   Returns a list of (url, file_path) download jobs
+    base_url = f"{CASSINI_ORBITER_URL}/{cordar_file_name}/DATA/SBDR/"
     logger.info(f"\nRetrieving SBDR filenames from: {base_url}")
 
     # Retrieve a SBDR file from filename at SBDR URL
-    base_html = request.urlopen(base_url).read()
-    soup = BeautifulSoup(base_html, 'html.parser')
-    table = soup.find('table', {"id": "indexlist"})
-    table_text = (table.text).split("\n")
+    if table_text is None:
+        table_text = pydar._read_directory_listing(base_url)
     sbdr_files = []
     sbdr_filename = ''
     for txt in table_text:
@@ -321,26 +407,35 @@ def _download_sbdr_coradr_data(cordar_file_name: str = None,
             "No SBDR files were found with resolution, segment, and flyby identification. Please use different parameters to retrieve data"
         )
 
+    results_directory = f"pydar_results/{cordar_file_name}_{segment_id}"
+    download_jobs = []
     for sbdr_file in sbdr_files:
-        sbdr_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{cordar_file_name}/DATA/SBDR/{sbdr_file}"
-        logger.info(f"Retrieving SBDR file '{sbdr_file}': {sbdr_url}")
-        sbdr_name = os.path.join(
-            f"pydar_results/{cordar_file_name}_{segment_id}", sbdr_file)
-        try:
-            request.urlretrieve(sbdr_url)
-        except error.HTTPError as err:
-            raise HTTPError(
-                f"Unable to access: {sbdr_url}\nError (and exiting): '{err.code}'"
-            )
-        else:
-            response = request.urlretrieve(sbdr_url, sbdr_name)
+        sbdr_url = f"{base_url}{sbdr_file}"
+        sbdr_name = os.path.join(results_directory, sbdr_file)
+        download_jobs.append((sbdr_url, sbdr_name))
+    return download_jobs
+
+
+def _download_sbdr_coradr_data(cordar_file_name: str = None,
+                               segment_id: str = None,
+                               max_workers: int = None,
+                               max_connections_per_host: int = None) -> None:
+    # Download SBDR files
+    download_jobs = _sbdr_download_jobs(cordar_file_name, segment_id)
+
+    # Download the TAB and FMT files concurrently (skipping files already downloaded)
+    pydar._download_missing_files(
+        download_jobs=download_jobs,
+        results_directory=f"pydar_results/{cordar_file_name}_{segment_id}",
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host)
 
 
 def _download_additional_data_types(cordar_file_name: str = None,
                                     segment_id: str = None,
                                     additional_data_type: list = None) -> None:
     # Download additional data types
-    additional_data_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{cordar_file_name}/DATA/{additional_data_type}"
+    additional_data_url = f"{CASSINI_ORBITER_URL}/{cordar_file_name}/DATA/{additional_data_type}"
     logger.info(
         f"\n[TODO: does not currently download] '{additional_data_type}': {additional_data_url}"
     )
@@ -348,14 +443,17 @@ def _download_additional_data_types(cordar_file_name: str = None,
     # This function does not currently have functionality in pydar
 
 
-def extract_flyby_images(flyby_observation_num: str = None,
-                         flyby_id: str = None,
-                         segment_num: str = None,
-                         additional_data_types_to_download: list = [],
-                         resolution: str = 'I',
-                         top_x_resolutions: list = None) -> None:
-    # extract flyby data based on flyby ID/observation numbyer
-
+def _prepare_flyby_extraction(flyby_observation_num: str = None,
+                              flyby_id: str = None,
+                              segment_num: str = None,
+                              additional_data_types_to_download: list = [],
+                              resolution: str = 'I',
+                              top_x_resolutions: list = None,
+                              max_workers: int = None,
+                              max_connections_per_host: int = None) -> tuple:
+    # Normalize and check the parameters of extract_flyby_images, report flybys without BIDR
+    # data, and create the results directory
+    #   Returns a tuple of (observation number, CORADR ID, BIDR resolutions to download)
     if flyby_id is not None and type(flyby_id) == str:
         flyby_id = flyby_id.capitalize(
         )  # ensure that observation number set to capitalized 'T'
@@ -374,7 +472,9 @@ def extract_flyby_images(flyby_observation_num: str = None,
         segment_num=segment_num,
         additional_data_types_to_download=additional_data_types_to_download,
         resolution=resolution,
-        top_x_resolutions=top_x_resolutions)
+        top_x_resolutions=top_x_resolutions,
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host)
 
     logger.debug(f"flyby_observation_num = {flyby_observation_num}")
     logger.debug(f"flyby_id = {flyby_id}")
@@ -384,8 +484,8 @@ def extract_flyby_images(flyby_observation_num: str = None,
     )
     logger.debug(f"resolution = {resolution}")
     logger.debug(f"top_x_resolutions = {top_x_resolutions}")
-
-    download_files = True  # for debugging, does not always download files before running data
+    logger.debug(f"max_workers = {max_workers}")
+    logger.debug(f"max_connections_per_host = {max_connections_per_host}")
 
     if flyby_id is not None:  # convert flyby Id to an Observation Number
         flyby_observation_num = id_to_observation(flyby_id)
@@ -419,7 +519,8 @@ def extract_flyby_images(flyby_observation_num: str = None,
 
     available_flyby_id, available_observation_numbers = _retrieve_flyby_data()
 
-    if flyby_observation_num not in available_observation_numbers:
+    if flyby_observation_num not in _retrieve_flyby_lookup(
+    )["observation_to_id"]:
         raise ValueError(
             f"Observation number '{flyby_observation_num}' NOT FOUND in available observation numbers: {available_observation_numbers}\n"
         )
@@ -437,30 +538,24 @@ def extract_flyby_images(flyby_observation_num: str = None,
         os.makedirs(
             f"pydar_results/{flyby_observation_cordar_name}_{segment_num}")
 
-    if download_files:
-        # Download AAREADME.TXT
-        _download_aareadme(flyby_observation_cordar_name, segment_num)
-
-        # Download BIDR
-        if flyby_observation_num not in no_associated_bidr_values:  # only attempt to download BIDR files for flybys that have BIDR files
-            if top_x_resolutions is not None:
-                _download_bidr_coradr_data(
-                    flyby_observation_cordar_name, segment_num,
-                    RESOLUTION_TYPES[-top_x_resolutions:])
-            else:
-                _download_bidr_coradr_data(flyby_observation_cordar_name,
-                                           segment_num, resolution)
-
-        # Download SBDR
-        _download_sbdr_coradr_data(flyby_observation_cordar_name, segment_num)
-
-        # Download additional data types (TODO)
-        for data_type in additional_data_types_to_download:
-            if data_type not in [
-                    "BIDR", "SBDR"
-            ]:  # ignore data files that have already been downloaded
-                _download_additional_data_types(flyby_observation_cordar_name,
-                                                segment_num, data_type)
+    if top_x_resolutions is not None:  # save the top x resolutions
+        resolution = RESOLUTION_TYPES[-top_x_resolutions:]
+    return flyby_observation_num, flyby_observation_cordar_name, resolution
+
+
+def _finish_flyby_extraction(
+        flyby_observation_cordar_name: str = None,
+        segment_num: str = None,
+        additional_data_types_to_download: list = []) -> None:
+    # Download the additional data types and report an empty results directory
+
+    # Download additional data types (TODO)
+    for data_type in additional_data_types_to_download:
+        if data_type not in [
+                "BIDR", "SBDR"
+        ]:  # ignore data files that have already been downloaded
+            _download_additional_data_types(flyby_observation_cordar_name,
+                                            segment_num, data_type)
 
     # No valid parameters given, empty file
     if len(
@@ -470,3 +565,109 @@ def extract_flyby_images(flyby_observation_num: str = None,
         logger.critical(
             f"\npydar_results/{flyby_observation_cordar_name}_{segment_num} is empty. Unable to find any data files with current parameters"
         )
+
+
+def extract_flyby_images(flyby_observation_num: str = None,
+                         flyby_id: str = None,
+                         segment_num: str = None,
+                         additional_data_types_to_download: list = [],
+                         resolution: str = 'I',
+                         top_x_resolutions: list = None,
+                         max_workers: int = None,
+                         max_connections_per_host: int = None) -> None:
+    # extract flyby data based on flyby ID/observation numbyer
+    flyby_observation_num, flyby_observation_cordar_name, resolution_px = _prepare_flyby_extraction(
+        flyby_observation_num=flyby_observation_num,
+        flyby_id=flyby_id,
+        segment_num=segment_num,
+        additional_data_types_to_download=additional_data_types_to_download,
+        resolution=resolution,
+        top_x_resolutions=top_x_resolutions,
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host)
+
+    # Download AAREADME.TXT
+    _download_aareadme(flyby_observation_cordar_name, segment_num)
+
+    # Download BIDR
+    if flyby_observation_num not in _retrieve_coradr_without_bidr(
+    ):  # only attempt to download BIDR files for flybys that have BIDR files
+        _download_bidr_coradr_data(
+            flyby_observation_cordar_name,
+            segment_num,
+            resolution_px,
+            max_workers=max_workers,
+            max_connections_per_host=max_connections_per_host)
+
+    # Download SBDR
+    _download_sbdr_coradr_data(
+        flyby_observation_cordar_name,
+        segment_num,
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host)
+
+    _finish_flyby_extraction(flyby_observation_cordar_name, segment_num,
+                             additional_data_types_to_download)
+
+
+async def aextract_flyby_images(flyby_observation_num: str = None,
+                                flyby_id: str = None,
+                                segment_num: str = None,
+                                additional_data_types_to_download: list = [],
+                                resolution: str = 'I',
+                                top_x_resolutions: list = None,
+                                max_workers: int = None,
+                                max_connections_per_host: int = None) -> None:
+    # extract flyby data based on flyby ID/observation number with asyncio, where the directory
+    # listings and files are retrieved concurrently on the running event loop (requires aiohttp)
+    flyby_observation_num, flyby_observation_cordar_name, resolution_px = _prepare_flyby_extraction(
+        flyby_observation_num=flyby_observation_num,
+        flyby_id=flyby_id,
+        segment_num=segment_num,
+        additional_data_types_to_download=additional_data_types_to_download,
+        resolution=resolution,
+        top_x_resolutions=top_x_resolutions,
+        max_workers=max_workers,
+        max_connections_per_host=max_connections_per_host)
+    results_directory = f"pydar_results/{flyby_observation_cordar_name}_{segment_num}"
+    contains_bidr = flyby_observation_num not in _retrieve_coradr_without_bidr(
+    )  # only attempt to download BIDR files for flybys that have BIDR files
+
+    # the connections of the client session are only used by this call and closed once it finishes
+    async with pydar._ahttp_session() as session:
+        # Retrieve the SBDR and BIDR directory listings concurrently
+        data_url = f"{CASSINI_ORBITER_URL}/{flyby_observation_cordar_name}/DATA"
+        listing_urls = [f"{data_url}/SBDR/"]
+        if contains_bidr:
+            listing_urls.append(f"{data_url}/BIDR/")
+        sbdr_table_text, *bidr_table_text = await asyncio.gather(*[
+            pydar._aread_directory_listing(session=session, url=url)
+            for url in listing_urls
+        ])
+
+        # Select the AAREADME.TXT, BIDR, and SBDR files
+        download_jobs = _aareadme_download_jobs(flyby_observation_cordar_name,
+                                                segment_num)
+        if contains_bidr:
+            download_jobs += _bidr_download_jobs(flyby_observation_cordar_name,
+                                                 segment_num, resolution_px,
+                                                 bidr_table_text[0])
+        download_jobs += _sbdr_download_jobs(flyby_observation_cordar_name,
+                                             segment_num, sbdr_table_text)
+
+        # Download the files concurrently (skipping files already downloaded) and extract the IMG files
+        # (the manifest is checked in a thread, as it sends HEAD requests and computes checksums)
+        missing_jobs, zipfile_jobs, _ = await asyncio.to_thread(
+            _pending_download_jobs, results_directory, download_jobs)
+        await pydar._adownload_missing_files(
+            session=session,
+            download_jobs=missing_jobs,
+            results_directory=results_directory,
+            max_workers=max_workers,
+            max_connections_per_host=max_connections_per_host,
+            check_manifest=False)
+        await asyncio.to_thread(pydar._extract_zip_files, results_directory,
+                                zipfile_jobs)
+
+    _finish_flyby_extraction(flyby_observation_cordar_name, segment_num,
+                             additional_data_types_to_download)
@@ -0,0 +1,245 @@
+# Shared pytest fixtures: local HTTP stand-in for the PDS imaging node
+# centerline-width/: python -m pytest -v
+
+# Standard Library Imports
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import shutil
+import threading
+import time
+import zipfile
+
+# Related Third Party Imports
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.catalog
+import pydar.directory_listing
+import pydar.downloader
+import pydar.extract_flyby_parameters
+
+
+def _zip_bytes(member_name, member_bytes):
+    # Create a ZIP archive in memory with a single member
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zip_ref:
+        zip_ref.writestr(member_name, member_bytes)
+    return zip_buffer.getvalue()
+
+
+class _CassiniStandIn:
+    # Local HTTP stand-in for the PDS imaging node that serves a fake cassini_orbiter/ tree
+    def __init__(self, files, delay=0):
+        self.files = files  # {"/cassini_orbiter/...": bytes}
+        self.delay = delay
+        self.requests = []
+        self.head_requests = []
+        self.range_requests = []
+        self.request_times = []  # time.monotonic() of each GET request
+        self.not_modified_requests = [
+        ]  # conditional requests answered with 304
+        self.client_ports = []
+        self.user_agents = []
+        self.unavailable_paths = set()  # paths that respond 503 once
+        self.not_found_paths = set()  # listed paths that respond 404
+        self.truncate_paths = set(
+        )  # paths where the connection closes halfway
+        self.chunked_paths = set(
+        )  # paths sent with Transfer-Encoding: chunked (no Content-Length)
+        self.misaligned_range_paths = set(
+        )  # paths where a Range request is answered from the first byte
+        self.active_connections = 0
+        self.max_active_connections = 0
+        self.lock = threading.Lock()
+
+    def listing(self, path):
+        # Return the HTML table of the files within a directory
+        names = sorted(
+            set(file_path[len(path):].split("/")[0] +
+                ("/" if "/" in file_path[len(path):] else "")
+                for file_path in self.files if file_path.startswith(path)))
+        rows = "\n".join(f'<tr><td><a href="{name}">{name}</a></td></tr>'
+                         for name in names)
+        return (
+            '<html><table id="indexlist">\n<tr><th><a href="?C=N;O=D">Name</a></th></tr>\n'
+            '<tr><td><a href="/cassini_orbiter/">Parent Directory</a></td></tr>\n'
+            f'{rows}\n</table></html>').encode()
+
+
+def _handler(stand_in):
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep connections alive between requests
+        disable_nagle_algorithm = True  # send headers and body without waiting for an ACK
+
+        def log_message(self, *args):
+            pass
+
+        def do_HEAD(self):
+            with stand_in.lock:
+                stand_in.head_requests.append(self.path)
+            if (self.path not in stand_in.files
+                    or self.path in stand_in.not_found_paths):
+                self.send_error(404)
+                return
+            body = stand_in.files[self.path]
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", f'"{hashlib.md5(body).hexdigest()}"')
+            self.end_headers()
+
+        def do_GET(self):
+            with stand_in.lock:
+                stand_in.requests.append(self.path)
+                stand_in.request_times.append(time.monotonic())
+                stand_in.client_ports.append(self.client_address[1])
+                stand_in.user_agents.append(self.headers.get("User-Agent"))
+                stand_in.active_connections += 1
+                stand_in.max_active_connections = max(
+                    stand_in.max_active_connections,
+                    stand_in.active_connections)
+            try:
+                time.sleep(stand_in.delay)
+                if self.path in stand_in.unavailable_paths:
+                    stand_in.unavailable_paths.remove(self.path)
+                    self.send_error(503)
+                    return
+                if self.path.endswith("/"):
+                    body = stand_in.listing(self.path)
+                elif (self.path in stand_in.files
+                      and self.path not in stand_in.not_found_paths):
+                    body = stand_in.files[self.path]
+                else:
+                    self.send_error(404)
+                    return
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    with stand_in.lock:
+                        stand_in.not_modified_requests.append(self.path)
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                range_header = self.headers.get("Range")
+                if range_header is not None:
+                    stand_in.range_requests.append((self.path, range_header))
+                    range_bytes = range_header.split("=")[1].split("-")
+                    range_start = int(range_bytes[0])
+                    if self.path in stand_in.misaligned_range_paths:
+                        range_start = 0
+                    range_end = len(body) - 1
+                    if range_bytes[1]:
+                        range_end = min(int(range_bytes[1]), range_end)
+                    if range_start >= len(body):
+                        self.send_error(416)
+                        return
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range",
+                        f"bytes {range_start}-{range_end}/{len(body)}")
+                    body = body[range_start:range_end + 1]
+                else:
+                    self.send_response(200)
+                if self.path in stand_in.files:
+                    self.send_header(
+                        "ETag",
+                        f'"{hashlib.md5(stand_in.files[self.path]).hexdigest()}"'
+                    )
+                if self.path in stand_in.chunked_paths:
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    if self.path in stand_in.truncate_paths:
+                        body = body[:len(body) // 2]
+                    self.wfile.write(f"{len(body):x}\r\n".encode() + body +
+                                     b"\r\n")
+                    if self.path in stand_in.truncate_paths:
+                        self.close_connection = True  # closed before the last chunk
+                        return
+                    self.wfile.write(b"0\r\n\r\n")
+                    return
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.path in stand_in.truncate_paths:
+                    self.wfile.write(body[:len(body) // 2])
+                    self.close_connection = True
+                    return
+                self.wfile.write(body)
+            finally:
+                with stand_in.lock:
+                    stand_in.active_connections -= 1
+
+    return _Handler
+
+
+@pytest.fixture
+def cassini_stand_in(monkeypatch, tmp_path):
+    coradr_path = "/cassini_orbiter/CORADR_0035_V03"
+    stand_in = _CassiniStandIn({
+        f"{coradr_path}/AAREADME.TXT":
+        b"AAREADME",
+        f"{coradr_path}/DATA/BIDR/BIBQI49N071_D035_T00AS01_V03.LBL":
+        b"LBL S01",
+        f"{coradr_path}/DATA/BIDR/BIBQI49N071_D035_T00AS01_V03.ZIP":
+        _zip_bytes("BIBQI49N071_D035_T00AS01_V03.IMG", b"IMG S01"),
+        f"{coradr_path}/DATA/BIDR/BIBQD49N071_D035_T00AS01_V03.LBL":
+        b"LBL S01 D",
+        f"{coradr_path}/DATA/BIDR/BIBQI49N071_D035_T00AS02_V03.LBL":
+        b"LBL S02",
+        f"{coradr_path}/DATA/SBDR/SBDR.FMT":
+        b"FMT",
+        f"{coradr_path}/DATA/SBDR/SBDR_10_D035_V03.TAB":
+        b"TAB",
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(stand_in))
+    server.daemon_threads = True
+    server_thread = threading.Thread(target=server.serve_forever,
+                                     kwargs={"poll_interval": 0.01},
+                                     daemon=True)
+    server_thread.start()
+    stand_in.url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(pydar.extract_flyby_parameters, "CASSINI_ORBITER_URL",
+                        f"{stand_in.url}/cassini_orbiter")
+    monkeypatch.setattr(pydar.downloader, "HTTP_BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_DIRECTORY",
+                        str(tmp_path / "download_cache"))
+    monkeypatch.setattr(pydar.directory_listing, "LISTING_CACHE_DIRECTORY",
+                        str(tmp_path / "listing_cache"))
+    pydar._reset_http_pool()
+    yield stand_in
+    pydar._reset_http_pool()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def coradr_0065_stand_in(cassini_stand_in, tmp_path, monkeypatch):
+    # Serve CORADR_0065_V03 (T8) with two resolutions of S01 and one resolution of S02
+    coradr_path = "/cassini_orbiter/CORADR_0065_V03"
+    for segment_num, resolution in [("S01", "I"), ("S01", "D"), ("S02", "I")]:
+        bidr_name = f"BIBQ{resolution}05S184_D065_T008{segment_num}_V03"
+        cassini_stand_in.files[
+            f"{coradr_path}/DATA/BIDR/{bidr_name}.LBL"] = f"LBL {bidr_name}".encode(
+            )
+        cassini_stand_in.files[
+            f"{coradr_path}/DATA/BIDR/{bidr_name}.ZIP"] = _zip_bytes(
+                f"{bidr_name}.IMG", f"IMG {bidr_name}".encode())
+    cassini_stand_in.files[f"{coradr_path}/AAREADME.TXT"] = b"AAREADME"
+    cassini_stand_in.files[f"{coradr_path}/DATA/SBDR/SBDR.FMT"] = b"FMT"
+    cassini_stand_in.files[
+        f"{coradr_path}/DATA/SBDR/SBDR_15_D065_V03.TAB"] = b"TAB"
+    monkeypatch.chdir(tmp_path)
+    return cassini_stand_in
+
+
+@pytest.fixture
+def catalog_directory(tmp_path, monkeypatch):
+    # Copy of the bundled data/ CSV files for the catalog to read and write
+    catalog_directory = str(tmp_path / "data")
+    shutil.copytree(pydar.catalog.CATALOG_DIRECTORY, catalog_directory)
+    monkeypatch.setattr(pydar.catalog, "CATALOG_DIRECTORY", catalog_directory)
+    pydar._clear_catalog_cache()
+    yield catalog_directory
+    pydar._clear_catalog_cache()
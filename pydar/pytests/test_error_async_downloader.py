@@ -0,0 +1,345 @@
+# Test Expected Error Messages from async_downloader.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_async_downloader.py
+
+# Standard Library Imports
+import asyncio
+import os
+import re
+from urllib import error
+
+# Related Third Party Imports
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.async_downloader
+import pydar.downloader
+
+requires_aiohttp = pytest.mark.skipif(pydar.async_downloader.aiohttp is None,
+                                      reason="requires aiohttp (pydar[async])")
+
+
+def _file_requests(stand_in):
+    # Return the requests for files (without directory listings)
+    return [path for path in stand_in.requests if not path.endswith("/")]
+
+
+def _arun_with_session(async_function, **kwargs):
+    # Run an async function with the client session of a single call
+    async def _arun():
+        async with pydar._ahttp_session() as session:
+            return await async_function(session=session, **kwargs)
+
+    return asyncio.run(_arun())
+
+
+## _aread_url() #################################
+@requires_aiohttp
+def test_areadURL_verifyPooledConnectionAndUserAgent(cassini_stand_in):
+
+    async def _aread_files():
+        async with pydar._ahttp_session() as session:
+            return [
+                await pydar._aread_url(
+                    session=session,
+                    url=f"{cassini_stand_in.url}/files/file_{i}.LBL")
+                for i in range(5)
+            ]
+
+    for i in range(5):
+        cassini_stand_in.files[f"/files/file_{i}.LBL"] = f"label {i}".encode()
+    assert asyncio.run(
+        _aread_files()) == [f"label {i}".encode() for i in range(5)]
+    assert len(set(cassini_stand_in.client_ports)) == 1
+    assert set(
+        cassini_stand_in.user_agents) == {pydar.downloader.HTTP_USER_AGENT}
+
+
+@requires_aiohttp
+def test_areadURL_verifyRetryUnavailable(cassini_stand_in):
+    cassini_stand_in.files["/files/file.LBL"] = b"label"
+    cassini_stand_in.unavailable_paths.add("/files/file.LBL")
+    assert _arun_with_session(
+        pydar._aread_url,
+        url=f"{cassini_stand_in.url}/files/file.LBL") == b"label"
+    assert cassini_stand_in.requests == ["/files/file.LBL", "/files/file.LBL"]
+
+
+@requires_aiohttp
+def test_areadURL_invalidURL(cassini_stand_in):
+    missing_url = f"{cassini_stand_in.url}/files/missing.LBL"
+    with pytest.raises(
+            error.HTTPError,
+            match=re.escape(
+                f"Unable to access: {missing_url}\nError (and exiting): '404'")
+    ):
+        _arun_with_session(pydar._aread_url, url=missing_url)
+
+
+@requires_aiohttp
+def test_areadURL_unreachableHost(monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "HTTP_BACKOFF_FACTOR", 0)
+    with pytest.raises(
+            error.URLError,
+            match=re.escape("Unable to access: http://127.0.0.1:9/file.LBL")):
+        _arun_with_session(pydar._aread_url, url="http://127.0.0.1:9/file.LBL")
+
+
+## _aread_url() #################################
+
+
+## _adownload_files() #################################
+@requires_aiohttp
+def test_adownloadFiles_verifyConcurrentDownloads(cassini_stand_in, tmp_path):
+    cassini_stand_in.delay = 0.05
+    for i in range(8):
+        cassini_stand_in.files[f"/files/file_{i}.TAB"] = f"file {i}".encode()
+    download_jobs = [(f"{cassini_stand_in.url}/files/file_{i}.TAB",
+                      str(tmp_path / f"file_{i}.TAB")) for i in range(8)]
+    downloaded_files = _arun_with_session(pydar._adownload_files,
+                                          download_jobs=download_jobs,
+                                          max_workers=4,
+                                          max_connections_per_host=2)
+    assert downloaded_files == [file_path for _, file_path in download_jobs]
+    for i in range(8):
+        with open(tmp_path / f"file_{i}.TAB", "rb") as downloaded_file:
+            assert downloaded_file.read() == f"file {i}".encode()
+    assert cassini_stand_in.max_active_connections == 2
+
+
+@requires_aiohttp
+def test_adownloadFiles_invalidURL(cassini_stand_in, tmp_path):
+    missing_url = f"{cassini_stand_in.url}/files/missing.TAB"
+    with pytest.raises(
+            error.HTTPError,
+            match=re.escape(
+                f"Unable to access: {missing_url}\nError (and exiting): '404'")
+    ):
+        _arun_with_session(pydar._adownload_files,
+                           download_jobs=[(missing_url,
+                                           str(tmp_path / "missing.TAB"))])
+    assert not os.path.exists(tmp_path / "missing.TAB")
+
+
+@requires_aiohttp
+def test_adownloadFile_verifyResumeFromPartFile(cassini_stand_in, tmp_path):
+    file_bytes = bytes(range(256)) * 64
+    cassini_stand_in.files["/files/large.ZIP"] = file_bytes
+    cassini_stand_in.truncate_paths.add("/files/large.ZIP")
+    file_url = f"{cassini_stand_in.url}/files/large.ZIP"
+    file_path = str(tmp_path / "large.ZIP")
+    with pytest.raises(
+            error.ContentTooShortError,
+            match=re.escape(
+                f"Incomplete download: {file_url}\nRetrieved {len(file_bytes) // 2} of {len(file_bytes)} bytes"
+            )):
+        _arun_with_session(pydar._adownload_file,
+                           url=file_url,
+                           file_path=file_path)
+    assert os.path.getsize(f"{file_path}.part") == len(file_bytes) // 2
+
+    cassini_stand_in.truncate_paths.clear()
+    assert _arun_with_session(pydar._adownload_file,
+                              url=file_url,
+                              file_path=file_path) == file_path
+    assert cassini_stand_in.range_requests == [
+        ("/files/large.ZIP", f"bytes={len(file_bytes) // 2}-")
+    ]
+    with open(file_path, "rb") as downloaded_file:
+        assert downloaded_file.read() == file_bytes
+
+
+@requires_aiohttp
+def test_adownloadFile_verifyChunkedTruncationKeepsPartFile(
+        cassini_stand_in, tmp_path):
+    file_bytes = bytes(range(256)) * 64
+    cassini_stand_in.files["/files/large.ZIP"] = file_bytes
+    cassini_stand_in.chunked_paths.add("/files/large.ZIP")
+    cassini_stand_in.truncate_paths.add("/files/large.ZIP")
+    file_url = f"{cassini_stand_in.url}/files/large.ZIP"
+    file_path = str(tmp_path / "large.ZIP")
+    with pytest.raises(
+            error.ContentTooShortError,
+            match=re.escape(
+                f"Incomplete download: {file_url}\nConnection closed after {len(file_bytes) // 2} bytes"
+            )):
+        _arun_with_session(pydar._adownload_file,
+                           url=file_url,
+                           file_path=file_path)
+    assert not os.path.exists(file_path)
+    assert os.path.getsize(f"{file_path}.part") == len(file_bytes) // 2
+
+    cassini_stand_in.truncate_paths.clear()
+    assert _arun_with_session(pydar._adownload_file,
+                              url=file_url,
+                              file_path=file_path) == file_path
+    with open(file_path, "rb") as downloaded_file:
+        assert downloaded_file.read() == file_bytes
+
+
+@requires_aiohttp
+def test_adownloadFile_restartWhenRangeMisaligned(cassini_stand_in, tmp_path):
+    file_bytes = bytes(range(256)) * 64
+    cassini_stand_in.files["/files/large.ZIP"] = file_bytes
+    cassini_stand_in.misaligned_range_paths.add("/files/large.ZIP")
+    file_path = str(tmp_path / "large.ZIP")
+    with open(f"{file_path}.part", "wb") as part_file:
+        part_file.write(file_bytes[:len(file_bytes) // 2])
+    _arun_with_session(pydar._adownload_file,
+                       url=f"{cassini_stand_in.url}/files/large.ZIP",
+                       file_path=file_path)
+    with open(file_path, "rb") as downloaded_file:
+        assert downloaded_file.read() == file_bytes
+    assert len(cassini_stand_in.range_requests) == 1
+
+
+@requires_aiohttp
+def test_adownloadFile_verifyDownloadEvents(cassini_stand_in, tmp_path,
+                                            monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+    download_events = []
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_PROGRESS_HOOK",
+                        download_events.append)
+    file_bytes = bytes(range(256)) * 16
+    cassini_stand_in.files["/files/file.TAB"] = file_bytes
+    cassini_stand_in.unavailable_paths.add("/files/file.TAB")
+    for results_directory in ["S01", "S02"]:
+        _arun_with_session(pydar._adownload_cached_file,
+                           url=f"{cassini_stand_in.url}/files/file.TAB",
+                           file_path=str(tmp_path /
+                                         f"{results_directory}_file.TAB"))
+    assert download_events[-3]["event"] == "progress"
+    assert download_events[-3]["bytes_downloaded"] == len(file_bytes)
+    assert download_events[-2]["event"] == "download"
+    assert download_events[-2]["bytes_transferred"] == len(file_bytes)
+    assert download_events[-2]["retries"] == 1
+    assert download_events[-1]["event"] == "cache_hit"
+
+
+## _adownload_files() #################################
+
+
+## aextract_flyby_images() #################################
+@requires_aiohttp
+def test_aextractFlybyImages_verifySameResultsAsExtractFlybyImages(
+        coradr_0065_stand_in):
+    asyncio.run(
+        pydar.aextract_flyby_images(flyby_id="T8",
+                                    segment_num="S01",
+                                    top_x_resolutions=4))
+    async_results = sorted(os.listdir("pydar_results/CORADR_0065_V03_S01"))
+    async_manifest = pydar._read_manifest("pydar_results/CORADR_0065_V03_S01")
+    assert async_results == [
+        "AAREADME.TXT", "BIBQD05S184_D065_T008S01_V03.IMG",
+        "BIBQD05S184_D065_T008S01_V03.LBL", "BIBQD05S184_D065_T008S01_V03.zip",
+        "BIBQI05S184_D065_T008S01_V03.IMG", "BIBQI05S184_D065_T008S01_V03.LBL",
+        "BIBQI05S184_D065_T008S01_V03.zip", "SBDR.FMT", "SBDR_15_D065_V03.TAB",
+        "pydar_manifest.json"
+    ]
+    with open(
+            "pydar_results/CORADR_0065_V03_S01/BIBQI05S184_D065_T008S01_V03.IMG",
+            "rb") as image_file:
+        assert image_file.read() == b"IMG BIBQI05S184_D065_T008S01_V03"
+
+    os.rename("pydar_results", "pydar_results_async")
+    pydar.extract_flyby_images(flyby_id="T8",
+                               segment_num="S01",
+                               top_x_resolutions=4)
+    assert sorted(
+        os.listdir("pydar_results/CORADR_0065_V03_S01")) == async_results
+    manifest = pydar._read_manifest("pydar_results/CORADR_0065_V03_S01")
+    for manifest_entries in [manifest, async_manifest]:
+        for manifest_entry in manifest_entries.values():
+            del manifest_entry["mtime_ns"]
+    assert manifest == async_manifest
+
+
+@requires_aiohttp
+def test_aextractFlybyImages_verifyRepeatedDownloadSkipped(
+        coradr_0065_stand_in):
+    for _ in range(2):
+        asyncio.run(
+            pydar.aextract_flyby_images(flyby_observation_num="65",
+                                        segment_num="S01"))
+    file_requests = _file_requests(coradr_0065_stand_in)
+    assert len(file_requests) == 5
+    assert sorted(file_requests) == sorted(set(file_requests))
+
+
+@requires_aiohttp
+def test_aextractFlybyImages_verifyManifestCheckedOffEventLoop(
+        coradr_0065_stand_in, monkeypatch):
+    asyncio.run(
+        pydar.aextract_flyby_images(flyby_observation_num="65",
+                                    segment_num="S01"))
+    pending_download_jobs = pydar.extract_flyby_parameters._pending_download_jobs
+    manifest_checks = []
+
+    def _pending_download_jobs(*args):
+        try:
+            asyncio.get_running_loop()
+            manifest_checks.append("event loop")
+        except RuntimeError:
+            manifest_checks.append("thread")
+        return pending_download_jobs(*args)
+
+    monkeypatch.setattr(pydar.extract_flyby_parameters,
+                        "_pending_download_jobs", _pending_download_jobs)
+    coradr_0065_stand_in.head_requests.clear()
+    asyncio.run(
+        pydar.aextract_flyby_images(flyby_observation_num="65",
+                                    segment_num="S01"))
+    assert manifest_checks == ["thread"]
+    # each file is revalidated against the server once
+    assert sorted(coradr_0065_stand_in.head_requests) == sorted(
+        set(coradr_0065_stand_in.head_requests))
+    assert len(coradr_0065_stand_in.head_requests) == 5
+
+
+@requires_aiohttp
+def test_aextractFlybyImages_verifyConcurrentFlybys(coradr_0065_stand_in,
+                                                    monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+
+    async def _aextract_segments():
+        await asyncio.gather(
+            pydar.aextract_flyby_images(flyby_id="T8", segment_num="S01"),
+            pydar.aextract_flyby_images(flyby_id="T8", segment_num="S02"))
+
+    coradr_0065_stand_in.delay = 0.02
+    asyncio.run(_aextract_segments())
+    for segment_num in ["S01", "S02"]:
+        assert f"BIBQI05S184_D065_T008{segment_num}_V03.IMG" in os.listdir(
+            f"pydar_results/CORADR_0065_V03_{segment_num}")
+
+    # AAREADME and SBDR files shared by S01 and S02 are downloaded once
+    file_requests = _file_requests(coradr_0065_stand_in)
+    assert len(file_requests) == 7
+    assert sorted(file_requests) == sorted(set(file_requests))
+
+
+def test_aextractFlybyImages_aiohttpNotInstalled(coradr_0065_stand_in,
+                                                 monkeypatch):
+    monkeypatch.setattr(pydar.async_downloader, "aiohttp", None)
+    with pytest.raises(
+            ImportError,
+            match=re.escape(
+                "aextract_flyby_images() requires aiohttp, install with: pip install pydar[async]"
+            )):
+        asyncio.run(
+            pydar.aextract_flyby_images(flyby_id="T8", segment_num="S01"))
+    assert coradr_0065_stand_in.requests == []
+
+
+def test_aextractFlybyImages_notAvailableSegmentNum():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[segment_num]: 'S10' not an available segment options: '{list(pydar._return_segment_options())}'"
+            )):
+        asyncio.run(
+            pydar.aextract_flyby_images(flyby_id="T8", segment_num="S10"))
+
+
+## aextract_flyby_images() #################################
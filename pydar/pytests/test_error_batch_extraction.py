@@ -0,0 +1,162 @@
+# Test Expected Error Messages from batch_extraction.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_batch_extraction.py
+
+# Standard Library Imports
+import os
+import re
+
+# Related Third Party Imports
+import pandas as pd
+import pytest
+
+# Internal Local Imports
+import pydar
+
+
+def _file_requests(stand_in):
+    # Return the requests for files (without directory listings)
+    return [path for path in stand_in.requests if not path.endswith("/")]
+
+
+## extract_many() #################################
+def test_extractMany_verifySharedFilesDownloadedOnce(coradr_0065_stand_in):
+    extract_report = pydar.extract_many(requests=[("0065", "S01", "I"),
+                                                  ("T8", "S01", "I"),
+                                                  ("65", "S01", "D"),
+                                                  ("T8", "S02")],
+                                        max_workers=3)
+    assert list(extract_report["segment_num"]) == ["S01", "S01", "S02"]
+    assert list(extract_report["resolution"]) == ["I", "D", "I"]
+    assert list(extract_report["status"]) == ["complete"] * 3
+    assert list(extract_report["files_extracted"]) == [1, 1, 1]
+    assert list(extract_report["results_directory"]) == [
+        "pydar_results/CORADR_0065_V03_S01",
+        "pydar_results/CORADR_0065_V03_S01",
+        "pydar_results/CORADR_0065_V03_S02"
+    ]
+    assert extract_report["error"].isna().all()
+    assert (extract_report["duration_seconds"] > 0).all()
+    assert extract_report["bytes_downloaded"].sum() > 0
+
+    # AAREADME and SBDR files shared by S01 and S02 are downloaded once
+    file_requests = _file_requests(coradr_0065_stand_in)
+    assert sorted(file_requests) == sorted(set(file_requests))
+    assert len(file_requests) == 9
+    assert sorted(os.listdir("pydar_results/CORADR_0065_V03_S02")) == [
+        "AAREADME.TXT", "BIBQI05S184_D065_T008S02_V03.IMG",
+        "BIBQI05S184_D065_T008S02_V03.LBL", "BIBQI05S184_D065_T008S02_V03.zip",
+        "SBDR.FMT", "SBDR_15_D065_V03.TAB", "pydar_manifest.json"
+    ]
+    with open("pydar_results/CORADR_0065_V03_S01/SBDR.FMT", "rb") as sbdr_file:
+        assert sbdr_file.read() == b"FMT"
+
+
+def test_extractMany_verifyRepeatedExtractSkipped(coradr_0065_stand_in):
+    requests = pd.DataFrame({
+        "flyby": ["T8", "T8"],
+        "segment": ["S01", "S02"],
+        "resolution": ["I", "I"]
+    })
+    pydar.extract_many(requests=requests)
+    coradr_0065_stand_in.requests.clear()
+    extract_report = pydar.extract_many(requests=requests)
+    assert _file_requests(coradr_0065_stand_in) == []
+    assert list(extract_report["files_downloaded"]) == [0, 0]
+    assert list(extract_report["files_skipped"]) == [5, 5]
+    assert list(extract_report["bytes_downloaded"]) == [0, 0]
+
+
+def test_extractMany_verifyFailedJobReported(coradr_0065_stand_in):
+    extract_report = pydar.extract_many(requests=[("T8", "S01",
+                                                   "B"), ("T8", "S01", "I")])
+    assert list(extract_report["status"]) == ["failed", "complete"]
+    assert extract_report["error"][0].startswith(
+        "No BIDR files found with resolution, segment, and flyby identification"
+    )
+    assert os.path.exists(
+        "pydar_results/CORADR_0065_V03_S01/BIBQI05S184_D065_T008S01_V03.IMG")
+
+
+def test_extractMany_verifyFailedDownloadReported(coradr_0065_stand_in):
+    coradr_0065_stand_in.not_found_paths.add(
+        "/cassini_orbiter/CORADR_0065_V03/DATA/BIDR/BIBQD05S184_D065_T008S01_V03.ZIP"
+    )
+    extract_report = pydar.extract_many(requests=[("T8", "S01",
+                                                   "D"), ("T8", "S02", "I")])
+    assert list(extract_report["status"]) == ["failed", "complete"]
+    assert "Error (and exiting): '404'" in extract_report["error"][0]
+
+
+def test_extractMany_requestsRequired():
+    with pytest.raises(ValueError,
+                       match=re.escape("[requests]: requests is required")):
+        pydar.extract_many()
+
+
+def test_extractMany_requestsInvalidTypes():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[requests]: Must be a list or pd.DataFrame, current type = '<class 'tuple'>'"
+            )):
+        pydar.extract_many(requests=("T8", "S01", "I"))
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[requests]: Each request must be a tuple of (flyby, segment) or (flyby, segment, resolution), invalid at request index 1"
+            )):
+        pydar.extract_many(requests=[("T8", "S01"), "T8"])
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[requests]: Requires the columns ['flyby', 'segment'] (and optional 'resolution'), current columns = ['flyby_id', 'segment']"
+            )):
+        pydar.extract_many(requests=pd.DataFrame({
+            "flyby_id": ["T8"],
+            "segment": ["S01"]
+        }))
+    with pytest.raises(
+            ValueError,
+            match=re.escape("[requests]: Requires at least one request")):
+        pydar.extract_many(requests=[])
+
+
+def test_extractMany_requestsInvalidFlyby():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[requests]: flyby must be a str, current type = '<class 'int'>' at request index 0"
+            )):
+        pydar.extract_many(requests=[(65, "S01", "I")])
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[requests]: Invalid request at request index 1\n[resolution]: resolution 'Z' must be a valid resolution type in ['B', 'D', 'F', 'H', 'I']"
+            )):
+        pydar.extract_many(requests=[("T8", "S01", "I"), ("T8", "S01", "Z")])
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[requests]: Invalid request at request index 0\n[flyby_id]: 'T1000' not in available ids options"
+            )):
+        pydar.extract_many(requests=[("T1000", "S01")])
+
+
+def test_extractMany_maxWorkersInvalid():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[max_workers]: Must be a int, current type = '<class 'str'>'")
+    ):
+        pydar.extract_many(requests=[("T8", "S01")], max_workers="4")
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[max_connections_per_host]: Must be greater than or equal to 1, not '0'"
+            )):
+        pydar.extract_many(requests=[("T8", "S01")],
+                           max_connections_per_host=0)
+
+
+## extract_many() #################################
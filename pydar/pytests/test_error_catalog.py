@@ -0,0 +1,108 @@
+# Test Expected Error Messages from catalog.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_catalog.py
+
+# Standard Library Imports
+import os
+import re
+import shutil
+
+# Related Third Party Imports
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.catalog
+
+## _read_catalog_csv() #################################
+
+## _clear_catalog_cache() #################################
+
+
+def test_clearCatalogCache_verifyOnlyNamedCSVCleared():
+    flyby_lookup = pydar._retrieve_flyby_lookup()
+    segment_options = pydar._return_segment_options()
+    pydar._clear_catalog_cache("cassini_flyby.csv")
+    assert pydar._retrieve_flyby_lookup() is not flyby_lookup
+    assert pydar._retrieve_flyby_lookup() == flyby_lookup
+    assert pydar._return_segment_options() is segment_options
+
+
+## _clear_catalog_cache() #################################
+def test_readCatalogCSV_invalidCSVName():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[csv_name]: 'unknown.csv' not in available catalog files {list(pydar.catalog.CATALOG_DTYPES.keys())}"
+            )):
+        pydar._read_catalog_csv("unknown.csv")
+
+
+def test_readCatalogCSV_verifyCachedDataframe():
+    first_read = pydar._read_catalog_csv("cassini_flyby.csv")
+    second_read = pydar._read_catalog_csv("cassini_flyby.csv")
+    assert first_read is second_read
+    assert str(first_read["Titan flyby id"].iloc[0]) == "Ta"
+
+
+def test_readCatalogCSV_verifyReloadWhenModified(tmp_path, monkeypatch):
+    shutil.copy(pydar.catalog._catalog_csv_path("cassini_flyby.csv"),
+                tmp_path / "cassini_flyby.csv")
+    monkeypatch.setattr(
+        pydar.catalog,
+        "_catalog_csv_path",
+        lambda csv_name, catalog_directory=None: str(tmp_path / csv_name))
+    pydar._clear_catalog_cache()
+    try:
+        first_read = pydar._read_catalog_csv("cassini_flyby.csv")
+        with open(tmp_path / "cassini_flyby.csv", "a") as csv_file:
+            csv_file.write("T200,DTN 999,S99,Rev 999\n")
+        csv_stat = os.stat(tmp_path / "cassini_flyby.csv")
+        os.utime(tmp_path / "cassini_flyby.csv",
+                 ns=(csv_stat.st_atime_ns, csv_stat.st_mtime_ns + 10**9))
+        second_read = pydar._read_catalog_csv("cassini_flyby.csv")
+        assert second_read is not first_read
+        assert len(second_read) == len(first_read) + 1
+    finally:
+        pydar._clear_catalog_cache()
+
+
+## _read_catalog_csv() #################################
+
+## _write_catalog_csv() #################################
+
+
+def test_writeCatalogCSV_verifyReplacedAndReloaded(tmp_path, monkeypatch):
+    shutil.copy(pydar.catalog._catalog_csv_path("cassini_flyby.csv"),
+                tmp_path / "cassini_flyby.csv")
+    monkeypatch.setattr(
+        pydar.catalog,
+        "_catalog_csv_path",
+        lambda csv_name, catalog_directory=None: str(tmp_path / csv_name))
+    pydar._clear_catalog_cache()
+    try:
+        first_read = pydar._read_catalog_csv("cassini_flyby.csv")
+        pydar._write_catalog_csv("cassini_flyby.csv", first_read.head(3))
+        assert os.listdir(tmp_path) == ["cassini_flyby.csv"]
+        second_read = pydar._read_catalog_csv("cassini_flyby.csv")
+        assert second_read is not first_read
+        assert second_read.equals(first_read.head(3))
+    finally:
+        pydar._clear_catalog_cache()
+
+
+## _write_catalog_csv() #################################
+
+## _clear_catalog_cache() #################################
+
+
+def test_clearCatalogCache_verifyOnlyNamedCSVCleared():
+    flyby_lookup = pydar._retrieve_flyby_lookup()
+    segment_options = pydar._return_segment_options()
+    pydar._clear_catalog_cache("cassini_flyby.csv")
+    assert pydar._retrieve_flyby_lookup() is not flyby_lookup
+    assert pydar._retrieve_flyby_lookup() == flyby_lookup
+    assert pydar._return_segment_options() is segment_options
+
+
+## _clear_catalog_cache() #################################
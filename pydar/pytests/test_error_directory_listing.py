@@ -0,0 +1,125 @@
+# Test Expected Error Messages from directory_listing.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_directory_listing.py
+
+# Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import re
+
+# Related Third Party Imports
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.directory_listing
+
+
+## _parse_directory_listing() #################################
+def test_parseDirectoryListing_verifyFilenames():
+    listing_html = b'''<html><table id="indexlist">
+<tr><th><a href="?C=N;O=D">Name</a></th><th><a href="?C=M;O=A">Last modified</a></th></tr>
+<tr><td valign="top"><img src="/icons/back.gif" alt="[PARENTDIR]"></td><td><a href="/img/data/cassini/cassini_orbiter/CORADR_0035_V03/DATA/">Parent Directory</a></td></tr>
+<tr><td valign="top"><img src="/icons/unknown.gif" alt="[   ]"></td><td><a href="BIBQI49N071_D035_T00AS01_V03.LBL">BIBQI49N071_D035_T00AS01_V03.LBL</a></td><td align="right">2008-05-14 12:00  </td><td align="right"> 16K</td></tr>
+<tr><td valign="top"><img src="/icons/compressed.gif" alt="[   ]"></td><td><a href="BIBQI49N071_D035_T00AS01_V03.ZIP">BIBQI49N071_D035_T00AS01_V03.ZIP</a></td><td align="right">2008-05-14 12:00  </td><td align="right">120M</td></tr>
+<tr><td valign="top"><img src="/icons/folder.gif" alt="[DIR]"></td><td><a href="EXTRAS/">EXTRAS/</a></td></tr>
+</table><a href="https://pds.nasa.gov">PDS</a></html>'''
+    assert pydar._parse_directory_listing(listing_html) == [
+        "BIBQI49N071_D035_T00AS01_V03.LBL", "BIBQI49N071_D035_T00AS01_V03.ZIP",
+        "EXTRAS/"
+    ]
+
+
+def test_parseDirectoryListing_noIndexlistTable():
+    assert pydar._parse_directory_listing(
+        b"<html><body>Not Found</body></html>") is None
+
+
+## _parse_directory_listing() #################################
+
+
+## _read_directory_listing() #################################
+def test_readDirectoryListing_verifyCachedWithinTTL(cassini_stand_in):
+    listing_url = f"{cassini_stand_in.url}/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/"
+    for _ in range(3):
+        assert pydar._read_directory_listing(listing_url) == [
+            "SBDR.FMT", "SBDR_10_D035_V03.TAB"
+        ]
+    assert cassini_stand_in.requests == [
+        "/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/"
+    ]
+    with open(pydar.directory_listing._listing_cache_path(listing_url),
+              "r") as listing_file:
+        assert json.load(listing_file)["filenames"] == [
+            "SBDR.FMT", "SBDR_10_D035_V03.TAB"
+        ]
+
+
+def test_readDirectoryListing_verifyRetrievedAfterTTL(cassini_stand_in):
+    listing_url = f"{cassini_stand_in.url}/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/"
+    pydar._read_directory_listing(listing_url)
+    cassini_stand_in.files[
+        "/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/SBDR_20_D035_V03.TAB"] = b"TAB"
+    assert pydar._read_directory_listing(listing_url, ttl=0) == [
+        "SBDR.FMT", "SBDR_10_D035_V03.TAB", "SBDR_20_D035_V03.TAB"
+    ]
+
+    # expired listings are retrieved again
+    cache_path = pydar.directory_listing._listing_cache_path(listing_url)
+    with open(cache_path, "r") as listing_file:
+        cached_listing = json.load(listing_file)
+    cached_listing["retrieved"] -= pydar.directory_listing.LISTING_CACHE_TTL
+    with open(cache_path, "w") as listing_file:
+        json.dump(cached_listing, listing_file)
+    pydar._read_directory_listing(listing_url)
+    assert len(cassini_stand_in.requests) == 3
+
+
+def test_readDirectoryListing_verifyConcurrentReadsRetrievedOnce(
+        cassini_stand_in):
+    cassini_stand_in.delay = 0.05
+    listing_url = f"{cassini_stand_in.url}/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/"
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        listings = list(
+            executor.map(pydar._read_directory_listing, [listing_url] * 8))
+    assert listings == [["SBDR.FMT", "SBDR_10_D035_V03.TAB"]] * 8
+    assert cassini_stand_in.requests == [
+        "/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/"
+    ]
+
+
+def test_readDirectoryListing_invalidListing(cassini_stand_in):
+    cassini_stand_in.files["/files/index.html"] = b"<html>Not Found</html>"
+    listing_url = f"{cassini_stand_in.url}/files/index.html"
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"Unable to find a directory listing at: {listing_url}")):
+        pydar._read_directory_listing(listing_url)
+    assert not os.path.exists(
+        pydar.directory_listing._listing_cache_path(listing_url))
+
+
+## _read_directory_listing() #################################
+
+
+## _prefetch_directory_listings() #################################
+def test_prefetchDirectoryListings_verifyListingsNotRetrievedAgain(
+        cassini_stand_in):
+    coradr_dataframe = pydar._read_catalog_csv("coradr_jpl_options.csv")
+    assert pydar._prefetch_directory_listings(
+        cassini_orbiter_url=f"{cassini_stand_in.url}/cassini_orbiter",
+        max_workers=4) == coradr_dataframe["Contains BIDR"].sum(
+        ) + coradr_dataframe["Contains SBDR"].sum()
+
+    cassini_stand_in.requests.clear()
+    for coradr_id in ["CORADR_0035", "CORADR_0065_V03"]:
+        for data_type in ["BIDR", "SBDR"]:
+            pydar._read_directory_listing(
+                f"{cassini_stand_in.url}/cassini_orbiter/{coradr_id}/DATA/{data_type}/"
+            )
+    assert cassini_stand_in.requests == []
+
+
+## _prefetch_directory_listings() #################################
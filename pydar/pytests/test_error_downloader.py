@@ -0,0 +1,629 @@
+# Test Expected Error Messages from downloader.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_downloader.py
+
+# Standard Library Imports
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+from urllib import error
+import zipfile
+
+# Related Third Party Imports
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.downloader
+import pydar.extract_flyby_parameters
+
+
+## _read_url() #################################
+def test_readURL_verifyPooledConnectionAndUserAgent(cassini_stand_in):
+    for i in range(5):
+        cassini_stand_in.files[f"/files/file_{i}.LBL"] = f"label {i}".encode()
+        assert pydar._read_url(f"{cassini_stand_in.url}/files/file_{i}.LBL"
+                               ) == f"label {i}".encode()
+    assert len(set(cassini_stand_in.client_ports)) == 1
+    assert set(
+        cassini_stand_in.user_agents) == {pydar.downloader.HTTP_USER_AGENT}
+
+
+def test_readURL_verifyRetryUnavailable(cassini_stand_in):
+    cassini_stand_in.files["/files/file.LBL"] = b"label"
+    cassini_stand_in.unavailable_paths.add("/files/file.LBL")
+    assert pydar._read_url(
+        f"{cassini_stand_in.url}/files/file.LBL") == b"label"
+    assert cassini_stand_in.requests == ["/files/file.LBL", "/files/file.LBL"]
+
+
+def test_readURL_verifyProxyFromEnvironment(cassini_stand_in, monkeypatch):
+    for proxy_variable in ["http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"]:
+        monkeypatch.delenv(proxy_variable, raising=False)
+    monkeypatch.setenv("http_proxy", cassini_stand_in.url)
+    # a proxy receives the full URL in the request line
+    cassini_stand_in.files["http://pydar.invalid/files/file.LBL"] = b"label"
+    assert pydar._read_url("http://pydar.invalid/files/file.LBL") == b"label"
+    assert cassini_stand_in.requests == ["http://pydar.invalid/files/file.LBL"]
+    assert cassini_stand_in.user_agents == [pydar.downloader.HTTP_USER_AGENT]
+
+
+def test_readURL_invalidURL(cassini_stand_in):
+    missing_url = f"{cassini_stand_in.url}/files/missing.LBL"
+    with pytest.raises(
+            error.HTTPError,
+            match=re.escape(
+                f"Unable to access: {missing_url}\nError (and exiting): '404'")
+    ):
+        pydar._read_url(missing_url)
+
+
+## _read_url() #################################
+
+
+## _read_url_head() #################################
+def test_readURLHead_verifyRangeRequest(cassini_stand_in):
+    cassini_stand_in.files["/files/file.LBL"] = b"0123456789" * 10
+    assert pydar._read_url_head(f"{cassini_stand_in.url}/files/file.LBL",
+                                16) == (b"0123456789012345", False)
+    assert cassini_stand_in.range_requests == [("/files/file.LBL",
+                                                "bytes=0-15")]
+    assert cassini_stand_in.user_agents == [pydar.downloader.HTTP_USER_AGENT]
+
+
+@pytest.mark.parametrize("file_bytes", [(b"0123456789"), (b"0123"), (b"")])
+def test_readURLHead_verifyFullContents(cassini_stand_in, file_bytes):
+    cassini_stand_in.files["/files/file.LBL"] = file_bytes
+    assert pydar._read_url_head(f"{cassini_stand_in.url}/files/file.LBL",
+                                10) == (file_bytes, True)
+
+
+def test_readURLHead_invalidURL(cassini_stand_in):
+    missing_url = f"{cassini_stand_in.url}/files/missing.LBL"
+    with pytest.raises(
+            error.HTTPError,
+            match=re.escape(
+                f"Unable to access: {missing_url}\nError (and exiting): '404'")
+    ):
+        pydar._read_url_head(missing_url, 10)
+
+
+## _read_url_head() #################################
+
+
+## _download_files() #################################
+def test_downloadFiles_verifyConcurrentDownloads(cassini_stand_in, tmp_path):
+    cassini_stand_in.delay = 0.05
+    for i in range(8):
+        cassini_stand_in.files[f"/files/file_{i}.TAB"] = f"file {i}".encode()
+    download_jobs = [(f"{cassini_stand_in.url}/files/file_{i}.TAB",
+                      str(tmp_path / f"file_{i}.TAB")) for i in range(8)]
+    downloaded_files = pydar._download_files(download_jobs=download_jobs,
+                                             max_workers=4,
+                                             max_connections_per_host=2)
+    assert downloaded_files == [file_path for _, file_path in download_jobs]
+    for i in range(8):
+        with open(tmp_path / f"file_{i}.TAB", "rb") as downloaded_file:
+            assert downloaded_file.read() == f"file {i}".encode()
+    assert cassini_stand_in.max_active_connections == 2
+
+
+def test_downloadFiles_repeatedFilePathDownloadedOnce(cassini_stand_in,
+                                                      tmp_path):
+    cassini_stand_in.files["/files/file.TAB"] = b"file"
+    download_jobs = [
+        (f"{cassini_stand_in.url}/files/file.TAB", str(tmp_path / "file.TAB"))
+    ] * 3
+    downloaded_files = pydar._download_files(download_jobs=download_jobs)
+    assert downloaded_files == [str(tmp_path / "file.TAB")]
+    assert cassini_stand_in.requests == ["/files/file.TAB"]
+
+
+def test_downloadFiles_invalidURL(cassini_stand_in, tmp_path):
+    missing_url = f"{cassini_stand_in.url}/files/missing.TAB"
+    with pytest.raises(
+            error.HTTPError,
+            match=re.escape(
+                f"Unable to access: {missing_url}\nError (and exiting): '404'")
+    ):
+        pydar._download_files(download_jobs=[(missing_url,
+                                              str(tmp_path / "missing.TAB"))])
+    assert not os.path.exists(tmp_path / "missing.TAB")
+
+
+def test_downloadFile_verifyResumeFromPartFile(cassini_stand_in, tmp_path):
+    file_bytes = bytes(range(256)) * 64
+    cassini_stand_in.files["/files/large.ZIP"] = file_bytes
+    cassini_stand_in.truncate_paths.add("/files/large.ZIP")
+    file_url = f"{cassini_stand_in.url}/files/large.ZIP"
+    file_path = str(tmp_path / "large.ZIP")
+    with pytest.raises(
+            error.ContentTooShortError,
+            match=re.escape(
+                f"Incomplete download: {file_url}\nRetrieved {len(file_bytes) // 2} of {len(file_bytes)} bytes"
+            )):
+        pydar._download_file(url=file_url, file_path=file_path)
+    assert not os.path.exists(file_path)
+    assert os.path.getsize(f"{file_path}.part") == len(file_bytes) // 2
+
+    cassini_stand_in.truncate_paths.clear()
+    assert pydar._download_file(url=file_url, file_path=file_path) == file_path
+    assert cassini_stand_in.range_requests == [
+        ("/files/large.ZIP", f"bytes={len(file_bytes) // 2}-")
+    ]
+    assert not os.path.exists(f"{file_path}.part")
+    with open(file_path, "rb") as downloaded_file:
+        assert downloaded_file.read() == file_bytes
+
+
+def test_downloadFile_restartWhenPartFileTooLarge(cassini_stand_in, tmp_path):
+    cassini_stand_in.files["/files/small.TAB"] = b"small file"
+    file_path = str(tmp_path / "small.TAB")
+    with open(f"{file_path}.part", "wb") as part_file:
+        part_file.write(b"stale partial download from a larger file")
+    pydar._download_file(url=f"{cassini_stand_in.url}/files/small.TAB",
+                         file_path=file_path)
+    with open(file_path, "rb") as downloaded_file:
+        assert downloaded_file.read() == b"small file"
+    assert not os.path.exists(f"{file_path}.part")
+
+
+def test_downloadFile_verifyChunkedTruncationKeepsPartFile(
+        cassini_stand_in, tmp_path):
+    file_bytes = bytes(range(256)) * 64
+    cassini_stand_in.files["/files/large.ZIP"] = file_bytes
+    cassini_stand_in.chunked_paths.add("/files/large.ZIP")
+    cassini_stand_in.truncate_paths.add("/files/large.ZIP")
+    file_url = f"{cassini_stand_in.url}/files/large.ZIP"
+    file_path = str(tmp_path / "large.ZIP")
+    with pytest.raises(
+            error.ContentTooShortError,
+            match=re.escape(
+                f"Incomplete download: {file_url}\nConnection closed after {len(file_bytes) // 2} bytes"
+            )):
+        pydar._download_file(url=file_url, file_path=file_path)
+    assert not os.path.exists(file_path)
+    assert os.path.getsize(f"{file_path}.part") == len(file_bytes) // 2
+
+    cassini_stand_in.truncate_paths.clear()
+    assert pydar._download_file(url=file_url, file_path=file_path) == file_path
+    with open(file_path, "rb") as downloaded_file:
+        assert downloaded_file.read() == file_bytes
+
+
+def test_downloadFile_restartWhenRangeMisaligned(cassini_stand_in, tmp_path):
+    file_bytes = bytes(range(256)) * 64
+    cassini_stand_in.files["/files/large.ZIP"] = file_bytes
+    cassini_stand_in.misaligned_range_paths.add("/files/large.ZIP")
+    file_path = str(tmp_path / "large.ZIP")
+    with open(f"{file_path}.part", "wb") as part_file:
+        part_file.write(file_bytes[:len(file_bytes) // 2])
+    pydar._download_file(url=f"{cassini_stand_in.url}/files/large.ZIP",
+                         file_path=file_path)
+    with open(file_path, "rb") as downloaded_file:
+        assert downloaded_file.read() == file_bytes
+    assert len(cassini_stand_in.range_requests) == 1
+
+
+## _download_files() #################################
+
+
+## _download_cached_file() #################################
+def test_downloadCachedFile_verifySharedBetweenResultsDirectories(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+    cassini_stand_in.files["/files/SBDR.FMT"] = b"FMT"
+    file_url = f"{cassini_stand_in.url}/files/SBDR.FMT"
+    os.makedirs(tmp_path / "S01")
+    os.makedirs(tmp_path / "S02")
+    pydar._download_cached_file(url=file_url,
+                                file_path=str(tmp_path / "S01" / "SBDR.FMT"))
+    pydar._download_cached_file(url=file_url,
+                                file_path=str(tmp_path / "S02" / "SBDR.FMT"))
+    assert cassini_stand_in.requests == ["/files/SBDR.FMT"]
+    for segment_num in ["S01", "S02"]:
+        with open(tmp_path / segment_num / "SBDR.FMT", "rb") as cached_file:
+            assert cached_file.read() == b"FMT"
+
+
+def test_downloadCachedFile_verifyChangedFileDownloadedAgain(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+    cassini_stand_in.files["/files/SBDR.TAB"] = b"TAB V02"
+    file_url = f"{cassini_stand_in.url}/files/SBDR.TAB"
+    file_path = str(tmp_path / "SBDR.TAB")
+    pydar._download_cached_file(url=file_url, file_path=file_path)
+    cassini_stand_in.files["/files/SBDR.TAB"] = b"TAB V03"
+    pydar._download_cached_file(url=file_url, file_path=file_path)
+    assert cassini_stand_in.requests == ["/files/SBDR.TAB", "/files/SBDR.TAB"]
+    with open(file_path, "rb") as cached_file:
+        assert cached_file.read() == b"TAB V03"
+
+
+def test_downloadCachedFile_verifyLeastRecentlyUsedEvicted(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_MAX_BYTES", 10)
+    for i in range(3):
+        cassini_stand_in.files[f"/files/file_{i}.TAB"] = f"12345{i}".encode()
+        pydar._download_cached_file(
+            url=f"{cassini_stand_in.url}/files/file_{i}.TAB",
+            file_path=str(tmp_path / f"file_{i}.TAB"))
+        time.sleep(0.01)
+
+    def _cached_files():
+        return sorted(
+            os.path.join(cache_root, cache_filename)
+            for cache_root, _, cache_filenames in os.walk(
+                pydar.downloader.DOWNLOAD_CACHE_DIRECTORY)
+            for cache_filename in cache_filenames
+            if cache_filename != pydar.downloader.DOWNLOAD_CACHE_LOCK_FILENAME)
+
+    # files still linked into results directories are kept
+    assert len(_cached_files()) == 3
+    os.remove(tmp_path / "file_0.TAB")
+    os.remove(tmp_path / "file_1.TAB")
+    pydar.downloader._evict_download_cache(max_bytes=10)
+    cached_files = _cached_files()
+    assert len(cached_files) == 1
+    with open(cached_files[0], "rb") as cached_file:
+        assert cached_file.read() == b"123452"
+    with open(tmp_path / "file_2.TAB", "rb") as result_file:
+        assert result_file.read() == b"123452"
+
+
+def test_downloadCachedFile_verifyCopiedWithoutHardlinks(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_MAX_BYTES", 0)
+
+    def _link_not_supported(source_path, link_path):
+        raise OSError("hardlinks not supported")
+
+    monkeypatch.setattr(pydar.downloader.os, "link", _link_not_supported)
+    cassini_stand_in.files["/files/SBDR.FMT"] = b"FMT"
+    file_path = str(tmp_path / "SBDR.FMT")
+    pydar._download_cached_file(url=f"{cassini_stand_in.url}/files/SBDR.FMT",
+                                file_path=file_path)
+    # a copy (not a symlink) still exists after the cache removes its file
+    assert not os.path.islink(file_path)
+    with open(file_path, "rb") as result_file:
+        assert result_file.read() == b"FMT"
+
+
+def test_removeDownloadedFile_verifyCacheRemovedWithLastLink(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+    cassini_stand_in.files["/files/BIDR.zip"] = b"ZIP"
+    for segment_num in ["S01", "S02"]:
+        pydar._download_cached_file(
+            url=f"{cassini_stand_in.url}/files/BIDR.zip",
+            file_path=str(tmp_path / f"{segment_num}_BIDR.zip"))
+    cache_path = pydar._download_cache_path(
+        f"{cassini_stand_in.url}/files/BIDR.zip",
+        pydar._http_request(url=f"{cassini_stand_in.url}/files/BIDR.zip",
+                            method="HEAD").headers)
+    pydar._remove_downloaded_file(str(tmp_path / "S01_BIDR.zip"))
+    assert os.path.exists(cache_path)  # still linked into S02
+    pydar._remove_downloaded_file(str(tmp_path / "S02_BIDR.zip"))
+    assert not os.path.exists(cache_path)
+    assert not os.path.exists(tmp_path / "S02_BIDR.zip")
+
+
+def test_evictDownloadCache_verifyWaitsForLockFile(cassini_stand_in, tmp_path):
+    fcntl = pytest.importorskip("fcntl")
+    cache_path = pydar._download_cache_path("https://pydar.invalid/file.TAB",
+                                            {"ETag": "1"})
+    os.makedirs(os.path.dirname(cache_path))
+    with open(cache_path, "wb") as cache_file:
+        cache_file.write(b"TAB")
+
+    # lock held by another process
+    with open(
+            os.path.join(pydar.downloader.DOWNLOAD_CACHE_DIRECTORY,
+                         pydar.downloader.DOWNLOAD_CACHE_LOCK_FILENAME),
+            "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        evict_thread = threading.Thread(
+            target=pydar.downloader._evict_download_cache, args=(0, ))
+        evict_thread.start()
+        evict_thread.join(timeout=0.2)
+        assert evict_thread.is_alive()
+        assert os.path.exists(cache_path)
+    evict_thread.join(timeout=5)
+    assert not evict_thread.is_alive()
+    assert not os.path.exists(cache_path)
+
+
+## _download_cached_file() #################################
+
+
+## _download_bidr_coradr_data() and _download_sbdr_coradr_data() ###########
+def test_downloadCORADRData_verifyResultsDirectoryLayout(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    pydar.extract_flyby_parameters._download_aareadme("CORADR_0035_V03", "S01")
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["I"], max_workers=3)
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01", max_workers=3)
+    assert sorted(os.listdir("pydar_results/CORADR_0035_V03_S01")) == [
+        "AAREADME.TXT", "BIBQI49N071_D035_T00AS01_V03.IMG",
+        "BIBQI49N071_D035_T00AS01_V03.LBL", "BIBQI49N071_D035_T00AS01_V03.zip",
+        "SBDR.FMT", "SBDR_10_D035_V03.TAB", "pydar_manifest.json"
+    ]
+    with open(
+            "pydar_results/CORADR_0035_V03_S01/BIBQI49N071_D035_T00AS01_V03.IMG",
+            "rb") as image_file:
+        assert image_file.read() == b"IMG S01"
+    downloaded_paths = [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ]
+    assert sorted(downloaded_paths) == sorted(set(downloaded_paths))
+
+
+def test_downloadCORADRData_verifyRepeatedDownloadSkipped(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    for _ in range(2):
+        pydar.extract_flyby_parameters._download_aareadme(
+            "CORADR_0035_V03", "S01")
+        pydar.extract_flyby_parameters._download_bidr_coradr_data(
+            "CORADR_0035_V03", "S01", ["I"])
+        pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+            "CORADR_0035_V03", "S01")
+    downloaded_paths = [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ]
+    assert len(downloaded_paths) == 5
+    assert sorted(downloaded_paths) == sorted(set(downloaded_paths))
+
+    manifest = pydar._read_manifest("pydar_results/CORADR_0035_V03_S01")
+    assert manifest["BIBQI49N071_D035_T00AS01_V03.zip"]["extracted"] == {
+        "BIBQI49N071_D035_T00AS01_V03.IMG": len(b"IMG S01")
+    }
+    assert manifest["SBDR.FMT"] == {
+        "url":
+        f"{cassini_stand_in.url}/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/SBDR.FMT",
+        "size": 3,
+        "mtime_ns":
+        os.stat("pydar_results/CORADR_0035_V03_S01/SBDR.FMT").st_mtime_ns,
+        "sha256": hashlib.sha256(b"FMT").hexdigest(),
+        "etag": f'"{hashlib.md5(b"FMT").hexdigest()}"',
+        "last_modified": None
+    }
+
+
+def test_downloadCORADRData_verifyRevalidatedOncePerFile(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["I"])
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+    bidr_sbdr_paths = [
+        "/cassini_orbiter/CORADR_0035_V03/DATA/BIDR/BIBQI49N071_D035_T00AS01_V03.LBL",
+        "/cassini_orbiter/CORADR_0035_V03/DATA/BIDR/BIBQI49N071_D035_T00AS01_V03.ZIP",
+        "/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/SBDR.FMT",
+        "/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/SBDR_10_D035_V03.TAB"
+    ]
+    # one HEAD for the download cache, the manifest uses the validators of the GET response
+    assert sorted(cassini_stand_in.head_requests) == bidr_sbdr_paths
+
+    cassini_stand_in.head_requests.clear()
+    checksum_paths = []
+    monkeypatch.setattr(pydar.downloader, "_file_checksum",
+                        checksum_paths.append)
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["I"])
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+    assert sorted(cassini_stand_in.head_requests) == bidr_sbdr_paths
+    assert checksum_paths == [
+    ]  # size and modification time match the manifest
+
+
+def test_downloadCORADRData_verifyOnlyMissingFilesDownloaded(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["I"])
+    cassini_stand_in.requests.clear()
+
+    # wider resolutions only download the new resolution
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["D", "I"])
+    assert [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ] == [
+        "/cassini_orbiter/CORADR_0035_V03/DATA/BIDR/BIBQD49N071_D035_T00AS01_V03.LBL"
+    ]
+    cassini_stand_in.requests.clear()
+
+    # a missing extracted IMG downloads and extracts the ZIP again
+    os.remove(
+        "pydar_results/CORADR_0035_V03_S01/BIBQI49N071_D035_T00AS01_V03.IMG")
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["D", "I"])
+    assert os.path.exists(
+        "pydar_results/CORADR_0035_V03_S01/BIBQI49N071_D035_T00AS01_V03.IMG")
+    assert [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ] == []
+
+
+def test_downloadCORADRData_verifyIncompleteFileDownloadedAgain(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+    with open("pydar_results/CORADR_0035_V03_S01/SBDR_10_D035_V03.TAB",
+              "wb") as sbdr_file:
+        sbdr_file.write(b"T")
+    cassini_stand_in.requests.clear()
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+    assert [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ] == ["/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/SBDR_10_D035_V03.TAB"]
+
+
+def test_downloadCORADRData_verifyEditedFileDownloadedAgain(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+    sbdr_path = "pydar_results/CORADR_0035_V03_S01/SBDR_10_D035_V03.TAB"
+    sbdr_stat = os.stat(sbdr_path)
+    with open(sbdr_path, "wb") as sbdr_file:
+        sbdr_file.write(b"BAT")  # same size, different contents
+    os.utime(sbdr_path,
+             ns=(sbdr_stat.st_atime_ns, sbdr_stat.st_mtime_ns + 10**9))
+    cassini_stand_in.requests.clear()
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+    assert [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ] == ["/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/SBDR_10_D035_V03.TAB"]
+    with open(sbdr_path, "rb") as sbdr_file:
+        assert sbdr_file.read() == b"TAB"
+
+
+def test_downloadCORADRData_verifyChangedFileDownloadedAgain(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    sbdr_path = "/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/SBDR_10_D035_V03.TAB"
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+
+    # the same size with different contents on the server (new ETag)
+    cassini_stand_in.files[sbdr_path] = b"NEW"
+    cassini_stand_in.requests.clear()
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+    assert [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ] == [sbdr_path]
+    with open("pydar_results/CORADR_0035_V03_S01/SBDR_10_D035_V03.TAB",
+              "rb") as sbdr_file:
+        assert sbdr_file.read() == b"NEW"
+
+    # the same size with different contents locally (checksum does not match)
+    with open("pydar_results/CORADR_0035_V03_S01/SBDR.FMT", "wb") as fmt_file:
+        fmt_file.write(b"XXX")
+    cassini_stand_in.requests.clear()
+    pydar.extract_flyby_parameters._download_sbdr_coradr_data(
+        "CORADR_0035_V03", "S01")
+    assert [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ] == ["/cassini_orbiter/CORADR_0035_V03/DATA/SBDR/SBDR.FMT"]
+    with open("pydar_results/CORADR_0035_V03_S01/SBDR.FMT", "rb") as fmt_file:
+        assert fmt_file.read() == b"FMT"
+
+
+def test_downloadCORADRData_verifyChangedZipDownloadedAgain(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    zip_path = "/cassini_orbiter/CORADR_0035_V03/DATA/BIDR/BIBQI49N071_D035_T00AS01_V03.ZIP"
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["I"])
+
+    # an extracted ZIP changed on the server is downloaded and extracted again
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zip_ref:
+        zip_ref.writestr("BIBQI49N071_D035_T00AS01_V03.IMG", b"IMG V04")
+    cassini_stand_in.files[zip_path] = zip_buffer.getvalue()
+    cassini_stand_in.requests.clear()
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["I"])
+    assert [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ] == [zip_path]
+    with open(
+            "pydar_results/CORADR_0035_V03_S01/BIBQI49N071_D035_T00AS01_V03.IMG",
+            "rb") as image_file:
+        assert image_file.read() == b"IMG V04"
+
+
+## _download_bidr_coradr_data() and _download_sbdr_coradr_data() ###########
+
+
+## _report_download_event() #################################
+def test_reportDownloadEvent_verifyProgressHookAndMetricsLog(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+    download_events = []
+    metrics_log = str(tmp_path / "metrics.jsonl")
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_PROGRESS_HOOK",
+                        download_events.append)
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_METRICS_LOG", metrics_log)
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CHUNK_SIZE", 1024)
+    file_bytes = bytes(range(256)) * 16
+    cassini_stand_in.files["/files/file.TAB"] = file_bytes
+    cassini_stand_in.unavailable_paths.add("/files/file.TAB")
+    for results_directory in ["S01", "S02"]:
+        pydar._download_cached_file(
+            url=f"{cassini_stand_in.url}/files/file.TAB",
+            file_path=str(tmp_path / f"{results_directory}_file.TAB"))
+
+    progress_events = [
+        download_event for download_event in download_events
+        if download_event["event"] == "progress"
+    ]
+    assert progress_events[-1]["bytes_downloaded"] == len(file_bytes)
+    assert progress_events[-1]["total_bytes"] == len(file_bytes)
+    assert [
+        download_event["bytes_downloaded"]
+        for download_event in progress_events
+    ] == sorted(download_event["bytes_downloaded"]
+                for download_event in progress_events)
+
+    with open(metrics_log, "r") as metrics_file:
+        logged_events = [json.loads(line) for line in metrics_file]
+    assert [logged_event["event"]
+            for logged_event in logged_events] == ["download", "cache_hit"]
+    download_event = logged_events[0]
+    assert download_event["status"] == "complete"
+    assert download_event["bytes_transferred"] == len(file_bytes)
+    assert download_event["resumed_from"] == 0
+    assert download_event["retries"] == 1
+    assert download_event["duration_seconds"] >= download_event[
+        "latency_seconds"] >= 0
+    assert download_event["throughput_bytes_per_second"] > 0
+    assert logged_events[1]["file_path"] == str(tmp_path / "S02_file.TAB")
+    assert logged_events[1]["size"] == len(file_bytes)
+    assert [
+        download_event for download_event in download_events
+        if download_event["event"] != "progress"
+    ] == logged_events
+
+
+def test_reportDownloadEvent_verifyIncompleteDownload(cassini_stand_in,
+                                                      tmp_path, monkeypatch):
+    download_events = []
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_PROGRESS_HOOK",
+                        download_events.append)
+    file_bytes = bytes(range(256)) * 64
+    cassini_stand_in.files["/files/large.ZIP"] = file_bytes
+    cassini_stand_in.truncate_paths.add("/files/large.ZIP")
+    with pytest.raises(error.ContentTooShortError):
+        pydar._download_file(url=f"{cassini_stand_in.url}/files/large.ZIP",
+                             file_path=str(tmp_path / "large.ZIP"))
+    assert download_events[-1]["event"] == "download"
+    assert download_events[-1]["status"] == "incomplete"
+    assert download_events[-1]["bytes_transferred"] == len(file_bytes) // 2
+
+
+## _report_download_event() #################################
@@ -39,6 +39,18 @@ def test_observationToID_verifyObservationNumberConversion(
         flyby_observation_num=flyby_observation_num_value) == flyby_id_output
 
 
+def test_observationToID_verifyUnpaddedObservationNumber():
+    assert pydar.observation_to_id(flyby_observation_num="211") == "T65"
+
+
+def test_observationToID_verifyRoundTripConversion():
+    flyby_ids, _ = pydar._retrieve_flyby_data()
+    for flyby_id in flyby_ids:
+        assert pydar.observation_to_id(
+            flyby_observation_num=pydar.id_to_observation(
+                flyby_id=flyby_id)) == flyby_id
+
+
 ## observation_to_id() #################################
 
 
@@ -134,7 +146,7 @@ def test_extractFlybyImages_notAvailableSegmentNum():
     with pytest.raises(
             ValueError,
             match=re.escape(
-                f"[segment_num]: 'S10' not an available segment options: '{pydar._return_segment_options()}'"
+                f"[segment_num]: 'S10' not an available segment options: '{list(pydar._return_segment_options())}'"
             )):
         pydar.extract_flyby_images(flyby_observation_num="211",
                                    segment_num="S10")
@@ -195,6 +207,42 @@ def test_extractFlybyImages_topResolutionInvalidRange(
             top_x_resolutions=top_resolution_invalid_range)
 
 
+@pytest.mark.parametrize("invalid_input, error_output",
+                         [("4", "<class 'str'>"), (3.1415, "<class 'float'>"),
+                          (False, "<class 'bool'>")])
+def test_extractFlybyImages_maxWorkersInvalidTypes(invalid_input,
+                                                   error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[max_workers]: Must be a int, current type = '{error_output}'"
+            )):
+        pydar.extract_flyby_images(flyby_observation_num="211",
+                                   segment_num="S01",
+                                   max_workers=invalid_input)
+
+
+def test_extractFlybyImages_maxWorkersInvalidRange():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[max_workers]: Must be greater than or equal to 1, not '0'")):
+        pydar.extract_flyby_images(flyby_observation_num="211",
+                                   segment_num="S01",
+                                   max_workers=0)
+
+
+def test_extractFlybyImages_maxConnectionsPerHostInvalidRange():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[max_connections_per_host]: Must be greater than or equal to 1, not '-1'"
+            )):
+        pydar.extract_flyby_images(flyby_observation_num="211",
+                                   segment_num="S01",
+                                   max_connections_per_host=-1)
+
+
 ## extractFlybyImages() ############################################
 
 
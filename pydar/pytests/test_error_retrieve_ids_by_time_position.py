@@ -3,14 +3,18 @@
 # python -m pytest -k test_error_retrieve_ids_by_time_position.py
 
 # Standard Library Imports
+from datetime import datetime, timedelta
 import logging
 import re
 
 # Related Third Party Imports
+import numpy as np
+import pandas as pd
 import pytest
 
 # Internal Local Imports
 import pydar
+import pydar.retrieve_ids_by_time_position
 
 feature_name_full_list = [
     'Aaru', 'Abaya Lacus', 'Adiri', 'Afekan', 'Ahmakiq Undae', 'Akmena Lacus',
@@ -102,6 +106,68 @@ invalid_non_str_options = [(1961, "<class 'int'>"),
                            (False, "<class 'bool'>")]
 
 
+def _scan_swath_latlon(min_latitude, max_latitude, min_longitude,
+                       max_longitude):
+    # Row by row scan of the bundled swath CSV for the swaths that contain a latitude/longitude
+    # range, as a reference for the grid index of ids_from_latlon_range()
+    swath_dataframe = pd.read_csv(
+        pydar._catalog_csv_path("swath_coverage_by_time_position.csv"))
+    flyby_ids = {}
+    for _, row in swath_dataframe.iterrows():
+        longitudes = [
+            row["EASTERNMOST_LONGITUDE (Degrees)"],
+            row["WESTERNMOST_LONGITUDE (Degrees)"]
+        ]
+        if (row["MINIMUM_LATITUDE (Degrees)"] <= max_latitude
+                and row["MAXIMUM_LATITUDE (Degrees)"] >= min_latitude
+                and min(longitudes) <= min_longitude
+                and max(longitudes) >= max_longitude):
+            segments = flyby_ids.setdefault(str(row["FLYBY ID"]), [])
+            if f"S0{row['SEGMENT NUMBER']}" not in segments:
+                segments.append(f"S0{row['SEGMENT NUMBER']}")
+    return flyby_ids
+
+
+def _scan_swath_time(start_time, end_time):
+    # Row by row scan of the bundled swath CSV for the swaths that overlap a time range, given
+    # as (year, doy, hour, minute, second, millisecond) with None for fields not defined, as a
+    # reference for the interval index of ids_from_time_range()
+    def _datetime(year, doy, *fields, defined_fields):
+        hour, minute, second, millisecond = [
+            field if defined is not None else 0
+            for field, defined in zip(fields, defined_fields)
+        ]
+        return datetime(year=year, month=1, day=1) + timedelta(
+            days=doy,
+            hours=hour,
+            minutes=minute,
+            seconds=second,
+            milliseconds=millisecond)
+
+    def _row_datetime(timestamp, defined_fields):
+        return _datetime(int(timestamp[:4]),
+                         int(timestamp[5:8]),
+                         int(timestamp[9:11]),
+                         int(timestamp[12:14]),
+                         int(timestamp[15:17]),
+                         int(timestamp[18:]),
+                         defined_fields=defined_fields)
+
+    start_datetime = _datetime(*start_time, defined_fields=start_time[2:])
+    end_datetime = _datetime(*end_time, defined_fields=end_time[2:])
+    swath_dataframe = pd.read_csv(
+        pydar._catalog_csv_path("swath_coverage_by_time_position.csv"))
+    flyby_ids = {}
+    for _, row in swath_dataframe.iterrows():
+        if (_row_datetime(row["START_TIME"], start_time[2:]) <= end_datetime
+                and _row_datetime(row["STOP_TIME"],
+                                  end_time[2:]) >= start_datetime):
+            segments = flyby_ids.setdefault(str(row["FLYBY ID"]), [])
+            if f"S0{row['SEGMENT NUMBER']}" not in segments:
+                segments.append(f"S0{row['SEGMENT NUMBER']}")
+    return flyby_ids
+
+
 ## ids_from_feature_name() ##########################################
 def test_retrieveIDSByFeatureName_featureNameRequired():
     with pytest.raises(
@@ -470,8 +536,202 @@ def test_retrieveIDSByLatitudeLongitudeRange_maxLongitudeRequired():
                                     max_longitude=None)
 
 
+def test_retrieveIDSByLatitudeLongitudeRange_verifyPoleAnd180Boundaries():
+    # south pole row of grid cells across all longitudes
+    assert pydar.ids_from_latlon_range(min_latitude=-90,
+                                       max_latitude=-89,
+                                       min_longitude=0,
+                                       max_longitude=360) == {
+                                           'T39': ['S06', 'S05', 'S01'],
+                                           'T49': ['S01'],
+                                           'T50': ['S02'],
+                                           'T55': ['S03'],
+                                           'T59': ['S01'],
+                                           'T65': ['S01'],
+                                           'T95': ['S03'],
+                                           'T98': ['S01', 'S04']
+                                       }
+    # the 180 degree longitude on the equator, a corner of four grid cells
+    assert pydar.ids_from_latlon_range(min_latitude=0,
+                                       max_latitude=0,
+                                       min_longitude=180,
+                                       max_longitude=180) == {
+                                           'T3': ['S01'],
+                                           'T8': ['S03'],
+                                           'T19': ['S01'],
+                                           'T20': ['S02'],
+                                           'T23': ['S01'],
+                                           'T25': ['S01'],
+                                           'T28': ['S01'],
+                                           'T29': ['S01'],
+                                           'T36': ['S04'],
+                                           'T39': ['S03'],
+                                           'T41': ['S02'],
+                                           'T43': ['S01'],
+                                           'T44': ['S01'],
+                                           'T48': ['S03'],
+                                           'T50': ['S01', 'S02'],
+                                           'T55': ['S01'],
+                                           'T56': ['S01'],
+                                           'T57': ['S01'],
+                                           'T58': ['S01'],
+                                           'T61': ['S01', 'S03', 'S02', 'S04'],
+                                           'T64': ['S02'],
+                                           'T69': ['S02'],
+                                           'T83': ['S05'],
+                                           'T84': ['S02'],
+                                           'T91': ['S08'],
+                                           'T92': ['S01', 'S05'],
+                                           'T95': ['S01'],
+                                           'T98': ['S06', 'S02'],
+                                           'T104': ['S01', 'S02']
+                                       }
+
+
+@pytest.mark.parametrize(
+    "min_latitude, max_latitude, min_longitude, max_longitude",
+    [
+        (-90, -90, 0, 0),  # south pole, first grid cell
+        (90, 90, 360, 360),  # north pole, last grid cell
+        (-90, 90, 0, 360),  # every grid cell (checks all boxes)
+        (-90, -80, 180, 180),
+        (80, 90, 180, 180),
+        (85, 90, 0, 360),
+        (-10, 10, 179, 181),  # across the 180 degree longitude
+        (-10, 10, 170, 180),
+        (-10, 10, 180, 190),
+        (-70, -60, 350, 360),  # last longitude cells
+        (-70, -60, 0, 10),  # first longitude cells
+        (-80, -80, 170, 170),
+        (-82, -72, 183, 185)
+    ])
+def test_retrieveIDSByLatitudeLongitudeRange_verifyBoundariesMatchScan(
+        min_latitude, max_latitude, min_longitude, max_longitude):
+    assert pydar.ids_from_latlon_range(
+        min_latitude=min_latitude,
+        max_latitude=max_latitude,
+        min_longitude=min_longitude,
+        max_longitude=max_longitude) == _scan_swath_latlon(
+            min_latitude, max_latitude, min_longitude, max_longitude)
+
+
+def test_retrieveIDSByLatitudeLongitudeRange_verifySwathEdgesMatchScan():
+    # a range on the exact edges of a swath bounding box includes the swath
+    swath_dataframe = pd.read_csv(
+        pydar._catalog_csv_path("swath_coverage_by_time_position.csv"))
+    for _, row in swath_dataframe.drop_duplicates(
+            subset=["FLYBY ID", "SEGMENT NUMBER"]).head(12).iterrows():
+        longitudes = sorted([
+            row["EASTERNMOST_LONGITUDE (Degrees)"],
+            row["WESTERNMOST_LONGITUDE (Degrees)"]
+        ])
+        edge_ranges = [
+            (row["MINIMUM_LATITUDE (Degrees)"],
+             row["MINIMUM_LATITUDE (Degrees)"], longitudes[0], longitudes[0]),
+            (row["MAXIMUM_LATITUDE (Degrees)"],
+             row["MAXIMUM_LATITUDE (Degrees)"], longitudes[1], longitudes[1]),
+            (row["MINIMUM_LATITUDE (Degrees)"],
+             row["MAXIMUM_LATITUDE (Degrees)"], longitudes[0], longitudes[1])
+        ]
+        for edge_range in edge_ranges:
+            flyby_ids = pydar.ids_from_latlon_range(*edge_range)
+            assert flyby_ids == _scan_swath_latlon(*edge_range)
+            assert f"S0{row['SEGMENT NUMBER']}" in flyby_ids[str(
+                row["FLYBY ID"])]
+
+
+def test_buildSwathGrid_verifyBuiltFromDataframe():
+    swath_dataframe = pydar._read_catalog_csv(
+        "swath_coverage_by_time_position.csv")
+    filtered_dataframe = swath_dataframe[swath_dataframe["CORADR ID"] ==
+                                         "CORADR_0035"]
+    swath_boxes = pydar.retrieve_ids_by_time_position._build_swath_boxes(
+        filtered_dataframe)
+    assert len(swath_boxes["row_box"]) == len(filtered_dataframe)
+    swath_grid = pydar.retrieve_ids_by_time_position._build_swath_grid(
+        filtered_dataframe)
+    assert set(swath_grid["cell_boxes"]) == set(
+        range(len(swath_boxes["min_latitude"])))
+
+
 ## ids_from_latlon_range() ###############################
 
+## ids_from_latlon_many() ###############################
+
+
+def test_retrieveIDSByLatitudeLongitudeMany_pointsRequired():
+    with pytest.raises(ValueError,
+                       match=re.escape("[points]: points is required")):
+        pydar.ids_from_latlon_many(points=None)
+
+
+def test_retrieveIDSByLatitudeLongitudeMany_pointsInvalidTypes():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[points]: Must be a pd.DataFrame or np.ndarray, current type = '<class 'list'>'"
+            )):
+        pydar.ids_from_latlon_many(points=[[-80, 170]])
+
+
+def test_retrieveIDSByLatitudeLongitudeMany_pointsInvalidShape():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[points]: Must have the shape (N, 2) for ['latitude', 'longitude'] or (N, 4) for ['min_latitude', 'max_latitude', 'min_longitude', 'max_longitude'], current shape = (1, 3)"
+            )):
+        pydar.ids_from_latlon_many(points=np.array([[-80, 170, 10]]))
+
+
+def test_retrieveIDSByLatitudeLongitudeMany_latitudeInvalidRange():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[latitude]: Latitude must be between 90 and -90, invalid at query index [1]"
+            )):
+        pydar.ids_from_latlon_many(points=pd.DataFrame({
+            "latitude": [-80, 91],
+            "longitude": [170, 170]
+        }))
+
+
+def test_retrieveIDSByLatitudeLongitudeMany_latitudeMaxGreaterMin():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[latitude]: max_latitude must be greater than min_latitude, invalid at query index [0]"
+            )):
+        pydar.ids_from_latlon_many(points=np.array([[-72, -82, 183, 185]]))
+
+
+def test_retrieveIDSByLatitudeLongitudeMany_verifyOutput(caplog):
+    flyby_ids = pydar.ids_from_latlon_many(
+        points=np.array([[-80, 170], [90, 360], [-72, 183]]))
+    for query_index, (latitude, longitude) in enumerate([(-80, 170), (90, 360),
+                                                         (-72, 183)]):
+        query_ids = {}
+        for flyby, segment in flyby_ids[flyby_ids["query_index"] ==
+                                        query_index][[
+                                            "flyby", "segment"
+                                        ]].itertuples(index=False):
+            query_ids.setdefault(flyby, []).append(segment)
+        assert query_ids == pydar.ids_from_latlon(latitude=latitude,
+                                                  longitude=longitude)
+    range_ids = pydar.ids_from_latlon_many(points=pd.DataFrame({
+        "min_latitude": [-82],
+        "max_latitude": [-72],
+        "min_longitude": [183],
+        "max_longitude": [185]
+    }))
+    assert list(range_ids["flyby"].unique()) == list(
+        pydar.ids_from_latlon_range(min_latitude=-82,
+                                    max_latitude=-72,
+                                    min_longitude=183,
+                                    max_longitude=185))
+
+
+## ids_from_latlon_many() ###############################
+
 ## features_from_latlon() #############################
 
 
@@ -503,6 +763,27 @@ def test_retrieveFeaturesFromLatitudeLongitudeRange_verifyOutput(caplog):
     ]
 
 
+def test_retrieveFeaturesFromLatitudeLongitudeMany_pointsRequired():
+    with pytest.raises(ValueError,
+                       match=re.escape("[points]: points is required")):
+        pydar.features_from_latlon_many(points=None)
+
+
+def test_retrieveFeaturesFromLatitudeLongitudeMany_verifyOutput(caplog):
+    found_features = pydar.features_from_latlon_many(points=np.array(
+        [[-72, -72, 183, 183], [90, 90, 360, 360], [-82, -72, 183, 190]]))
+    assert found_features.values.tolist() == [[0, 'Ontario Lacus'],
+                                              [0, 'Rossak Planitia'],
+                                              [2, 'Crveno Lacus'],
+                                              [2, 'Ontario Lacus'],
+                                              [2, 'Romo Planitia'],
+                                              [2, 'Rossak Planitia'],
+                                              [2, 'Saraswati Flumen']]
+    log_record = caplog.records[0]
+    assert log_record.levelno == logging.INFO
+    assert log_record.message == "\n[WARNING]: No Features found for 1 of 3 queries\n"
+
+
 ## features_from_latlon_range() ##########################
 
 
@@ -660,10 +941,101 @@ def test_retrieveIDSByTime_millisecondInvalidTypes(invalid_input,
                             millisecond=invalid_input)
 
 
+def test_retrieveIDSByTime_verifyStopAndStartBoundaries():
+    # T8 S01 stops at 2005-301T04:33:38.212 and T8 S02 starts at 2005-301T04:33:38.484
+    assert pydar.ids_from_time(year=2005,
+                               doy=301,
+                               hour=4,
+                               minute=33,
+                               second=38,
+                               millisecond=212) == {
+                                   'T8': ['S01']
+                               }
+    assert pydar.ids_from_time(year=2005,
+                               doy=301,
+                               hour=4,
+                               minute=33,
+                               second=38,
+                               millisecond=213) == {}
+    assert pydar.ids_from_time(year=2005,
+                               doy=301,
+                               hour=4,
+                               minute=33,
+                               second=38,
+                               millisecond=484) == {
+                                   'T8': ['S02']
+                               }
+    # T8 S03 stops at 2005-301T03:54:34.079 and T8 S01 starts at 2005-301T03:54:34.387
+    assert pydar.ids_from_time(year=2005,
+                               doy=301,
+                               hour=3,
+                               minute=54,
+                               second=34,
+                               millisecond=79) == {
+                                   'T8': ['S03']
+                               }
+    # without milliseconds both segments are within the same second
+    assert pydar.ids_from_time(year=2005,
+                               doy=301,
+                               hour=3,
+                               minute=54,
+                               second=34) == {
+                                   'T8': ['S03', 'S01']
+                               }
+
+
 ## ids_from_time() #################################################
 
 
 ## ids_from_time_range() ############################################
+@pytest.mark.parametrize("start_time, end_time", [
+    ((2005, 301, 4, 33, 38, 212), (2005, 301, 4, 33, 38, 484)),
+    ((2005, 301, 4, 33, 38, 213), (2005, 301, 4, 33, 38, 483)),
+    ((2005, 301, 3, 54, 34, 0), (2005, 301, 3, 54, 34, 400)),
+    ((2005, 301, 3, None, None, None), (2005, 301, 4, None, None, None)),
+    ((2005, 301, None, None, None, None), (2005, 301, None, None, None, None)),
+    ((2004, 300, 15, 49, 8, 325), (2004, 300, 15, 49, 8, 325)),
+    ((2004, 300, 15, 49, 8, 326), (2005, 301, 3, 53, 56, 970)),
+    ((2004, 299, None, None, None, None), (2014, 365, None, None, None, None)),
+])
+def test_retrieveIDSByTimeRange_verifyBoundariesMatchScan(
+        start_time, end_time):
+    fields = ["year", "doy", "hour", "minute", "second", "millisecond"]
+    time_range = {
+        f"start_{field}": value
+        for field, value in zip(fields, start_time)
+    }
+    time_range.update({
+        f"end_{field}": value
+        for field, value in zip(fields, end_time)
+    })
+    assert pydar.ids_from_time_range(**time_range) == _scan_swath_time(
+        start_time, end_time)
+
+
+def test_searchSwathTimeIndex_verifyOverlappingIntervals():
+    # a long interval that starts first overlaps later, shorter intervals (nested and
+    # partially overlapping), so the running maximum stop time keeps it in the search
+    row_start_ms = np.array([0, 10, 30, 50, 35])
+    row_stop_ms = np.array([100, 20, 40, 200, 45])
+    order = np.argsort(row_start_ms, kind="stable")
+    time_index = {
+        "order": order,
+        "start_ms": row_start_ms[order],
+        "stop_ms": row_stop_ms[order],
+        "max_stop_ms": np.maximum.accumulate(row_stop_ms[order])
+    }
+    search_index = pydar.retrieve_ids_by_time_position._search_swath_time_index
+    assert search_index(time_index, 25, 25).tolist() == [0]
+    assert search_index(time_index, 20, 20).tolist() == [0, 1]
+    assert search_index(time_index, 38, 42).tolist() == [0, 2, 4]
+    assert search_index(time_index, 60, 70).tolist() == [0, 3]
+    assert search_index(time_index, 100, 100).tolist() == [0, 3]
+    assert search_index(time_index, 101, 150).tolist() == [3]
+    assert search_index(time_index, 201, 300).tolist() == []
+    assert search_index(time_index, -10, -1).tolist() == []
+
+
 def test_retrieveIDSByTimeRange_yearStartRequired():
     with pytest.raises(
             ValueError,
@@ -807,3 +1179,144 @@ def test_retrieveIDSByTimeRange_millisecondStartEndGreaterMin():
 
 
 ## ids_from_time_range() ############################################
+
+
+## ids_from_time_many() ############################################
+def test_retrieveIDSByTimeMany_timestampsRequired():
+    with pytest.raises(
+            ValueError,
+            match=re.escape("[timestamps]: timestamps is required")):
+        pydar.ids_from_time_many(timestamps=None)
+
+
+def test_retrieveIDSByTimeMany_DOYRequired():
+    with pytest.raises(ValueError, match=re.escape("[doy]: doy is required")):
+        pydar.ids_from_time_many(timestamps={"year": [2005]})
+
+
+def test_retrieveIDSByTimeMany_hourInvalidRange():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[hour]: hour must be within UTC range between 0 to 23, invalid at query index [1]"
+            )):
+        pydar.ids_from_time_many(timestamps={
+            "year": [2005, 2005],
+            "doy": [301, 301],
+            "hour": [3, 24]
+        })
+
+
+def test_retrieveIDSByTimeMany_startEndGreaterMin():
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[doy]: start_doy must be less than/equal to end_doy, invalid at query index [0]"
+            )):
+        pydar.ids_from_time_many(
+            timestamps={
+                "start_year": [2005],
+                "start_doy": [302],
+                "end_year": [2005],
+                "end_doy": [301]
+            })
+
+
+def test_retrieveIDSByTimeMany_startEndGreaterLaterField():
+    # the minute is compared once the hours are equal, in the first row only
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[minute]: start_minute must be less than/equal to end_minute, invalid at query index [0]"
+            )):
+        pydar.ids_from_time_many(
+            timestamps={
+                "start_year": [2005, 2005],
+                "start_doy": [301, 301],
+                "start_hour": [3, 2],
+                "start_minute": [30, 30],
+                "end_year": [2005, 2005],
+                "end_doy": [301, 301],
+                "end_hour": [3, 3],
+                "end_minute": [10, 10]
+            })
+
+
+@pytest.mark.parametrize(
+    "start_time, end_time",
+    [((2005, 300, 5, None, None, None), (2005, 300, None, None, None, None)),
+     ((2005, 300, None, None, None, None), (2005, 300, 5, None, None, None)),
+     ((2005, 300, 5, 30, None, None), (2005, 300, 5, None, None, None)),
+     ((2005, 300, None, 30, None, None), (2005, 300, None, 10, None, None)),
+     ((2005, 300, 5, 30, 10, 500), (2005, 300, 5, 30, None, 100)),
+     ((2005, 300, 5, 30, None, 500), (2005, 300, 5, 30, None, 100)),
+     ((2005, 301, 5, 30, 10, 500), (2005, 300, None, None, None, None)),
+     ((2005, 300, 5, 30, 10, 500), (2005, 300, 5, 30, 10, 100)),
+     ((2005, 300, 5, 30, 10, 500), (2005, 300, 5, 30, 20, 100))])
+def test_retrieveIDSByTimeMany_verifySameValidationAsTimeRange(
+        start_time, end_time):
+    # a row is accepted by ids_from_time_many() when ids_from_time_range() accepts the same
+    # start and end time, and returns the same flyby IDs
+    fields = ["year", "doy", "hour", "minute", "second", "millisecond"]
+    time_range = {
+        f"start_{field}": value
+        for field, value in zip(fields, start_time)
+    }
+    time_range.update({
+        f"end_{field}": value
+        for field, value in zip(fields, end_time)
+    })
+    try:
+        flyby_ids = pydar.ids_from_time_range(**time_range)
+    except ValueError as range_error:
+        with pytest.raises(ValueError, match=re.escape(str(range_error))):
+            pydar.ids_from_time_many(timestamps=pd.DataFrame(
+                {
+                    column: [value]
+                    for column, value in time_range.items()
+                },
+                dtype=float))
+        return
+    flyby_ids_many = pydar.ids_from_time_many(timestamps=pd.DataFrame(
+        {
+            column: [value]
+            for column, value in time_range.items()
+        }, dtype=float))
+    assert {
+        flyby:
+        sorted(flyby_ids_many[flyby_ids_many["flyby"] == flyby]["segment"])
+        for flyby in flyby_ids_many["flyby"].unique()
+    } == {
+        flyby: sorted(segments)
+        for flyby, segments in flyby_ids.items()
+    }
+
+
+def test_retrieveIDSByTimeMany_verifyOutput(caplog):
+    flyby_ids = pydar.ids_from_time_many(timestamps=pd.DataFrame({
+        "year": [2005, 2005],
+        "doy": [301, 301],
+        "hour": [3, None]
+    }))
+    assert flyby_ids.values.tolist() == [[0, 'T8', 'S03'], [0, 'T8', 'S01'],
+                                         [1, 'T8', 'S02'], [1, 'T8', 'S03'],
+                                         [1, 'T8', 'S01']]
+    flyby_ids = pydar.ids_from_time_many(
+        timestamps={
+            "start_year": [2004],
+            "start_doy": [299],
+            "start_hour": [2],
+            "start_minute": [15],
+            "start_second": [23],
+            "start_millisecond": [987],
+            "end_year": [2005],
+            "end_doy": [301],
+            "end_hour": [2],
+            "end_minute": [15],
+            "end_second": [23],
+            "end_millisecond": [987]
+        })
+    assert list(flyby_ids["flyby"].unique()) == ['Ta', 'T3', 'T7']
+
+
+## ids_from_time_many() ############################################
@@ -0,0 +1,50 @@
+# Test Expected Error Messages from updateCsvCORADRJPLOptions.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_updateCsvCORADRJPLOptions.py
+
+# Standard Library Imports
+import os
+
+# Related Third Party Imports
+import pandas as pd
+
+# Internal Local Imports
+import pydar
+import pydar.updateCsvCORADRJPLOptions
+
+
+## _coradr_data_types() #################################
+def test_coradrDataTypes_verifySameAsScanForEachDataType(
+        cassini_stand_in, catalog_directory):
+    cassini_orbiter_url = f"{cassini_stand_in.url}/cassini_orbiter"
+    for coradr_id, data_directories in [
+        ("CORADR_0003", ["LBDR", "SBDR"]),
+        ("CORADR_0211", ["ABDR", "ASUM", "BIDR", "LBDR", "SBDR", "STDR"]),
+        ("CORADR_0211_V02", ["BIDR", "CALIB", "LBDR", "SBDR"]),
+    ]:
+        data_path = f"/cassini_orbiter/{coradr_id}/DATA"
+        for data_directory in data_directories:
+            cassini_stand_in.files[
+                f"{data_path}/{data_directory}/{data_directory}.FMT"] = b"FMT"
+    cassini_stand_in.files["/cassini_orbiter/CORADR_0211.TXT"] = b"TXT"
+
+    pydar.updateCsvCORADRJPLOptions._update_csv_coradr_jpl_options(
+        cassini_orbiter_url=cassini_orbiter_url, max_workers=4)
+    coradr_dataframe = pd.read_csv(
+        os.path.join(catalog_directory, "coradr_jpl_options.csv"))
+    assert list(coradr_dataframe["CORADR ID"]) == [
+        "CORADR_0003", "CORADR_0035_V03", "CORADR_0211", "CORADR_0211_V02"
+    ]
+    assert list(
+        coradr_dataframe["Is a Titan Flyby"]) == [False, True, True, True]
+
+    # previous scan: a data type is available when a row of the DATA listing contains its name
+    for coradr_row in coradr_dataframe.to_dict(orient="records"):
+        table_text = pydar._read_directory_listing(
+            f"{cassini_orbiter_url}/{coradr_row['CORADR ID']}/DATA/")
+        for data_type in pydar.DATAFILE_TYPES:
+            assert coradr_row[f"Contains {data_type}"] == any(
+                data_type in txt for txt in table_text)
+
+
+## _coradr_data_types() #################################
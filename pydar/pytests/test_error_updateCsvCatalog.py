@@ -0,0 +1,230 @@
+# Test Expected Error Messages from updateCsvCatalog.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_updateCsvCatalog.py
+
+# Standard Library Imports
+import os
+
+# Related Third Party Imports
+import pandas as pd
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.catalog
+import pydar.updateCsvCatalog
+import pydar.updateCsvSwathCoverage
+
+
+def _catalog_bytes(catalog_directory):
+    # Return the contents of each CSV file in the catalog directory
+    catalog_bytes = {}
+    for csv_name in os.listdir(catalog_directory):
+        with open(os.path.join(catalog_directory, csv_name), "rb") as csv_file:
+            catalog_bytes[csv_name] = csv_file.read()
+    return catalog_bytes
+
+
+def _serve_swath_labels(stand_in, swath_dataframe):
+    # Serve a BIDR .LBL for each row of a swath coverage CSV with the row's values, keeping the
+    # text of the latitudes and longitudes before their unit as it is in the CSV
+    stand_in.files.clear()
+    for row in swath_dataframe.to_dict(orient="records"):
+        label_lines = [
+            f"TARGET_NAME = {row['TARGET_NAME']}",
+            f"START_TIME = {row['START_TIME']}",
+            f"STOP_TIME = {row['STOP_TIME']}", "OBJECT = IMAGE_MAP_PROJECTION"
+        ] + [
+            f"  {keyword} = {row[f'{keyword} (Degrees)']}<DEG>"
+            for keyword in pydar.updateCsvSwathCoverage.LBL_KEYWORDS[1:5]
+        ] + ["END_OBJECT = IMAGE_MAP_PROJECTION", "END"]
+        lbl_path = f"/cassini_orbiter/{row['CORADR ID']}/DATA/BIDR/{row['FILENAME']}"
+        stand_in.files[lbl_path] = ("\r\n".join(label_lines) + "\r\n").encode()
+
+
+## _diff_catalog_rows() #################################
+def test_diffCatalogRows_verifyAddedRemovedChanged():
+    previous_dataframe = pd.DataFrame({
+        "Feature Name": ["Adiri", "Belet", "Ching-tu"],
+        "Center Latitude": ["-9.5", "-6.5", "-29.8"]
+    })
+    updated_dataframe = pd.DataFrame({
+        "Feature Name": ["Adiri", "Ching-tu", "Dilmun"],
+        "Center Latitude": ["-9.4", "-29.8", "15.1"]
+    })
+    assert pydar.updateCsvCatalog._diff_catalog_rows(
+        previous_dataframe, updated_dataframe, ["Feature Name"]) == {
+            "added": [{
+                "Feature Name": "Dilmun",
+                "Center Latitude": "15.1"
+            }],
+            "removed": [{
+                "Feature Name": "Belet",
+                "Center Latitude": "-6.5"
+            }],
+            "changed": [{
+                "key": {
+                    "Feature Name": "Adiri"
+                },
+                "columns": {
+                    "Center Latitude": ["-9.5", "-9.4"]
+                }
+            }]
+        }
+
+
+def test_diffCatalogRows_verifyDuplicateRowsAddedRemoved():
+    previous_dataframe = pd.DataFrame({
+        "Feature Name": ["Adiri", "Belet"],
+        "Center Latitude": ["-9.5", "-6.5"]
+    })
+    updated_dataframe = pd.DataFrame({
+        "Feature Name": ["Adiri", "Adiri"],
+        "Center Latitude": ["-9.5", "-9.5"]
+    })
+    catalog_diff = pydar.updateCsvCatalog._diff_catalog_rows(
+        previous_dataframe, updated_dataframe, ["Feature Name"])
+    assert catalog_diff["added"] == [{
+        "Feature Name": "Adiri",
+        "Center Latitude": "-9.5"
+    }]
+    assert catalog_diff["removed"] == [{
+        "Feature Name": "Belet",
+        "Center Latitude": "-6.5"
+    }]
+    assert catalog_diff["changed"] == []
+
+    # removing the duplicate row again is reported as a removed row
+    catalog_diff = pydar.updateCsvCatalog._diff_catalog_rows(
+        updated_dataframe, updated_dataframe.head(1), ["Feature Name"])
+    assert catalog_diff["added"] == []
+    assert catalog_diff["removed"] == [{
+        "Feature Name": "Adiri",
+        "Center Latitude": "-9.5"
+    }]
+    assert catalog_diff["changed"] == []
+
+
+def test_diffCatalogRows_verifySameRowsNoChanges():
+    previous_dataframe = pd.DataFrame({
+        "CORADR ID": ["CORADR_0035", "CORADR_0035"],
+        "FILENAME": ["BIBQD05S184_D035_T00AS01_V03.LBL"] * 2
+    })
+    assert pydar.updateCsvCatalog._diff_catalog_rows(
+        previous_dataframe, previous_dataframe.copy(),
+        ["CORADR ID", "FILENAME"]) == {
+            "added": [],
+            "removed": [],
+            "changed": []
+        }
+
+
+## _diff_catalog_rows() #################################
+
+
+## _refresh_catalog() #################################
+def test_refreshCatalog_verifyStagedCsvPassedToUpdaters(
+        catalog_directory, monkeypatch):
+    live_coradr_dataframe = pydar._read_catalog_csv("coradr_jpl_options.csv")
+    staged_directories = []
+
+    def _update_coradr(catalog_directory=None):
+        staged_directories.append(catalog_directory)
+        pydar._write_catalog_csv("coradr_jpl_options.csv",
+                                 live_coradr_dataframe.head(3),
+                                 catalog_directory)
+
+    def _update_swath(catalog_directory=None):
+        # reads the refreshed coradr_jpl_options.csv, the live CSV is unchanged
+        staged_directories.append(catalog_directory)
+        assert len(
+            pydar._read_catalog_csv("coradr_jpl_options.csv",
+                                    catalog_directory)) == 3
+        assert pydar._read_catalog_csv("coradr_jpl_options.csv").equals(
+            live_coradr_dataframe)
+
+    monkeypatch.setitem(pydar.updateCsvCatalog.CATALOG_REFRESH_STAGES,
+                        "coradr_jpl_options.csv",
+                        (_update_coradr, [], ["CORADR ID"]))
+    monkeypatch.setitem(
+        pydar.updateCsvCatalog.CATALOG_REFRESH_STAGES,
+        "swath_coverage_by_time_position.csv",
+        (_update_swath, ["coradr_jpl_options.csv"], ["CORADR ID", "FILENAME"]))
+    catalog_diff = pydar.updateCsvCatalog._refresh_catalog(
+        ["coradr_jpl_options.csv", "swath_coverage_by_time_position.csv"])
+    assert len(catalog_diff["coradr_jpl_options.csv"]
+               ["removed"]) == len(live_coradr_dataframe) - 3
+    assert not any(
+        catalog_diff["swath_coverage_by_time_position.csv"].values())
+    assert staged_directories[0] == staged_directories[1]
+    assert os.path.dirname(
+        staged_directories[0]) == os.path.dirname(catalog_directory)
+    assert not os.path.exists(staged_directories[0])
+    assert pydar.catalog.CATALOG_DIRECTORY == catalog_directory
+    assert len(pydar._read_catalog_csv("coradr_jpl_options.csv")) == 3
+    assert sorted(os.listdir(catalog_directory)) == sorted(
+        pydar.catalog.CATALOG_DTYPES.keys())
+
+
+def test_refreshCatalog_verifyFailedStageLeavesCsvUnchanged(
+        catalog_directory, monkeypatch):
+    live_catalog_bytes = _catalog_bytes(catalog_directory)
+
+    def _update_coradr(catalog_directory=None):
+        pydar._write_catalog_csv(
+            "coradr_jpl_options.csv",
+            pydar._read_catalog_csv("coradr_jpl_options.csv").head(3),
+            catalog_directory)
+
+    def _update_features(catalog_directory=None):
+        raise ConnectionError("planetary names database unavailable")
+
+    monkeypatch.setitem(pydar.updateCsvCatalog.CATALOG_REFRESH_STAGES,
+                        "coradr_jpl_options.csv",
+                        (_update_coradr, [], ["CORADR ID"]))
+    monkeypatch.setitem(pydar.updateCsvCatalog.CATALOG_REFRESH_STAGES,
+                        "feature_name_details.csv",
+                        (_update_features, [], ["Feature Name"]))
+    with pytest.raises(ConnectionError,
+                       match="planetary names database unavailable"):
+        pydar.updateCsvCatalog._refresh_catalog(
+            ["coradr_jpl_options.csv", "feature_name_details.csv"])
+    assert _catalog_bytes(catalog_directory) == live_catalog_bytes
+    assert pydar.catalog.CATALOG_DIRECTORY == catalog_directory
+
+
+def test_refreshCatalog_verifyUnchangedSwathLabelsEmptyDiff(
+        cassini_stand_in, catalog_directory, monkeypatch):
+    # a full refresh from labels with the values of the bundled CSV (including the latitudes and
+    # longitudes with a space before their unit) reports no rows and leaves the CSV unchanged
+    live_catalog_bytes = _catalog_bytes(catalog_directory)
+    _serve_swath_labels(
+        cassini_stand_in,
+        pd.read_csv(os.path.join(catalog_directory,
+                                 "swath_coverage_by_time_position.csv"),
+                    dtype=str,
+                    keep_default_na=False))
+
+    def _update_swath(catalog_directory=None):
+        pydar.updateCsvSwathCoverage._update_csv_swath_coverage(
+            incremental=False,
+            cassini_orbiter_url=f"{cassini_stand_in.url}/cassini_orbiter",
+            catalog_directory=catalog_directory)
+
+    monkeypatch.setitem(
+        pydar.updateCsvCatalog.CATALOG_REFRESH_STAGES,
+        "swath_coverage_by_time_position.csv",
+        (_update_swath, ["coradr_jpl_options.csv"], ["CORADR ID", "FILENAME"]))
+    catalog_diff = pydar.updateCsvCatalog._refresh_catalog(
+        ["swath_coverage_by_time_position.csv"])
+    assert catalog_diff == {
+        "swath_coverage_by_time_position.csv": {
+            "added": [],
+            "removed": [],
+            "changed": []
+        }
+    }
+    assert _catalog_bytes(catalog_directory) == live_catalog_bytes
+
+
+## _refresh_catalog() #################################
@@ -0,0 +1,149 @@
+# Test Expected Error Messages from updateCsvFeatureNameDetails.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_updateCsvFeatureNameDetails.py
+
+# Standard Library Imports
+import os
+
+# Related Third Party Imports
+import pandas as pd
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.updateCsvFeatureNameDetails
+
+FEATURE_DETAILS = [
+    "Feature Name", "Northmost Latitude", "Southmost Latitude",
+    "Eastmost Longitude", "Westmost Longitude", "Center Latitude",
+    "Center Longitude"
+]
+
+
+def _feature_page(feature_name, center_latitude="-9.5"):
+    # Return a planetary names feature page with the details table of a Titan feature
+    feature_values = [
+        feature_name, "-9.2", "-9.8", "120.6", "121.2", center_latitude,
+        "120.9"
+    ]
+    table_rows = "".join(
+        f"<tr>\n<td>{detail}</td>\n<td>{value}{'' if detail == 'Feature Name' else ' &deg;'}</td>\n</tr>"
+        for detail, value in zip(FEATURE_DETAILS, feature_values))
+    return ('<html><body><table class="usa-table"><tbody>'
+            f'{table_rows}</tbody></table></body></html>').encode()
+
+
+@pytest.fixture
+def feature_stand_in(cassini_stand_in, tmp_path, monkeypatch):
+    # Serve the planetary names database from the stand-in, with an empty feature cache
+    monkeypatch.setattr(pydar.updateCsvFeatureNameDetails,
+                        "PLANETARY_NAMES_URL", cassini_stand_in.url)
+    monkeypatch.setattr(pydar.updateCsvFeatureNameDetails,
+                        "FEATURE_CACHE_DIRECTORY",
+                        str(tmp_path / "feature_cache"))
+    monkeypatch.setattr(pydar.updateCsvFeatureNameDetails,
+                        "_next_request_time", 0)
+    cassini_stand_in.files["/Feature/6981"] = _feature_page("Adiri")
+    return cassini_stand_in
+
+
+## _retrieve_feature() #################################
+def test_retrieveFeature_verifyNotModifiedUsesCache(feature_stand_in):
+    feature_url = f"{feature_stand_in.url}/Feature/6981"
+    feature_object = [
+        "Adiri", "-9.2", "-9.8", "120.6", "121.2", "-9.5", "120.9", feature_url
+    ]
+    assert pydar.updateCsvFeatureNameDetails._retrieve_feature(
+        feature_url, 0) == (feature_object, False)
+    assert os.path.exists(
+        pydar.updateCsvFeatureNameDetails._feature_cache_path(feature_url))
+    assert pydar.updateCsvFeatureNameDetails._retrieve_feature(
+        feature_url, 0) == (feature_object, True)
+    assert feature_stand_in.requests == ["/Feature/6981", "/Feature/6981"]
+    assert feature_stand_in.not_modified_requests == ["/Feature/6981"]
+
+
+def test_retrieveFeature_verifyChangedETagRetrievedAgain(feature_stand_in):
+    feature_url = f"{feature_stand_in.url}/Feature/6981"
+    pydar.updateCsvFeatureNameDetails._retrieve_feature(feature_url, 0)
+    feature_stand_in.files["/Feature/6981"] = _feature_page(
+        "Adiri", center_latitude="-9.4")
+    feature_object, is_cached = pydar.updateCsvFeatureNameDetails._retrieve_feature(
+        feature_url, 0)
+    assert not is_cached
+    assert feature_object[5] == "-9.4"
+    assert feature_stand_in.not_modified_requests == []
+    # the cache holds the changed page
+    assert pydar.updateCsvFeatureNameDetails._retrieve_feature(
+        feature_url, 0) == (feature_object, True)
+
+
+## _retrieve_feature() #################################
+
+
+## _wait_for_rate_limit() #################################
+def test_waitForRateLimit_verifyRequestsScheduledEvenly(monkeypatch):
+    current_time = [100.0]
+    sleep_times = []
+    monkeypatch.setattr(pydar.updateCsvFeatureNameDetails.time, "monotonic",
+                        lambda: current_time[0])
+    monkeypatch.setattr(pydar.updateCsvFeatureNameDetails.time, "sleep",
+                        sleep_times.append)
+    monkeypatch.setattr(pydar.updateCsvFeatureNameDetails,
+                        "_next_request_time", 0)
+
+    # requests sent at the same time are spaced 1/requests_per_second apart
+    for _ in range(4):
+        pydar.updateCsvFeatureNameDetails._wait_for_rate_limit(20)
+    assert sleep_times == pytest.approx([0, 0.05, 0.1, 0.15])
+
+    # a request after the schedule has passed is sent without waiting
+    current_time[0] = 101.0
+    sleep_times.clear()
+    pydar.updateCsvFeatureNameDetails._wait_for_rate_limit(20)
+    pydar.updateCsvFeatureNameDetails._wait_for_rate_limit(20)
+    assert sleep_times == pytest.approx([0, 0.05])
+
+
+def test_waitForRateLimit_verifyNoLimit(monkeypatch):
+    sleep_times = []
+    monkeypatch.setattr(pydar.updateCsvFeatureNameDetails.time, "sleep",
+                        sleep_times.append)
+    for _ in range(3):
+        pydar.updateCsvFeatureNameDetails._wait_for_rate_limit(0)
+    assert sleep_times == []
+
+
+## _wait_for_rate_limit() #################################
+
+
+## _update_csv_feature_name_details() #################################
+def test_updateCsvFeatureNameDetails_verifyEachRequestRateLimited(
+        feature_stand_in, catalog_directory, monkeypatch):
+    feature_links = []
+    for feature_number in range(8):
+        feature_name = f"Feature {feature_number}"
+        feature_stand_in.files[f"/Feature/{feature_number}"] = _feature_page(
+            feature_name)
+        feature_links.append(
+            f'<a href="/Feature/{feature_number}">{feature_name}</a>')
+    feature_stand_in.files["/SearchResults?Target=74_Titan"] = (
+        "<html>" + "".join(feature_links) + "</html>").encode()
+    rate_limits = []
+    monkeypatch.setattr(pydar.updateCsvFeatureNameDetails,
+                        "_wait_for_rate_limit", rate_limits.append)
+
+    pydar.updateCsvFeatureNameDetails._update_csv_feature_name_details(
+        max_workers=4, requests_per_second=20)
+    assert len(feature_stand_in.request_times) == 9
+    assert rate_limits == [20] * 9
+    feature_dataframe = pd.read_csv(os.path.join(catalog_directory,
+                                                 "feature_name_details.csv"),
+                                    dtype=str,
+                                    keep_default_na=False)
+    assert list(feature_dataframe["Feature Name"]) == [
+        f"Feature {feature_number}" for feature_number in range(8)
+    ] + ["Huygens Landing Site"]
+
+
+## _update_csv_feature_name_details() #################################
@@ -0,0 +1,256 @@
+# Test Expected Error Messages from updateCsvSwathCoverage.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_updateCsvSwathCoverage.py
+
+# Standard Library Imports
+import os
+
+# Related Third Party Imports
+import pandas as pd
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.updateCsvSwathCoverage
+
+
+def _bidr_label(product_id="BIBQD49N071_D035_T00AS01_V03",
+                start_time="2004-300T15:26:07.678",
+                stop_time="2004-300T15:49:08.325",
+                bounds=("56.8685008<DEG>", "20.5535518<DEG>",
+                        "357.8982558<DEG>", "137.5746891<DEG>")):
+    # Return a detached BIDR .LBL in the layout of the PDS labels (CRLF lines, times in the label
+    # header and the latitudes and longitudes in the IMAGE_MAP_PROJECTION object), where bounds are
+    # the maximum/minimum latitudes and easternmost/westernmost longitudes with their unit
+    label_lines = [
+        "PDS_VERSION_ID                  = PDS3",
+        "RECORD_TYPE                     = FIXED_LENGTH",
+        "RECORD_BYTES                    = 1024",
+        "^IMAGE                          = (\"" + product_id + ".IMG\", 1)",
+        "/* IDENTIFICATION DATA ELEMENTS */",
+        "DATA_SET_ID                     = \"CO-SSA-RADAR-5-BIDR-V1.0\"",
+        "PRODUCT_ID                      = \"" + product_id + "\"",
+        "INSTRUMENT_HOST_NAME            = \"CASSINI ORBITER\"",
+        "INSTRUMENT_NAME                 = \"CASSINI RADAR\"",
+        "TARGET_NAME                     = TITAN",
+        "START_TIME                      = " + start_time,
+        "STOP_TIME                       = " + stop_time,
+        "SPACECRAFT_CLOCK_START_COUNT    = \"1477410148.123\"",
+        "SPACECRAFT_CLOCK_STOP_COUNT     = \"1477411529.770\"",
+        "PRODUCT_CREATION_TIME           = 2007-079T18:03:55.000",
+        "OBJECT                          = IMAGE",
+        "  LINES                         = 4736",
+        "  LINE_SAMPLES                  = 11640",
+        "  SAMPLE_TYPE                   = PC_REAL",
+        "END_OBJECT                      = IMAGE",
+        "OBJECT                          = IMAGE_MAP_PROJECTION",
+        "  MAP_PROJECTION_TYPE           = \"OBLIQUE CYLINDRICAL\"",
+        "  MAP_RESOLUTION                = 8 <PIXEL/DEG>",
+        "  MAXIMUM_LATITUDE              = " + bounds[0],
+        "  MINIMUM_LATITUDE              = " + bounds[1],
+        "  EASTERNMOST_LONGITUDE         = " + bounds[2],
+        "  WESTERNMOST_LONGITUDE         = " + bounds[3],
+        "  OBLIQUE_PROJ_POLE_LATITUDE    = 8.8415 <DEG>",
+        "END_OBJECT                      = IMAGE_MAP_PROJECTION", "END"
+    ]
+    return ("\r\n".join(label_lines) + "\r\n").encode()
+
+
+def _write_coradr_options(catalog_directory, coradr_ids):
+    # Write a coradr_jpl_options.csv with the Titan flyby CORADR IDs that contain BIDR data
+    with open(os.path.join(catalog_directory, "coradr_jpl_options.csv"),
+              "w") as csv_file:
+        csv_file.write(
+            "CORADR ID,Is a Titan Flyby,Contains ABDR,Contains ASUM,Contains BIDR,Contains LBDR,Contains SBDR,Contains STDR\n"
+        )
+        for coradr_id in coradr_ids:
+            csv_file.write(
+                f"{coradr_id},True,False,False,True,True,True,True\n")
+    pydar._clear_catalog_cache()
+
+
+def _serve_bidr_labels(stand_in, coradr_id, version, start_time):
+    # Serve the I and D resolution BIDR labels of T8 (CORADR_0065) for a version of the CORADR ID,
+    # where the I resolution label has a space before the unit of its latitudes and longitudes
+    for resolution, unit in [("I", " <DEG>"), ("D", "<DEG>")]:
+        product_id = f"BIBQ{resolution}05S184_D065_T008S01_{version}"
+        lbl_path = f"/cassini_orbiter/{coradr_id}/DATA/BIDR/{product_id}.LBL"
+        stand_in.files[lbl_path] = _bidr_label(
+            product_id=product_id,
+            start_time=start_time,
+            bounds=tuple(bound + unit
+                         for bound in ["-1.25", "-8.75", "189.5", "178.5"]))
+
+
+def _swath_stand_in(stand_in, catalog_directory):
+    # Serve CORADR_0035 (Ta) and CORADR_0065_V02 (T8) and refresh the full swath coverage CSV
+    lbl_path = "/cassini_orbiter/CORADR_0035/DATA/BIDR/BIBQD49N071_D035_T00AS01_V03.LBL"
+    stand_in.files[lbl_path] = _bidr_label()
+    _serve_bidr_labels(stand_in, "CORADR_0065_V02", "V02",
+                       "2005-301T03:54:10.000")
+    _write_coradr_options(catalog_directory,
+                          ["CORADR_0035", "CORADR_0065_V02"])
+    pydar.updateCsvSwathCoverage._update_csv_swath_coverage(
+        incremental=False,
+        cassini_orbiter_url=f"{stand_in.url}/cassini_orbiter")
+    stand_in.requests.clear()
+    stand_in.range_requests.clear()
+
+
+def _read_swath_csv(catalog_directory):
+    # Read swath_coverage_by_time_position.csv as text
+    return pd.read_csv(os.path.join(catalog_directory,
+                                    "swath_coverage_by_time_position.csv"),
+                       dtype=str,
+                       keep_default_na=False)
+
+
+## _parse_lbl_keywords() #################################
+@pytest.mark.parametrize("product_id, bounds",
+                         [("BIBQD49N071_D035_T00AS01_V03",
+                           ("56.8685008<DEG>", "20.5535518<DEG>",
+                            "357.8982558<DEG>", "137.5746891<DEG>")),
+                          ("BIXQI49N071_D035_T00AS01_V03",
+                           ("56.86850084 <DEG>", "20.55355182 <DEG>",
+                            "357.89825582 <DEG>", "137.57468919 <DEG>"))])
+def test_parseLblKeywords_verifyBIDRLabelMatchesCSV(product_id, bounds):
+    # the I resolution label has a space before the unit, which the bundled CSV keeps
+    lbl_keywords = pydar.updateCsvSwathCoverage._parse_lbl_keywords(
+        _bidr_label(product_id=product_id, bounds=bounds).decode("UTF-8"))
+    swath_row = pydar.updateCsvSwathCoverage._swath_lbl_row(
+        "CORADR_0035", f"{product_id}.LBL", lbl_keywords)
+    swath_dataframe = pd.read_csv(
+        pydar._catalog_csv_path("swath_coverage_by_time_position.csv"),
+        dtype=str,
+        keep_default_na=False)
+    assert [str(value) for value in swath_row] == list(swath_dataframe[
+        swath_dataframe["FILENAME"] == f"{product_id}.LBL"].iloc[0])
+
+
+def test_parseLblKeywords_verifyDuplicateKeywordFirstValueKept():
+    lbl_text = _bidr_label().decode("UTF-8").replace(
+        "END\r\n",
+        "OBJECT = HISTORY\r\n  START_TIME = 2007-079T18:03:55.000\r\n"
+        "  TARGET_NAME = SATURN\r\nEND_OBJECT = HISTORY\r\nEND\r\n")
+    lbl_keywords = pydar.updateCsvSwathCoverage._parse_lbl_keywords(lbl_text)
+    assert lbl_keywords["START_TIME"] == "2004-300T15:26:07.678"
+    assert lbl_keywords["TARGET_NAME"] == "TITAN"
+
+
+def test_parseLblKeywords_verifyLongerKeywordsAndCommentsIgnored():
+    lbl_text = _bidr_label().decode("UTF-8").replace(
+        "TARGET_NAME ",
+        "/* START_TIME = time of the first burst */\r\nTARGET_NAME_ALIAS = "
+        "\"TITAN A\"\r\nTARGET_NAME ").replace(
+            "  MAXIMUM_LATITUDE ",
+            "  MAXIMUM_LATITUDE_ERROR = 0.5<DEG>\r\n  MAXIMUM_LATITUDE ")
+    assert pydar.updateCsvSwathCoverage._parse_lbl_keywords(lbl_text) == {
+        "TARGET_NAME": "TITAN",
+        "MAXIMUM_LATITUDE": "56.8685008",
+        "MINIMUM_LATITUDE": "20.5535518",
+        "EASTERNMOST_LONGITUDE": "357.8982558",
+        "WESTERNMOST_LONGITUDE": "137.5746891",
+        "START_TIME": "2004-300T15:26:07.678",
+        "STOP_TIME": "2004-300T15:49:08.325"
+    }
+
+
+## _parse_lbl_keywords() #################################
+
+
+## _read_lbl_keywords() #################################
+def test_readLblKeywords_verifyHeaderRangeRequest(cassini_stand_in):
+    lbl_path = "/files/BIBQD49N071_D035_T00AS01_V03.LBL"
+    cassini_stand_in.files[lbl_path] = _bidr_label()
+    lbl_keywords = pydar.updateCsvSwathCoverage._read_lbl_keywords(
+        f"{cassini_stand_in.url}{lbl_path}", 8192)
+    assert lbl_keywords == pydar.updateCsvSwathCoverage._parse_lbl_keywords(
+        _bidr_label().decode("UTF-8"))
+    assert cassini_stand_in.requests == [lbl_path]
+    assert cassini_stand_in.range_requests == [(lbl_path, "bytes=0-8191")]
+
+
+def test_readLblKeywords_verifyFullLabelWhenKeywordBeyondHeader(
+        cassini_stand_in):
+    lbl_path = "/files/BIBQD49N071_D035_T00AS01_V03.LBL"
+    cassini_stand_in.files[lbl_path] = _bidr_label()
+    # header ends within the STOP_TIME line and before IMAGE_MAP_PROJECTION
+    header_bytes = _bidr_label().index(b"STOP_TIME") + 40
+    lbl_keywords = pydar.updateCsvSwathCoverage._read_lbl_keywords(
+        f"{cassini_stand_in.url}{lbl_path}", header_bytes)
+    assert lbl_keywords == pydar.updateCsvSwathCoverage._parse_lbl_keywords(
+        _bidr_label().decode("UTF-8"))
+    assert lbl_keywords["STOP_TIME"] == "2004-300T15:49:08.325"
+    assert cassini_stand_in.requests == [lbl_path, lbl_path]
+    assert cassini_stand_in.range_requests == [(lbl_path,
+                                                f"bytes=0-{header_bytes - 1}")]
+
+
+## _read_lbl_keywords() #################################
+
+
+## _update_csv_swath_coverage() #################################
+def test_updateCsvSwathCoverage_verifyNewVersionReplacesOld(
+        cassini_stand_in, catalog_directory):
+    _swath_stand_in(cassini_stand_in, catalog_directory)
+    previous_dataframe = _read_swath_csv(catalog_directory)
+    _serve_bidr_labels(cassini_stand_in, "CORADR_0065_V03", "V03",
+                       "2005-301T03:54:10.960")
+    _write_coradr_options(
+        catalog_directory,
+        ["CORADR_0035", "CORADR_0065_V02", "CORADR_0065_V03"])
+
+    assert pydar.updateCsvSwathCoverage._update_csv_swath_coverage(
+        cassini_orbiter_url=f"{cassini_stand_in.url}/cassini_orbiter") == [
+            "CORADR_0065_V03"
+        ]
+    assert all(
+        path.startswith("/cassini_orbiter/CORADR_0065_V03/")
+        for path in cassini_stand_in.requests)
+    updated_dataframe = _read_swath_csv(catalog_directory)
+    assert list(updated_dataframe["CORADR ID"]) == [
+        "CORADR_0035", "CORADR_0065_V03", "CORADR_0065_V03"
+    ]
+    assert list(updated_dataframe["MAXIMUM_LATITUDE (Degrees)"]) == [
+        "56.8685008", "-1.25", "-1.25 "
+    ]
+    assert set(
+        updated_dataframe["START_TIME"].iloc[1:]) == {"2005-301T03:54:10.960"}
+    assert updated_dataframe.iloc[0].equals(previous_dataframe.iloc[0])
+
+
+def test_updateCsvSwathCoverage_verifyUnchangedIDsSkipped(
+        cassini_stand_in, catalog_directory):
+    _swath_stand_in(cassini_stand_in, catalog_directory)
+    csv_path = os.path.join(catalog_directory,
+                            "swath_coverage_by_time_position.csv")
+    csv_modified = os.stat(csv_path).st_mtime_ns
+    assert pydar.updateCsvSwathCoverage._update_csv_swath_coverage(
+        cassini_orbiter_url=f"{cassini_stand_in.url}/cassini_orbiter") == []
+    assert cassini_stand_in.requests == []
+    assert os.stat(csv_path).st_mtime_ns == csv_modified
+
+
+def test_updateCsvSwathCoverage_verifySameAsFullRefresh(
+        cassini_stand_in, catalog_directory):
+    _swath_stand_in(cassini_stand_in, catalog_directory)
+    _serve_bidr_labels(cassini_stand_in, "CORADR_0065_V03", "V03",
+                       "2005-301T03:54:10.960")
+    _write_coradr_options(
+        catalog_directory,
+        ["CORADR_0035", "CORADR_0065_V02", "CORADR_0065_V03"])
+    csv_path = os.path.join(catalog_directory,
+                            "swath_coverage_by_time_position.csv")
+
+    pydar.updateCsvSwathCoverage._update_csv_swath_coverage(
+        cassini_orbiter_url=f"{cassini_stand_in.url}/cassini_orbiter")
+    with open(csv_path, "rb") as csv_file:
+        incremental_csv = csv_file.read()
+    pydar.updateCsvSwathCoverage._update_csv_swath_coverage(
+        incremental=False,
+        cassini_orbiter_url=f"{cassini_stand_in.url}/cassini_orbiter")
+    with open(csv_path, "rb") as csv_file:
+        assert csv_file.read() == incremental_csv
+
+
+## _update_csv_swath_coverage() #################################
@@ -0,0 +1,286 @@
+# Test Expected Error Messages from zip_extraction.py
+# centerline-width/: python -m pytest -v
+# python -m pytest -k test_error_zip_extraction.py
+
+# Standard Library Imports
+import os
+import re
+import zipfile
+
+# Related Third Party Imports
+import pytest
+
+# Internal Local Imports
+import pydar
+import pydar.downloader
+import pydar.extract_flyby_parameters
+import pydar.zip_extraction
+
+
+def _write_zip(zipfile_name, members, compression=zipfile.ZIP_STORED):
+    # Write a ZIP with {member name: bytes} members
+    with zipfile.ZipFile(zipfile_name, "w", compression) as zip_ref:
+        for member_name, member_bytes in members.items():
+            zip_ref.writestr(member_name, member_bytes)
+    return str(zipfile_name)
+
+
+def _corrupt_zip_member(zipfile_name):
+    # Flip the last byte of the data of the first (stored) member of a ZIP
+    with zipfile.ZipFile(zipfile_name) as zip_ref:
+        zip_info = zip_ref.infolist()[0]
+        data_end = pydar.zip_extraction._zip_member_data_offset(
+            zip_ref, zip_info) + zip_info.compress_size
+    with open(zipfile_name, "r+b") as zip_file:
+        zip_file.seek(data_end - 1)
+        last_byte = zip_file.read(1)
+        zip_file.seek(data_end - 1)
+        zip_file.write(bytes([last_byte[0] ^ 0xFF]))
+
+
+## _extract_zip_file() #################################
+def test_extractZipFile_verifyExtractedFiles(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {
+        "BIDR.IMG": b"IMG" * 1000,
+        "BIDR_NOTES.TXT": b"notes"
+    }, zipfile.ZIP_DEFLATED)
+    assert pydar._extract_zip_file(zipfile_name) == {
+        "BIDR.IMG": 3000,
+        "BIDR_NOTES.TXT": 5
+    }
+    with open(tmp_path / "BIDR.IMG", "rb") as image_file:
+        assert image_file.read() == b"IMG" * 1000
+    assert os.path.exists(zipfile_name)
+    assert sorted(
+        os.listdir(tmp_path)) == ["BIDR.IMG", "BIDR.zip", "BIDR_NOTES.TXT"]
+
+
+def test_extractZipFile_verifyExtractEvent(tmp_path, monkeypatch):
+    download_events = []
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_PROGRESS_HOOK",
+                        download_events.append)
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {"BIDR.IMG": b"IMG"})
+    pydar._extract_zip_file(zipfile_name)
+    assert download_events[0]["event"] == "extract"
+    assert download_events[0]["file_path"] == zipfile_name
+    assert download_events[0]["files_extracted"] == 1
+    assert download_events[0]["bytes_extracted"] == 3
+    assert download_events[0]["duration_seconds"] >= 0
+
+
+def test_extractZipFile_verifyZipRemovedOnce(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {"BIDR.IMG": b"IMG"})
+    pydar._extract_zip_file(zipfile_name, delete_zip_file=True)
+    assert os.listdir(tmp_path) == ["BIDR.IMG"]
+
+
+def test_extractZipFile_invalidCRC(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {"BIDR.IMG": b"IMG" * 10})
+    _corrupt_zip_member(zipfile_name)
+    with pytest.raises(zipfile.BadZipFile,
+                       match=re.escape("Bad CRC-32 for file 'BIDR.IMG'")):
+        pydar._extract_zip_file(zipfile_name, delete_zip_file=True)
+    assert os.listdir(tmp_path) == ["BIDR.zip"]
+
+
+def test_extractZipFile_memberOutsideDirectory(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {"../BIDR.IMG": b"IMG"})
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"Unable to extract '../BIDR.IMG' outside of {tmp_path}")):
+        pydar._extract_zip_file(zipfile_name)
+
+
+## _extract_zip_file() #################################
+
+
+## _extract_zip_files() #################################
+def test_downloadCORADRData_verifyZipRemovedAfterExtract(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pydar.zip_extraction, "ZIP_DELETE_AFTER_EXTRACT", True)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    for _ in range(2):
+        pydar.extract_flyby_parameters._download_bidr_coradr_data(
+            "CORADR_0035_V03", "S01", ["I"])
+    assert sorted(os.listdir("pydar_results/CORADR_0035_V03_S01")) == [
+        "BIBQI49N071_D035_T00AS01_V03.IMG", "BIBQI49N071_D035_T00AS01_V03.LBL",
+        "pydar_manifest.json"
+    ]
+    downloaded_paths = [
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ]
+    assert sorted(downloaded_paths) == sorted(set(downloaded_paths))
+    manifest = pydar._read_manifest("pydar_results/CORADR_0035_V03_S01")
+    assert manifest["BIBQI49N071_D035_T00AS01_V03.zip"]["extracted"] == {
+        "BIBQI49N071_D035_T00AS01_V03.IMG": len(b"IMG S01")
+    }
+
+
+def test_downloadCORADRData_verifyZipRemovedFromDownloadCache(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pydar.downloader, "DOWNLOAD_CACHE_ENABLED", True)
+    monkeypatch.setattr(pydar.zip_extraction, "ZIP_DELETE_AFTER_EXTRACT", True)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    pydar.extract_flyby_parameters._download_bidr_coradr_data(
+        "CORADR_0035_V03", "S01", ["I"])
+    cached_files = {}
+    for cache_root, _, cache_filenames in os.walk(
+            pydar.downloader.DOWNLOAD_CACHE_DIRECTORY):
+        for cache_filename in cache_filenames:
+            if cache_filename != pydar.downloader.DOWNLOAD_CACHE_LOCK_FILENAME:
+                with open(os.path.join(cache_root, cache_filename),
+                          "rb") as cached_file:
+                    cached_files[cache_filename] = cached_file.read()
+    # only the LBL is kept in the download cache, the extracted ZIP is removed
+    assert list(cached_files.values()) == [b"LBL S01"]
+
+
+def test_downloadCORADRData_verifyZipKeptWhenExtractDisabled(
+        cassini_stand_in, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pydar.zip_extraction, "ZIP_EXTRACT_ENABLED", False)
+    os.makedirs("pydar_results/CORADR_0035_V03_S01")
+    for _ in range(2):
+        pydar.extract_flyby_parameters._download_bidr_coradr_data(
+            "CORADR_0035_V03", "S01", ["I"])
+    assert sorted(os.listdir("pydar_results/CORADR_0035_V03_S01")) == [
+        "BIBQI49N071_D035_T00AS01_V03.LBL", "BIBQI49N071_D035_T00AS01_V03.zip",
+        "pydar_manifest.json"
+    ]
+    assert len([
+        path for path in cassini_stand_in.requests if not path.endswith("/")
+    ]) == 2
+    assert bytes(
+        pydar.read_zip_image(
+            "pydar_results/CORADR_0035_V03_S01/BIBQI49N071_D035_T00AS01_V03.zip"
+        )) == b"IMG S01"
+
+
+def test_extractZipFiles_verifyZipWithoutManifestEntry(cassini_stand_in,
+                                                       tmp_path):
+    zip_path = "/cassini_orbiter/CORADR_0035_V03/DATA/BIDR/BIBQI49N071_D035_T00AS01_V03.ZIP"
+    zipfile_name = str(tmp_path / "BIBQI49N071_D035_T00AS01_V03.zip")
+    with open(zipfile_name, "wb") as zip_file:
+        zip_file.write(cassini_stand_in.files[zip_path])
+    pydar._extract_zip_files(
+        str(tmp_path), [(f"{cassini_stand_in.url}{zip_path}", zipfile_name)])
+    manifest = pydar._read_manifest(str(tmp_path))
+    assert manifest["BIBQI49N071_D035_T00AS01_V03.zip"]["url"] == (
+        f"{cassini_stand_in.url}{zip_path}")
+    assert manifest["BIBQI49N071_D035_T00AS01_V03.zip"]["extracted"] == {
+        "BIBQI49N071_D035_T00AS01_V03.IMG": len(b"IMG S01")
+    }
+
+
+def test_extractMany_verifyZipRemovedAfterExtract(coradr_0065_stand_in,
+                                                  monkeypatch):
+    monkeypatch.setattr(pydar.zip_extraction, "ZIP_DELETE_AFTER_EXTRACT", True)
+    extract_report = pydar.extract_many(requests=[("T8", "S01",
+                                                   "I"), ("T8", "S02", "I")])
+    assert list(extract_report["status"]) == ["complete"] * 2
+    assert (extract_report["bytes_downloaded"] > 0).all()
+    assert not any(
+        filename.endswith(".zip")
+        for filename in os.listdir("pydar_results/CORADR_0065_V03_S01"))
+    assert "BIBQI05S184_D065_T008S01_V03.IMG" in os.listdir(
+        "pydar_results/CORADR_0065_V03_S01")
+
+
+## _extract_zip_files() #################################
+
+
+## read_zip_image() #################################
+@pytest.mark.parametrize("compression", [(zipfile.ZIP_STORED),
+                                         (zipfile.ZIP_DEFLATED)])
+def test_readZipImage_verifyImageBytes(tmp_path, compression):
+    image_bytes = bytes(range(256)) * 100
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {"BIDR.IMG": image_bytes},
+                              compression)
+    zip_image = pydar.read_zip_image(zipfile_name)
+    assert zip_image.readonly
+    assert bytes(zip_image) == image_bytes
+    assert os.listdir(tmp_path) == ["BIDR.zip"]
+
+
+def test_readZipImage_verifyImageName(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {
+        "BIDR_1.IMG": b"IMG 1",
+        "BIDR_2.IMG": b"IMG 2"
+    })
+    assert bytes(pydar.read_zip_image(zipfile_name,
+                                      image_name="BIDR_2.IMG")) == b"IMG 2"
+
+
+def test_readZipImage_invalidCRC(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {"BIDR.IMG": b"IMG" * 10})
+    _corrupt_zip_member(zipfile_name)
+    with pytest.raises(zipfile.BadZipFile,
+                       match=re.escape("Bad CRC-32 for file 'BIDR.IMG'")):
+        pydar.read_zip_image(zipfile_name)
+
+
+def test_readZipImage_zipfileNameRequired():
+    with pytest.raises(
+            ValueError,
+            match=re.escape("[zipfile_name]: zipfile_name is required")):
+        pydar.read_zip_image()
+
+
+@pytest.mark.parametrize("invalid_input, error_output",
+                         [(1961, "<class 'int'>"),
+                          (["BIDR.zip"], "<class 'list'>")])
+def test_readZipImage_zipfileNameInvalidTypes(invalid_input, error_output):
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[zipfile_name]: Must be a str, current type = '{error_output}'"
+            )):
+        pydar.read_zip_image(zipfile_name=invalid_input)
+
+
+def test_readZipImage_zipfileNameNotFound(tmp_path):
+    zipfile_name = str(tmp_path / "missing.zip")
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[zipfile_name]: '{zipfile_name}' does not exist")):
+        pydar.read_zip_image(zipfile_name=zipfile_name)
+
+
+def test_readZipImage_imageNameInvalidTypes(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {"BIDR.IMG": b"IMG"})
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "[image_name]: Must be a str, current type = '<class 'int'>'")
+    ):
+        pydar.read_zip_image(zipfile_name=zipfile_name, image_name=1)
+
+
+def test_readZipImage_imageNameRequired(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {
+        "BIDR_1.IMG": b"IMG 1",
+        "BIDR_2.IMG": b"IMG 2"
+    })
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[image_name]: Requires image_name when {zipfile_name} does not contain a single IMG file, IMG files found = ['BIDR_1.IMG', 'BIDR_2.IMG']"
+            )):
+        pydar.read_zip_image(zipfile_name=zipfile_name)
+
+
+def test_readZipImage_imageNameNotFound(tmp_path):
+    zipfile_name = _write_zip(tmp_path / "BIDR.zip", {"BIDR.IMG": b"IMG"})
+    with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"[image_name]: 'OTHER.IMG' not in {zipfile_name}, IMG files found = ['BIDR.IMG']"
+            )):
+        pydar.read_zip_image(zipfile_name=zipfile_name, image_name="OTHER.IMG")
+
+
+## read_zip_image() #################################
@@ -11,6 +11,89 @@
 #                                              values and returns a dictionary of feature         #
 #                                              details                                            #
 #                                                                                                 #
+#                                       - _build_feature_rows: backend to collect the             #
+#                                              latitude/longitude details of each feature         #
+#                                                                                                 #
+#                                       - _build_feature_bounds: backend to build the             #
+#                                              latitude/longitude bound arrays for each           #
+#                                              feature                                            #
+#                                                                                                 #
+#                                       - _retrieve_feature_bounds: backend to return             #
+#                                              the cached feature bound arrays                    #
+#                                                                                                 #
+#                                       - _search_feature_bounds_many: backend to                 #
+#                                              return the features overlapping many               #
+#                                              latitude/longitude ranges at once                  #
+#                                                                                                 #
+#                                       - _build_swath_segments: backend to build a               #
+#                                              flyby/segment code for each swath row              #
+#                                                                                                 #
+#                                       - _build_swath_bounds: backend to build the               #
+#                                              latitude/longitude bound arrays for each           #
+#                                              swath row                                          #
+#                                                                                                 #
+#                                       - _retrieve_swath_bounds: backend to return               #
+#                                              the cached swath bound arrays                      #
+#                                                                                                 #
+#                                       - _build_swath_boxes: backend to collapse the             #
+#                                              swath rows into unique bounding boxes              #
+#                                                                                                 #
+#                                       - _retrieve_swath_boxes: backend to return                #
+#                                              the cached unique swath bounding boxes             #
+#                                                                                                 #
+#                                       - _grid_cell: backend to return the grid cell             #
+#                                              number for latitude/longitude degrees              #
+#                                                                                                 #
+#                                       - _build_swath_grid: backend to build a uniform           #
+#                                              latitude/longitude grid over the swath             #
+#                                              bounding boxes                                     #
+#                                                                                                 #
+#                                       - _search_swath_grid: backend to return the               #
+#                                              candidate swath boxes for a latitude/longitude     #
+#                                              range from the grid                                #
+#                                                                                                 #
+#                                       - _expand_ranges: backend to expand start/count           #
+#                                              ranges into one array of positions                 #
+#                                                                                                 #
+#                                       - _search_swath_boxes_many: backend to return             #
+#                                              the swath boxes matching many latitude/            #
+#                                              longitude ranges at once                           #
+#                                                                                                 #
+#                                       - _build_swath_times: backend to parse the                #
+#                                              swath START_TIME/STOP_TIME fields into             #
+#                                              millisecond arrays                                 #
+#                                                                                                 #
+#                                       - _retrieve_swath_epoch_ms: backend to return             #
+#                                              the cached swath epoch milliseconds for            #
+#                                              the user defined time fields                       #
+#                                                                                                 #
+#                                       - _retrieve_swath_time_index: backend to return           #
+#                                              the cached interval index sorted by swath          #
+#                                              start time with a running maximum stop time        #
+#                                                                                                 #
+#                                       - _search_swath_time_index: backend to binary             #
+#                                              search the interval index for swath rows           #
+#                                              that overlap a time range                          #
+#                                                                                                 #
+#                                       - _datetime_to_epoch_ms: backend to convert               #
+#                                              a datetime into epoch milliseconds                 #
+#                                                                                                 #
+#                                       - _latlon_query_ranges: backend to convert                #
+#                                              latitude/longitude points or ranges into           #
+#                                              range arrays                                       #
+#                                                                                                 #
+#                                       - _time_query_epoch_ms: backend to convert                #
+#                                              dataframe time columns into epoch                  #
+#                                              milliseconds                                       #
+#                                                                                                 #
+#                                       - _group_flyby_segments: backend to group                 #
+#                                              matching swath rows into a dictionary of           #
+#                                              flyby IDs and segment numbers                      #
+#                                                                                                 #
+#                                       - _long_format_flyby_segments: backend to                 #
+#                                              convert matching queries and swath rows            #
+#                                              into a dataframe of flyby IDs and segments         #
+#                                                                                                 #
 #                                       - ids_from_feature_name: Returns a dictionary of          #
 #                                              flyby IDs and a list of segment numbers            #
 #                                              based on feature names                             #
@@ -23,6 +106,10 @@
 #                                              flyby IDs and a list of segment numbers            #
 #                                              based on latitude and longitude range              #
 #                                                                                                 #
+#                                       - ids_from_latlon_many: Returns a dataframe               #
+#                                              of flyby IDs and segment numbers for many          #
+#                                              latitude/longitude points or ranges                #
+#                                                                                                 #
 #                                       - ids_from_time: Returns a dictionary of flyby            #
 #                                              IDs and a list of segment numbers based            #
 #                                              on a specific timestamp                            #
@@ -31,6 +118,10 @@
 #                                              flyby IDs and a list of segment numbers            #
 #                                              based on time range                                #
 #                                                                                                 #
+#                                       - ids_from_time_many: Returns a dataframe                 #
+#                                              of flyby IDs and segment numbers for many          #
+#                                              timestamps or time ranges                          #
+#                                                                                                 #
 #                                       - features_from_latlon: Returns a list of                 #
 #                                              feature names based on a specific latitude         #
 #                                              and longitude                                      #
@@ -39,6 +130,10 @@
 #                                              feature names based on a range of latitude         #
 #                                              and longitude coordinates                          #
 #                                                                                                 #
+#                                       - features_from_latlon_many: Returns a dataframe          #
+#                                              of feature names for many latitude/longitude       #
+#                                              points or ranges                                   #
+#                                                                                                 #
 #                                                                                                 #
 #                                                                                                 #
 #                                                                                                 #
@@ -48,7 +143,6 @@
 # Standard Library Imports
 from datetime import datetime, timedelta
 import logging
-import os
 
 # Related Third Party Imports
 import pandas as pd
@@ -65,31 +159,510 @@ logger.setLevel(logging.INFO)
 stream_handler = logging.StreamHandler()
 logger.addHandler(stream_handler)
 
+SWATH_GRID_CELL_DEGREES = 10  # size of the latitude/longitude grid cells over the swath bounding boxes
+SWATH_GRID_MAX_SEARCH_CELLS = 64  # ranges touching more grid cells check every swath box instead
+
 
 ### COLLECT FEATURE NAME INFORMATION FROM feature_name_details.csv #####
 def _retrieve_latlon_with_feature_names_from_csv() -> dict:
     # Retrieve a list of Feature Names with a range of the associated latitude/longitude values
     #   Returns a Dictionary of Feature Name with feature details
-    feature_name_dict = {}
+    feature_dataframe = pydar._read_catalog_derived("feature_name_details.csv",
+                                                    "feature_rows",
+                                                    _build_feature_rows)
+    return feature_dataframe.to_dict(orient="index")
+
+
+def _build_feature_rows(feature_dataframe: pd.DataFrame) -> pd.DataFrame:
+    # Collect the latitude/longitude details of each feature, ignoring rows where
+    # Latitude/Longitude are empty (the last row is kept for repeated feature names)
+    #   Returns a DataFrame of feature details indexed by feature name
+    feature_rows = feature_dataframe[~feature_dataframe.isnull().any(axis=1)]
+    return feature_rows.groupby("Feature Name", sort=False)[[
+        "Southmost Latitude", "Northmost Latitude", "Eastmost Longitude",
+        "Westmost Longitude", "Center Latitude", "Center Longitude"
+    ]].last()
+
+
+def _build_feature_bounds(feature_dataframe: pd.DataFrame) -> dict:
+    # Build contiguous float arrays of the latitude/longitude bounds for each feature
+    #   Returns a Dictionary of feature names with minimum/maximum latitude and longitude arrays
+    feature_rows = _build_feature_rows(feature_dataframe)
+    latitudes = feature_rows[["Northmost Latitude",
+                              "Southmost Latitude"]].to_numpy(dtype=np.float64)
+    longitudes = feature_rows[["Westmost Longitude", "Eastmost Longitude"
+                               ]].to_numpy(dtype=np.float64)
+    return {
+        "feature_names": feature_rows.index.to_numpy(dtype=object),
+        "min_latitude": latitudes.min(axis=1),
+        "max_latitude": latitudes.max(axis=1),
+        "min_longitude": longitudes.min(axis=1),
+        "max_longitude": longitudes.max(axis=1)
+    }
+
+
+def _retrieve_feature_bounds() -> dict:
+    # Retrieve the feature bound arrays, built once per version of feature_name_details.csv
+    #   Returns a Dictionary of feature names with minimum/maximum latitude and longitude arrays
+    return pydar._read_catalog_derived("feature_name_details.csv",
+                                       "feature_bounds", _build_feature_bounds)
+
+
+def _search_feature_bounds_many(
+        min_latitude: np.ndarray = None,
+        max_latitude: np.ndarray = None,
+        min_longitude: np.ndarray = None,
+        max_longitude: np.ndarray = None,
+        chunk_size: int = 4096) -> tuple[np.ndarray, np.ndarray]:
+    # Find the features that overlap many latitude/longitude ranges at once by
+    # broadcasting chunks of ranges against all feature bounds
+    #   Returns the query index and feature number of each match (sorted by query, then
+    #   feature order in the CSV)
+    feature_bounds = _retrieve_feature_bounds()
+    query_matches = [np.empty(0, dtype=np.int64)]
+    feature_matches = [np.empty(0, dtype=np.int64)]
+    for chunk_start in range(0, len(min_latitude), chunk_size):
+        queries = slice(chunk_start, chunk_start + chunk_size)
+        overlaps = ((feature_bounds["min_latitude"][None, :]
+                     <= max_latitude[queries][:, None]) &
+                    (feature_bounds["max_latitude"][None, :]
+                     >= min_latitude[queries][:, None]) &
+                    (feature_bounds["min_longitude"][None, :]
+                     <= max_longitude[queries][:, None]) &
+                    (feature_bounds["max_longitude"][None, :]
+                     >= min_longitude[queries][:, None]))
+        query_position, feature_position = np.nonzero(overlaps)
+        query_matches.append(query_position + chunk_start)
+        feature_matches.append(feature_position)
+    return np.concatenate(query_matches), np.concatenate(feature_matches)
+
+
+### COLLECT SWATH INFORMATION FROM swath_coverage_by_time_position.csv ##
+def _build_swath_segments(swath_dataframe: pd.DataFrame) -> dict:
+    # Build a (flyby, segment) code for each row of the swath dataframe
+    #   Returns a Dictionary of a code per row and the (flyby, segment) for each code
+    flyby = swath_dataframe["FLYBY ID"].astype(str).to_numpy(dtype=object)
+    segment = ("S0" + swath_dataframe["SEGMENT NUMBER"].astype(str)).to_numpy(
+        dtype=object)
+    row_codes, flyby_segments = pd.factorize(
+        pd.Series(list(zip(flyby, segment)), dtype=object))
+    return {
+        "row_codes":
+        row_codes,
+        "flyby_segments":
+        list(flyby_segments),
+        "code_flyby":
+        np.array([flyby for flyby, _ in flyby_segments], dtype=object),
+        "code_segment":
+        np.array([segment for _, segment in flyby_segments], dtype=object)
+    }
+
+
+def _build_swath_bounds(swath_dataframe: pd.DataFrame) -> dict:
+    # Build contiguous float arrays of the latitude/longitude bounds for each swath row
+    #   Returns a Dictionary of minimum/maximum latitude and longitude arrays
+    east_longitude = swath_dataframe[
+        "EASTERNMOST_LONGITUDE (Degrees)"].to_numpy(dtype=np.float64)
+    west_longitude = swath_dataframe[
+        "WESTERNMOST_LONGITUDE (Degrees)"].to_numpy(dtype=np.float64)
+    return {
+        "min_latitude":
+        swath_dataframe["MINIMUM_LATITUDE (Degrees)"].to_numpy(
+            dtype=np.float64),
+        "max_latitude":
+        swath_dataframe["MAXIMUM_LATITUDE (Degrees)"].to_numpy(
+            dtype=np.float64),
+        "min_longitude":
+        np.minimum(east_longitude, west_longitude),
+        "max_longitude":
+        np.maximum(east_longitude, west_longitude)
+    }
+
+
+def _retrieve_swath_bounds() -> dict:
+    # Retrieve the cached latitude/longitude bound arrays for each swath row
+    return pydar._read_catalog_derived("swath_coverage_by_time_position.csv",
+                                       "swath_bounds", _build_swath_bounds)
+
+
+def _build_swath_boxes(swath_dataframe: pd.DataFrame) -> dict:
+    # Collapse the swath rows into their unique bounding boxes (rows for each
+    # resolution/data type of a segment share the same bounding box)
+    #   Returns a Dictionary of minimum/maximum latitude and longitude arrays for each
+    #   unique box, the box number of each swath row and the rows of each box (sorted
+    #   by box, then row) with the offset of each box into those rows
+    swath_bounds = _build_swath_bounds(swath_dataframe)
+    boxes, row_box = np.unique(np.column_stack([
+        swath_bounds["min_latitude"], swath_bounds["max_latitude"],
+        swath_bounds["min_longitude"], swath_bounds["max_longitude"]
+    ]),
+                               axis=0,
+                               return_inverse=True)
+    row_box = row_box.ravel()
+    box_offsets = np.zeros(len(boxes) + 1, dtype=np.int64)
+    box_offsets[1:] = np.cumsum(np.bincount(row_box, minlength=len(boxes)))
+    return {
+        "min_latitude": np.ascontiguousarray(boxes[:, 0]),
+        "max_latitude": np.ascontiguousarray(boxes[:, 1]),
+        "min_longitude": np.ascontiguousarray(boxes[:, 2]),
+        "max_longitude": np.ascontiguousarray(boxes[:, 3]),
+        "row_box": row_box,
+        "box_rows": np.argsort(row_box, kind="stable"),
+        "box_offsets": box_offsets
+    }
+
+
+def _retrieve_swath_boxes() -> dict:
+    # Retrieve the cached unique swath bounding boxes
+    return pydar._read_catalog_derived("swath_coverage_by_time_position.csv",
+                                       "swath_boxes", _build_swath_boxes)
+
+
+def _grid_cell(degrees: [int, float, np.ndarray] = None,
+               lower_bound: int = None,
+               cell_count: int = None) -> [int, np.ndarray]:
+    # Return the grid cell number for latitude/longitude degrees along one axis
+    if isinstance(degrees, np.ndarray):
+        cell = np.floor_divide(degrees - lower_bound,
+                               SWATH_GRID_CELL_DEGREES).astype(np.int64)
+        return np.clip(cell, 0, cell_count - 1)
+    cell = int((degrees - lower_bound) // SWATH_GRID_CELL_DEGREES)
+    return min(max(cell, 0), cell_count - 1)
+
+
+def _build_swath_grid(swath_dataframe: pd.DataFrame) -> dict:
+    # Build a uniform latitude/longitude grid over the unique swath bounding boxes,
+    # where each box is listed in every grid cell it touches
+    #   Returns a Dictionary of the grid shape, the boxes for all cells (sorted by cell,
+    #   then box) and the offset of each cell into those boxes
+    swath_boxes = _build_swath_boxes(swath_dataframe)
+    lat_cells = int(np.ceil(180 / SWATH_GRID_CELL_DEGREES))
+    lon_cells = int(np.ceil(360 / SWATH_GRID_CELL_DEGREES))
+    first_lat = _grid_cell(swath_boxes["min_latitude"], -90, lat_cells)
+    last_lat = _grid_cell(swath_boxes["max_latitude"], -90, lat_cells)
+    first_lon = _grid_cell(swath_boxes["min_longitude"], 0, lon_cells)
+    last_lon = _grid_cell(swath_boxes["max_longitude"], 0, lon_cells)
+
+    # Expand each box into one entry per grid cell it touches
+    lon_counts = last_lon - first_lon + 1
+    cell_counts = (last_lat - first_lat + 1) * lon_counts
+    boxes = np.repeat(np.arange(len(cell_counts)), cell_counts)
+    position_in_box = np.arange(len(boxes)) - np.repeat(
+        np.cumsum(cell_counts) - cell_counts, cell_counts)
+    cells = (
+        (first_lat[boxes] + position_in_box // lon_counts[boxes]) * lon_cells +
+        first_lon[boxes] + position_in_box % lon_counts[boxes])
+
+    order = np.lexsort((boxes, cells))
+    cell_offsets = np.zeros(lat_cells * lon_cells + 1, dtype=np.int64)
+    cell_offsets[1:] = np.cumsum(
+        np.bincount(cells, minlength=lat_cells * lon_cells))
+    return {
+        "lat_cells": lat_cells,
+        "lon_cells": lon_cells,
+        "cell_boxes": boxes[order],
+        "cell_offsets": cell_offsets
+    }
+
+
+def _search_swath_grid(min_latitude: [int, float] = None,
+                       max_latitude: [int, float] = None,
+                       min_longitude: [int, float] = None,
+                       max_longitude: [int, float] = None) -> np.ndarray:
+    # Retrieve the unique swath boxes listed in the grid cells a latitude/longitude range
+    # touches, building the grid on the first query
+    #   Returns the candidate box numbers
+    swath_grid = pydar._read_catalog_derived(
+        "swath_coverage_by_time_position.csv", "swath_grid", _build_swath_grid)
+    lat_cells = np.arange(
+        _grid_cell(min_latitude, -90, swath_grid["lat_cells"]),
+        _grid_cell(max_latitude, -90, swath_grid["lat_cells"]) + 1)
+    lon_cells = np.arange(
+        _grid_cell(min_longitude, 0, swath_grid["lon_cells"]),
+        _grid_cell(max_longitude, 0, swath_grid["lon_cells"]) + 1)
+    cells = (lat_cells[:, None] * swath_grid["lon_cells"] +
+             lon_cells[None, :]).ravel()
+
+    cell_offsets = swath_grid["cell_offsets"]
+    if len(cells) == 1:  # a single cell already has no repeated boxes
+        return swath_grid["cell_boxes"][
+            cell_offsets[cells[0]]:cell_offsets[cells[0] + 1]]
+    if len(cells
+           ) > SWATH_GRID_MAX_SEARCH_CELLS:  # large ranges check all boxes
+        return np.arange(len(_retrieve_swath_boxes()["min_latitude"]))
+    return np.unique(
+        np.concatenate([
+            swath_grid["cell_boxes"][cell_offsets[cell]:cell_offsets[cell + 1]]
+            for cell in cells
+        ]))
+
+
+def _expand_ranges(starts: np.ndarray = None,
+                   counts: np.ndarray = None) -> tuple[np.ndarray, np.ndarray]:
+    # Expand ranges [start, start + count) into one flat array of positions
+    #   Returns the range each position belongs to and the positions
+    owners = np.repeat(np.arange(len(counts)), counts)
+    positions = np.arange(len(owners)) + np.repeat(
+        starts - (np.cumsum(counts) - counts), counts)
+    return owners, positions
+
+
+def _search_swath_boxes_many(
+        min_latitude: np.ndarray = None,
+        max_latitude: np.ndarray = None,
+        min_longitude: np.ndarray = None,
+        max_longitude: np.ndarray = None,
+        chunk_size: int = 4096) -> tuple[np.ndarray, np.ndarray]:
+    # Find the swath boxes that contain many latitude/longitude ranges at once, where
+    # ranges within a single grid cell are tested only against the boxes in that cell
+    # and larger ranges are tested against all boxes in chunks
+    #   Returns the query index and box number of each match
+    swath_boxes = _retrieve_swath_boxes()
+    swath_grid = pydar._read_catalog_derived(
+        "swath_coverage_by_time_position.csv", "swath_grid", _build_swath_grid)
+
+    def _boxes_within(queries, boxes):
+        return ((swath_boxes["min_latitude"][boxes][None, :]
+                 <= max_latitude[queries][:, None]) &
+                (swath_boxes["max_latitude"][boxes][None, :]
+                 >= min_latitude[queries][:, None]) &
+                (swath_boxes["min_longitude"][boxes][None, :]
+                 <= min_longitude[queries][:, None]) &
+                (swath_boxes["max_longitude"][boxes][None, :]
+                 >= max_longitude[queries][:, None]))
+
+    first_lat = _grid_cell(min_latitude, -90, swath_grid["lat_cells"])
+    first_lon = _grid_cell(min_longitude, 0, swath_grid["lon_cells"])
+    single_cell = (
+        (first_lat == _grid_cell(max_latitude, -90, swath_grid["lat_cells"])) &
+        (first_lon == _grid_cell(max_longitude, 0, swath_grid["lon_cells"])))
+
+    query_matches = []
+    box_matches = []
+    cell_queries = np.flatnonzero(single_cell)
+    query_cells = (first_lat * swath_grid["lon_cells"] +
+                   first_lon)[cell_queries]
+    order = np.argsort(query_cells, kind="stable")
+    cells, cell_starts = np.unique(query_cells[order], return_index=True)
+    cell_stops = np.append(cell_starts[1:], len(order))
+    for cell, cell_start, cell_stop in zip(cells, cell_starts, cell_stops):
+        queries = cell_queries[order[cell_start:cell_stop]]
+        boxes = swath_grid["cell_boxes"][
+            swath_grid["cell_offsets"][cell]:swath_grid["cell_offsets"][cell +
+                                                                        1]]
+        query_position, box_position = np.nonzero(_boxes_within(
+            queries, boxes))
+        query_matches.append(queries[query_position])
+        box_matches.append(boxes[box_position])
+
+    wide_queries = np.flatnonzero(~single_cell)
+    all_boxes = np.arange(len(swath_boxes["min_latitude"]))
+    for chunk_start in range(0, len(wide_queries), chunk_size):
+        queries = wide_queries[chunk_start:chunk_start + chunk_size]
+        query_position, box_position = np.nonzero(
+            _boxes_within(queries, all_boxes))
+        query_matches.append(queries[query_position])
+        box_matches.append(box_position)
+
+    if len(query_matches) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(query_matches), np.concatenate(box_matches)
+
+
+def _build_swath_times(swath_dataframe: pd.DataFrame) -> dict:
+    # Parse START_TIME/STOP_TIME (YYYY-DOYThh:mm:ss.sss) once into int64 arrays of
+    # milliseconds for each field, where the day field is the epoch milliseconds
+    # of the start of the year plus the day of year
+    #   Returns a Dictionary of the fields for START_TIME and STOP_TIME
+    swath_times = {}
+    for time_column in ["START_TIME", "STOP_TIME"]:
+        timestamps = swath_dataframe[time_column].astype(str).str
+
+        def _field(start, stop=None):
+            return timestamps.slice(start, stop).astype(np.int64).to_numpy()
+
+        years_since_epoch = (_field(0, 4) - 1970).astype("datetime64[Y]")
+        start_of_year_days = years_since_epoch.astype("datetime64[D]").astype(
+            np.int64)
+        swath_times[time_column] = {
+            "day": (start_of_year_days + _field(5, 8)) * 86400000,
+            "hour": _field(9, 11) * 3600000,
+            "minute": _field(12, 14) * 60000,
+            "second": _field(15, 17) * 1000,
+            "millisecond": _field(18)
+        }
+    return swath_times
+
+
+def _retrieve_swath_epoch_ms(time_column: str = None,
+                             hour: bool = True,
+                             minute: bool = True,
+                             second: bool = True,
+                             millisecond: bool = True) -> np.ndarray:
+    # Retrieve the cached epoch milliseconds for each swath row, only including the
+    # hour/minute/second/millisecond fields that are set to True (others are set to 0)
+    #   Returns an int64 array of epoch milliseconds
+    def _build_swath_epoch_ms(swath_dataframe: pd.DataFrame) -> np.ndarray:
+        swath_times = pydar._read_catalog_derived(
+            "swath_coverage_by_time_position.csv", "swath_times",
+            _build_swath_times)[time_column]
+        epoch_ms = swath_times["day"].copy()
+        if hour: epoch_ms += swath_times["hour"]
+        if minute: epoch_ms += swath_times["minute"]
+        if second: epoch_ms += swath_times["second"]
+        if millisecond: epoch_ms += swath_times["millisecond"]
+        return epoch_ms
+
+    return pydar._read_catalog_derived(
+        "swath_coverage_by_time_position.csv",
+        f"{time_column} epoch ms {hour}-{minute}-{second}-{millisecond}",
+        _build_swath_epoch_ms)
+
+
+def _retrieve_swath_time_index(start_fields: tuple = (True, True, True, True),
+                               stop_fields: tuple = (True, True, True,
+                                                     True)) -> dict:
+    # Retrieve the cached interval index over the swath START_TIME/STOP_TIME, where
+    # start_fields/stop_fields are the (hour, minute, second, millisecond) fields included
+    #   Returns a Dictionary of the rows sorted by start time, their sorted start/stop
+    #   times and the running maximum of the stop times in that order
+    def _build_swath_time_index(swath_dataframe: pd.DataFrame) -> dict:
+        row_start_ms = _retrieve_swath_epoch_ms("START_TIME", *start_fields)
+        row_stop_ms = _retrieve_swath_epoch_ms("STOP_TIME", *stop_fields)
+        order = np.argsort(row_start_ms, kind="stable")
+        return {
+            "order": order,
+            "start_ms": row_start_ms[order],
+            "stop_ms": row_stop_ms[order],
+            "max_stop_ms": np.maximum.accumulate(row_stop_ms[order])
+        }
+
+    return pydar._read_catalog_derived(
+        "swath_coverage_by_time_position.csv",
+        f"time index {start_fields} {stop_fields}", _build_swath_time_index)
+
+
+def _search_swath_time_index(time_index: dict = None,
+                             start_ms: int = None,
+                             end_ms: int = None) -> np.ndarray:
+    # Binary search the interval index for rows that overlap start_ms to end_ms:
+    # rows after 'last' start after end_ms and rows before 'first' all stop before start_ms
+    #   Returns the overlapping row indices in CSV order
+    last = np.searchsorted(time_index["start_ms"], end_ms, side="right")
+    first = np.searchsorted(time_index["max_stop_ms"], start_ms, side="left")
+    if first >= last:
+        return np.empty(0, dtype=np.int64)
+    overlaps = time_index["stop_ms"][first:last] >= start_ms
+    return np.sort(time_index["order"][first:last][overlaps])
+
+
+def _datetime_to_epoch_ms(timestamp: datetime = None) -> int:
+    # Convert a datetime into epoch milliseconds to compare against swath times
+    return (timestamp -
+            datetime(year=1970, month=1, day=1)) // timedelta(milliseconds=1)
+
+
+def _latlon_query_ranges(points: [pd.DataFrame, np.ndarray] = None) -> dict:
+    # Convert latitude/longitude points or ranges (as a DataFrame or an array with the
+    # shape (N, 2) or (N, 4)) into ranges, where a point is a range of 0
+    #   Returns a Dictionary of minimum/maximum latitude and longitude arrays
+    if isinstance(points, pd.DataFrame):
+        if "latitude" in points.columns:
+            query_ranges = points[[
+                "latitude", "latitude", "longitude", "longitude"
+            ]].to_numpy(dtype=np.float64)
+        else:
+            query_ranges = points[[
+                "min_latitude", "max_latitude", "min_longitude",
+                "max_longitude"
+            ]].to_numpy(dtype=np.float64)
+    else:
+        query_ranges = points.astype(np.float64)
+        if query_ranges.shape[1] == 2:
+            query_ranges = query_ranges[:, [0, 0, 1, 1]]
+    return {
+        "min_latitude": np.ascontiguousarray(query_ranges[:, 0]),
+        "max_latitude": np.ascontiguousarray(query_ranges[:, 1]),
+        "min_longitude": np.ascontiguousarray(query_ranges[:, 2]),
+        "max_longitude": np.ascontiguousarray(query_ranges[:, 3])
+    }
+
+
+def _time_query_epoch_ms(timestamps: pd.DataFrame = None,
+                         prefix: str = "") -> tuple[np.ndarray, np.ndarray]:
+    # Convert the year/doy/hour/minute/second/millisecond columns of a dataframe (with an
+    # optional prefix such as 'start_') into epoch milliseconds, where missing or
+    # empty hour/minute/second/millisecond values are set to 0
+    #   Returns an int64 array of epoch milliseconds and a (N, 4) boolean array of which
+    #   hour/minute/second/millisecond fields are defined for each row
+    years = timestamps[prefix + "year"].to_numpy(dtype=np.float64).astype(
+        np.int64)
+    start_of_year_days = (
+        years - 1970).astype("datetime64[Y]").astype("datetime64[D]").astype(
+            np.int64)
+    epoch_ms = (start_of_year_days + timestamps[prefix + "doy"].to_numpy(
+        dtype=np.float64).astype(np.int64)) * 86400000
+
+    defined_fields = np.zeros((len(timestamps), 4), dtype=bool)
+    for i, (field, field_ms) in enumerate([("hour", 3600000),
+                                           ("minute", 60000), ("second", 1000),
+                                           ("millisecond", 1)]):
+        if prefix + field in timestamps.columns:
+            values = timestamps[prefix + field].to_numpy(dtype=np.float64)
+            defined_fields[:, i] = ~np.isnan(values)
+            epoch_ms += np.nan_to_num(values).astype(np.int64) * field_ms
+    return epoch_ms, defined_fields
+
+
+def _group_flyby_segments(row_indices: np.ndarray = None) -> dict:
+    # Group matching swath rows into flyby IDs with their unique segment numbers,
+    # ordered by the first row each flyby/segment appears in the CSV
+    #   Returns a Dictionary of Flyby IDs and a list of their segment numbers
+    swath_segments = pydar._read_catalog_derived(
+        "swath_coverage_by_time_position.csv", "swath_segments",
+        _build_swath_segments)
+    codes = swath_segments["row_codes"][row_indices]
+    unique_codes, first_row = np.unique(codes, return_index=True)
 
-    flyby_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data', 'feature_name_details.csv'
-    )  # get file's directory, up one level, /data/*.csv
-    flyby_dataframe = pd.read_csv(flyby_csv_file)
+    flyby_ids = {}  # {'flyby_id': ['S01', S03'] }
+    for code in unique_codes[np.argsort(first_row)]:
+        flyby, segment_number = swath_segments["flyby_segments"][code]
+        flyby_ids.setdefault(flyby, []).append(segment_number)
+    return flyby_ids
 
-    for index, row in flyby_dataframe.iterrows():
-        if not pd.isnull(
-                row).any():  # ignore rows where Latitude/Longitude are empty
-            feature_name_dict[row["Feature Name"]] = {
-                "Southmost Latitude": row["Southmost Latitude"],
-                "Northmost Latitude": row["Northmost Latitude"],
-                "Eastmost Longitude": row["Eastmost Longitude"],
-                "Westmost Longitude": row["Westmost Longitude"],
-                "Center Latitude": row["Center Latitude"],
-                "Center Longitude": row["Center Longitude"]
-            }
 
-    return feature_name_dict
+def _long_format_flyby_segments(query_index: np.ndarray = None,
+                                row_indices: np.ndarray = None,
+                                query_count: int = None) -> pd.DataFrame:
+    # Convert matching (query, swath row) pairs into one row per unique flyby/segment
+    # for each query, ordered by query and then by the first row each flyby/segment
+    # appears in the CSV (the same order as the single query functions)
+    #   Returns a DataFrame of query_index, flyby and segment
+    swath_segments = pydar._read_catalog_derived(
+        "swath_coverage_by_time_position.csv", "swath_segments",
+        _build_swath_segments)
+    order = np.lexsort((row_indices, query_index))
+    query_index = query_index[order]
+    codes = swath_segments["row_codes"][row_indices[order]]
+    _, first_match = np.unique(
+        query_index * len(swath_segments["flyby_segments"]) + codes,
+        return_index=True)
+    first_match = np.sort(first_match)
+
+    flyby_segments = pd.DataFrame({
+        "query_index":
+        query_index[first_match],
+        "flyby":
+        swath_segments["code_flyby"][codes[first_match]],
+        "segment":
+        swath_segments["code_segment"][codes[first_match]]
+    })
+    missing_queries = query_count - len(np.unique(query_index))
+    if missing_queries > 0:
+        logger.info(
+            f"\n[WARNING]: No IDs found for {missing_queries} of {query_count} queries\n"
+        )
+    return flyby_segments
 
 
 ### RETURN FLYBY IDS FOR A GIVEN FEATURE NAME ##########################
@@ -155,32 +728,23 @@ def ids_from_latlon_range(min_latitude: [int, float] = None,
                                                 min_longitude=min_longitude,
                                                 max_longitude=max_longitude)
 
-    swath_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data',
-        'swath_coverage_by_time_position.csv'
-    )  # get file's directory, up one level, /data/*.csv
-    swath_dataframe = pd.read_csv(swath_csv_file)
-
-    flyby_ids = {}  # {'flyby_id': ['S01', S03'] }
-    for index, row in swath_dataframe.iterrows():
-        flyby = str(row['FLYBY ID'])
-        # Check that given latitude/longitude range is within the flyby/segment's latitude/longitude
-        if float(row["MINIMUM_LATITUDE (Degrees)"]) <= max_latitude and float(
-                row["MAXIMUM_LATITUDE (Degrees)"]) >= min_latitude:
-            min_id_longitude = min([
-                float(row["EASTERNMOST_LONGITUDE (Degrees)"]),
-                float(row["WESTERNMOST_LONGITUDE (Degrees)"])
-            ])
-            max_id_longitude = max([
-                float(row["EASTERNMOST_LONGITUDE (Degrees)"]),
-                float(row["WESTERNMOST_LONGITUDE (Degrees)"])
-            ])
-            if min_id_longitude <= min_longitude and max_id_longitude >= max_longitude:
-                if flyby not in flyby_ids.keys():
-                    flyby_ids[flyby] = []
-                segment_number = "S0" + str(row["SEGMENT NUMBER"])
-                if segment_number not in flyby_ids[flyby]:
-                    flyby_ids[flyby].append(segment_number)
+    swath_boxes = _retrieve_swath_boxes()
+    candidate_boxes = _search_swath_grid(min_latitude=min_latitude,
+                                         max_latitude=max_latitude,
+                                         min_longitude=min_longitude,
+                                         max_longitude=max_longitude)
+
+    # Check that given latitude/longitude range is within the flyby/segment's latitude/longitude
+    within_range = (
+        (swath_boxes["min_latitude"][candidate_boxes] <= max_latitude) &
+        (swath_boxes["max_latitude"][candidate_boxes] >= min_latitude) &
+        (swath_boxes["min_longitude"][candidate_boxes] <= min_longitude) &
+        (swath_boxes["max_longitude"][candidate_boxes] >= max_longitude))
+    box_found = np.zeros(len(swath_boxes["min_latitude"]), dtype=bool)
+    box_found[candidate_boxes[within_range]] = True
+    flyby_ids = _group_flyby_segments(
+        np.flatnonzero(
+            box_found[swath_boxes["row_box"]]))  # {'flyby_id': ['S01', S03'] }
 
     if len(flyby_ids) == 0:
         logger.info(
@@ -190,6 +754,30 @@ def ids_from_latlon_range(min_latitude: [int, float] = None,
     return flyby_ids
 
 
+### RETURN FLYBY IDS FOR MANY LATITUDE/LONGITUDES OR RANGES #############
+def ids_from_latlon_many(
+        points: [pd.DataFrame, np.ndarray] = None) -> pd.DataFrame:
+    # Retrieve all Flyby Ids for many latitude/longitude points or ranges at once, where points
+    # is a DataFrame with the columns latitude/longitude (or min_latitude/max_latitude/
+    # min_longitude/max_longitude) or an array with the shape (N, 2) or (N, 4)
+    #   Returns a DataFrame of query_index, flyby and segment for each match
+    pydar._error_handling_id_from_lat_lon_many(points=points)
+
+    query_ranges = _latlon_query_ranges(points=points)
+    query_matches, box_matches = _search_swath_boxes_many(**query_ranges)
+
+    # Expand each matching box into its swath rows
+    swath_boxes = _retrieve_swath_boxes()
+    box_offsets = swath_boxes["box_offsets"]
+    match_owner, row_positions = _expand_ranges(
+        box_offsets[box_matches],
+        box_offsets[box_matches + 1] - box_offsets[box_matches])
+    return _long_format_flyby_segments(
+        query_index=query_matches[match_owner],
+        row_indices=swath_boxes["box_rows"][row_positions],
+        query_count=len(query_ranges["min_latitude"]))
+
+
 ### RETURN FLYBY IDS FOR A SPECIFIC TIME ###############################
 def ids_from_time(year: int = None,
                   doy: int = None,
@@ -206,12 +794,6 @@ def ids_from_time(year: int = None,
                                        second=second,
                                        millisecond=millisecond)
 
-    swath_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data',
-        'swath_coverage_by_time_position.csv'
-    )  # get file's directory, up one level, /data/*.csv
-    swath_dataframe = pd.read_csv(swath_csv_file)
-
     # Retrieve using the time range function for the same time for start/end
     flyby_ids = ids_from_time_range(start_year=year,
                                     start_doy=doy,
@@ -259,12 +841,6 @@ def ids_from_time_range(start_year: int = None,
         end_second=end_second,
         end_millisecond=end_millisecond)
 
-    swath_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data',
-        'swath_coverage_by_time_position.csv'
-    )  # get file's directory, up one level, /data/*.csv
-    swath_dataframe = pd.read_csv(swath_csv_file)
-
     # User Values: Set to a datetime object
     # Set default to 0 for all not defined values
     delta_hour = 0 if start_hour is None else start_hour
@@ -293,63 +869,21 @@ def ids_from_time_range(start_year: int = None,
         seconds=delta_second,
         milliseconds=delta_millisecond)
 
-    flyby_ids = {}  # {'flyby_id': ['S01', S03']
-    for index, row in swath_dataframe.iterrows():
-        flyby = str(row['FLYBY ID'])
-
-        start_time_year = int(row["START_TIME"][:4])
-        start_time_doy = int(row["START_TIME"][5:8])
-        start_time_hour = int(row["START_TIME"][9:11])
-        start_time_minute = int(row["START_TIME"][12:14])
-        start_time_second = int(row["START_TIME"][15:17])
-        start_time_millisecond = int(row["START_TIME"][18:])
-
-        stop_time_year = int(row["STOP_TIME"][:4])
-        stop_time_doy = int(row["STOP_TIME"][5:8])
-        stop_time_hour = int(row["STOP_TIME"][9:11])
-        stop_time_minute = int(row["STOP_TIME"][12:14])
-        stop_time_second = int(row["STOP_TIME"][15:17])
-        stop_time_millisecond = int(row["STOP_TIME"][18:])
-
-        # Row values: As datetime objects
-        # Set default to 0 for all not defined values
-        if start_hour is None: start_time_hour = 0
-        if start_minute is None: start_time_minute = 0
-        if start_second is None: start_time_second = 0
-        if start_millisecond is None: start_time_millisecond = 0
-
-        if end_hour is None: stop_time_hour = 0
-        if end_minute is None: stop_time_minute = 0
-        if end_second is None: stop_time_second = 0
-        if end_millisecond is None: stop_time_millisecond = 0
-
-        row_start_of_year_start_datetime = datetime(year=start_time_year,
-                                                    month=1,
-                                                    day=1)
-        row_start_datetime = row_start_of_year_start_datetime + timedelta(
-            days=start_time_doy,
-            hours=start_time_hour,
-            minutes=start_time_minute,
-            seconds=start_time_second,
-            milliseconds=start_time_millisecond)
-
-        row_start_of_year_stop_datetime = datetime(year=stop_time_year,
-                                                   month=1,
-                                                   day=1)
-        row_stop_datetime = row_start_of_year_stop_datetime + timedelta(
-            days=stop_time_doy,
-            hours=stop_time_hour,
-            minutes=stop_time_minute,
-            seconds=stop_time_second,
-            milliseconds=stop_time_millisecond)
-
-        if row_start_datetime <= end_datetime and row_stop_datetime >= start_datetime:
-            # Add Flyby ID and Segment Number to returned dict
-            if flyby not in flyby_ids.keys():
-                flyby_ids[flyby] = []
-            segment_number = "S0" + str(row["SEGMENT NUMBER"])
-            if segment_number not in flyby_ids[flyby]:
-                flyby_ids[flyby].append(segment_number)
+    # Row values: epoch milliseconds, ignoring fields that are not defined by the user
+    start_fields = tuple(
+        field is not None for field in
+        [start_hour, start_minute, start_second, start_millisecond])
+    stop_fields = tuple(
+        field is not None
+        for field in [end_hour, end_minute, end_second, end_millisecond])
+    time_index = _retrieve_swath_time_index(start_fields=start_fields,
+                                            stop_fields=stop_fields)
+    overlapping_rows = _search_swath_time_index(
+        time_index=time_index,
+        start_ms=_datetime_to_epoch_ms(start_datetime),
+        end_ms=_datetime_to_epoch_ms(end_datetime))
+    flyby_ids = _group_flyby_segments(
+        overlapping_rows)  # {'flyby_id': ['S01', S03']
 
     if len(flyby_ids) == 0:
         if start_datetime == end_datetime:  # only display one datetime if both are the same
@@ -364,6 +898,59 @@ def ids_from_time_range(start_year: int = None,
     return flyby_ids
 
 
+### RETURN FLYBY IDS FOR MANY TIMES OR TIME RANGES ######################
+def ids_from_time_many(
+        timestamps: [pd.DataFrame, dict] = None) -> pd.DataFrame:
+    # Retrieve Flyby IDs for many Timestamps YYYY-DOYThh:mm:ss.sss at once, where timestamps
+    # has the columns year/doy/hour/minute/second/millisecond (or the same columns with
+    # start_/end_ for time ranges) and hour/minute/second/millisecond columns can be
+    # left out or empty
+    #   Returns a DataFrame of query_index, flyby and segment for each match
+    pydar._error_handling_id_from_time_many(timestamps=timestamps)
+
+    if isinstance(timestamps, dict):
+        timestamps = pd.DataFrame(timestamps)
+    if "year" in timestamps.columns:
+        start_ms, start_fields = _time_query_epoch_ms(timestamps=timestamps)
+        end_ms, stop_fields = start_ms, start_fields
+    else:
+        start_ms, start_fields = _time_query_epoch_ms(timestamps=timestamps,
+                                                      prefix="start_")
+        end_ms, stop_fields = _time_query_epoch_ms(timestamps=timestamps,
+                                                   prefix="end_")
+
+    # Search the interval index once for each combination of defined fields
+    query_matches = [np.empty(0, dtype=np.int64)]
+    row_matches = [np.empty(0, dtype=np.int64)]
+    field_combinations, query_combination = np.unique(np.hstack(
+        [start_fields, stop_fields]),
+                                                      axis=0,
+                                                      return_inverse=True)
+    query_combination = query_combination.ravel()
+    for i, fields in enumerate(field_combinations):
+        queries = np.flatnonzero(query_combination == i)
+        time_index = _retrieve_swath_time_index(
+            start_fields=tuple(bool(field) for field in fields[:4]),
+            stop_fields=tuple(bool(field) for field in fields[4:]))
+        last = np.searchsorted(time_index["start_ms"],
+                               end_ms[queries],
+                               side="right")
+        first = np.searchsorted(time_index["max_stop_ms"],
+                                start_ms[queries],
+                                side="left")
+        match_owner, positions = _expand_ranges(first,
+                                                np.maximum(last - first, 0))
+        overlaps = time_index["stop_ms"][positions] >= start_ms[
+            queries[match_owner]]
+        query_matches.append(queries[match_owner[overlaps]])
+        row_matches.append(time_index["order"][positions[overlaps]])
+
+    return _long_format_flyby_segments(
+        query_index=np.concatenate(query_matches),
+        row_indices=np.concatenate(row_matches),
+        query_count=len(timestamps))
+
+
 ### RETURN FEATURE NAMES FOR A SPECIFIC LATITUDE/LONGTIUDE ##############
 def features_from_latlon(latitude: [int, float] = None,
                          longitude: [int, float] = None) -> list:
@@ -392,40 +979,13 @@ def features_from_latlon_range(min_latitude: [int, float] = None,
                                                 min_longitude=min_longitude,
                                                 max_longitude=max_longitude)
 
-    feature_name_csv_dict = _retrieve_latlon_with_feature_names_from_csv()
-    feature_names_list = []
-
-    def _two_ranges_intersect(min_feature, max_feature, min_user, max_user):
-        # Check if two ranges of latitude/longitudes overlap
-        range1 = (min_feature <= max_user and min_feature >= min_user)
-        range2 = (max_feature >= min_user and max_feature <= max_user)
-        range3 = (min_feature <= min_user and max_feature >= max_user)
-        intersectionFound = (range1 or range2 or range3)
-        return intersectionFound
-
-    for feature_name, position_dict in feature_name_csv_dict.items():
-        min_feature_latitude = min([
-            float(position_dict["Northmost Latitude"]),
-            float(position_dict["Southmost Latitude"])
-        ])
-        max_feature_latitude = max([
-            float(position_dict["Northmost Latitude"]),
-            float(position_dict["Southmost Latitude"])
-        ])
-        if _two_ranges_intersect(min_feature_latitude, max_feature_latitude,
-                                 min_latitude, max_latitude):
-            min_feature_longitude = min([
-                float(position_dict["Westmost Longitude"]),
-                float(position_dict["Eastmost Longitude"])
-            ])
-            max_feature_longitude = max([
-                float(position_dict["Westmost Longitude"]),
-                float(position_dict["Eastmost Longitude"])
-            ])
-            if _two_ranges_intersect(min_feature_longitude,
-                                     max_feature_longitude, min_longitude,
-                                     max_longitude):
-                feature_names_list.append(feature_name)
+    feature_bounds = _retrieve_feature_bounds()
+    features_found = ((feature_bounds["min_latitude"] <= max_latitude) &
+                      (feature_bounds["max_latitude"] >= min_latitude) &
+                      (feature_bounds["min_longitude"] <= max_longitude) &
+                      (feature_bounds["max_longitude"] >= min_longitude))
+    feature_names_list = feature_bounds["feature_names"][
+        features_found].tolist()
 
     if len(feature_names_list) == 0:
         logger.info(
@@ -433,3 +993,31 @@ def features_from_latlon_range(min_latitude: [int, float] = None,
         )
 
     return feature_names_list
+
+
+### RETURN FEATURE NAMES FOR MANY LATITUDE/LONGTIUDES OR RANGES #########
+def features_from_latlon_many(
+        points: [pd.DataFrame, np.ndarray] = None) -> pd.DataFrame:
+    # Retrieve all Feature Names for many latitude/longitude points or ranges at once, where
+    # points is a DataFrame with the columns latitude/longitude (or min_latitude/max_latitude/
+    # min_longitude/max_longitude) or an array with the shape (N, 2) or (N, 4)
+    #   Returns a DataFrame of query_index and feature_name for each match
+    pydar._error_handling_id_from_lat_lon_many(points=points)
+
+    query_ranges = _latlon_query_ranges(points=points)
+    query_matches, feature_matches = _search_feature_bounds_many(
+        **query_ranges)
+    feature_names = pd.DataFrame({
+        "query_index":
+        query_matches,
+        "feature_name":
+        _retrieve_feature_bounds()["feature_names"][feature_matches]
+    })
+
+    query_count = len(query_ranges["min_latitude"])
+    missing_queries = query_count - len(np.unique(query_matches))
+    if missing_queries > 0:
+        logger.info(
+            f"\n[WARNING]: No Features found for {missing_queries} of {query_count} queries\n"
+        )
+    return feature_names
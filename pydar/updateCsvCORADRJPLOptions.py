@@ -4,6 +4,10 @@
 #      updateCsvCORADRJPLOptions.py backend updates coradr_jpl_options.csv                        #
 #                                                                                                 #
 #      This includes the functions for:                                                           #
+#                                       - _coradr_data_types: backend to return the               #
+#                                              data types in the DATA directory of a              #
+#                                              CORADR ID                                          #
+#                                                                                                 #
 #                                       - _update_csv_coradr_jpl_options: backend                 #
 #                                              to update the CSV for CORADR JPL                   #
 #                                              features                                           #
@@ -15,17 +19,15 @@
 # Note: Script not accessible via __init__.py and is run directly by the developer
 
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
 import logging
-import os
-import random
 
 # Related Third Party Imports
-from bs4 import BeautifulSoup
 import pandas as pd
-from urllib import request, error
 
 # Internal Local Imports
 import pydar
+import pydar.downloader
 
 ########################################################################
 
@@ -37,63 +39,66 @@ logger.addHandler(stream_handler)
 
 
 ## FUNCTIONS TO WEB SCRAPE TO POPULATE coradr_jpl_options.csv ################
-def _update_csv_coradr_jpl_options() -> None:
+def _coradr_data_types(coradr_id: str = None,
+                       cassini_orbiter_url: str = None) -> frozenset:
+    # Return the data types (DATAFILE_TYPES) that are directories in the DATA directory listing
+    # of a CORADR ID
+    #   Returns a frozenset of data types, such as {"BIDR", "SBDR"}
+    table_text = pydar._read_directory_listing(
+        f"{cassini_orbiter_url}/{coradr_id}/DATA/", ttl=0)
+    return frozenset(txt.split('/')[0]
+                     for txt in table_text) & frozenset(pydar.DATAFILE_TYPES)
+
+
+def _update_csv_coradr_jpl_options(cassini_orbiter_url: str = None,
+                                   max_workers: int = None,
+                                   catalog_directory: str = None) -> None:
     # Update the csv script for coradr_jpl_options.csv from the most recent JPL webpage
-    # Retrieves information for each CORADAR option and the data types it has available
-    #       Estimated runtime: 5 minutes
+    # Retrieves information for each CORADAR option and the data types it has available, with
+    # the DATA directory listings of max_workers CORADR IDs retrieved at the same time
+    #       catalog_directory: directory the CSV is written to (data/ folder when None)
+    #       Estimated runtime: 1 minute
     #       Returns: coradr_jpl_options.csv in data/ folder
+    if cassini_orbiter_url is None:
+        cassini_orbiter_url = pydar.CASSINI_ORBITER_URL
+    if max_workers is None:
+        max_workers = pydar.downloader.DOWNLOAD_WORKERS
 
     logger.info("Refreshing: coradr_jpl_options.csv")
 
-    user_agents = [
-        'Mozilla/6.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
-        'Mozilla/6.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/6.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 13_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15'
-    ]
-    random_agent = random.choice(user_agents)
-
-    # BeautifulSoup web scrapping to find CASSINI data types
+    # Web scrapping to find CASSINI data types
     logger.info(
-        "Retrieving observation information from planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbital...."
-    )
-    cassini_root_url = "https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter"
-    req_with_headers = request.Request(url=cassini_root_url,
-                                       headers={'User-Agent': random_agent})
-    cassini_html = request.urlopen(req_with_headers).read()
-    soup = BeautifulSoup(cassini_html, 'html.parser')
-    table = soup.find('table', {"id": "indexlist"})
-    table_text = (table.text).split("\n")
-    coradr_options = []
+        f"Retrieving observation information from {cassini_orbiter_url}....")
+    table_text = pydar._read_directory_listing(f"{cassini_orbiter_url}/",
+                                               ttl=0)
+    coradr_titles = []
     for txt in table_text:
         if 'CORADR' in txt:
             coradr_title = txt.split('/')[0]
             if '.' not in coradr_title:
-                coradr_options.append([
-                    coradr_title, False, False, False, False, False, False,
-                    False
-                ])
-        _, flyby_radar_take_num = pydar._retrieve_flyby_data()
+                coradr_titles.append(coradr_title)
+    flyby_radar_take_num = frozenset(pydar._retrieve_flyby_data()[1])
 
     # Check of CORADR has specific data files formats
-    for i, coradr_id in enumerate(coradr_options):
-        coradr_url = f"{cassini_root_url}/{coradr_id[0]}/DATA"
+    def _retrieve_data_types(coradr_number, coradr_title):
         logger.info(
-            f"Retrieving data types [{i+1}/{len(coradr_options)}]: {coradr_url}"
+            f"Retrieving data types [{coradr_number}/{len(coradr_titles)}]: {cassini_orbiter_url}/{coradr_title}/DATA/"
         )
-        coradr_html = request.urlopen(coradr_url).read()
-        soup = BeautifulSoup(coradr_html, 'html.parser')
-        table = soup.find('table', {"id": "indexlist"})
-        table_text = (table.text).split("\n")
-        for txt in table_text:
-            for i, data_type in enumerate(pydar.DATAFILE_TYPES):
-                if data_type in txt:
-                    coradr_id[i + 2] = True
-                if coradr_id[0].split("_")[1] in flyby_radar_take_num:
-                    coradr_id[1] = True  # Is a Titan Flyby
+        return _coradr_data_types(coradr_title, cassini_orbiter_url)
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="pydar_coradr") as executor:
+        coradr_data_types = list(
+            executor.map(_retrieve_data_types, range(1,
+                                                     len(coradr_titles) + 1),
+                         coradr_titles))
+
+    coradr_options = []
+    for coradr_title, data_types in zip(coradr_titles, coradr_data_types):
+        coradr_options.append(
+            [coradr_title,
+             coradr_title.split("_")[1] in flyby_radar_take_num] +
+            [data_type in data_types for data_type in pydar.DATAFILE_TYPES])
 
     # Write to CSV
     header_options = [
@@ -102,10 +107,7 @@ def _update_csv_coradr_jpl_options() -> None:
     ]
     df = pd.DataFrame(coradr_options, columns=header_options)
     df = df.sort_values(by=["CORADR ID"])
-    df.to_csv(os.path.join(os.path.dirname(__file__), 'data',
-                           'coradr_jpl_options.csv'),
-              header=header_options,
-              index=False)
+    pydar._write_catalog_csv("coradr_jpl_options.csv", df, catalog_directory)
 
 
 if __name__ == '__main__':
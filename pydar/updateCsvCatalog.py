@@ -0,0 +1,212 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      updateCsvCatalog.py backend refreshes all web scraped data/*.csv files                     #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _diff_catalog_rows: backend to return the               #
+#                                              rows added, removed, and changed between           #
+#                                              two versions of a CSV                              #
+#                                                                                                 #
+#                                       - _run_refresh_stages: backend to run the                 #
+#                                              CSV updaters in dependency order, with             #
+#                                              independent updaters run in parallel               #
+#                                                                                                 #
+#                                       - _refresh_catalog: backend to refresh the                #
+#                                              CSV files in a staging directory and swap          #
+#                                              them into data/ once all updaters finish           #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Note: Script not accessible via __init__.py and is run directly by the developer and Github Actions
+
+# Standard Library Imports
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+# Related Third Party Imports
+import pandas as pd
+
+# Internal Local Imports
+import pydar
+import pydar.catalog
+import pydar.updateCsvCORADRJPLOptions
+import pydar.updateCsvFeatureNameDetails
+import pydar.updateCsvSwathCoverage
+
+########################################################################
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+# {csv_name: (updater, CSV files the updater reads, columns that identify a row)}
+CATALOG_REFRESH_STAGES = {
+    "coradr_jpl_options.csv":
+    (pydar.updateCsvCORADRJPLOptions._update_csv_coradr_jpl_options, [],
+     ["CORADR ID"]),
+    "swath_coverage_by_time_position.csv":
+    (pydar.updateCsvSwathCoverage._update_csv_swath_coverage,
+     ["coradr_jpl_options.csv"], ["CORADR ID", "FILENAME"]),
+    "feature_name_details.csv":
+    (pydar.updateCsvFeatureNameDetails._update_csv_feature_name_details, [],
+     ["Feature Name"])
+}
+
+
+## FUNCTIONS TO REFRESH ALL WEB SCRAPED CSV FILES ################
+def _diff_catalog_rows(previous_dataframe: pd.DataFrame = None,
+                       updated_dataframe: pd.DataFrame = None,
+                       key_columns: list = None) -> dict:
+    # Compare two versions of a CSV (read as text) by the key_columns that identify a row, where
+    # rows that share a key are paired by their order in each version (the nth row of a key is
+    # compared to the nth row of that key), so rows are compared as a multiset and an added or
+    # removed duplicate row is reported
+    #   Returns {"added": [rows], "removed": [rows], "changed": [{"key": {column: value},
+    #           "columns": {column: [previous value, updated value]}}]}
+    def _with_occurrence(dataframe):
+        return dataframe.assign(_occurrence=dataframe.groupby(
+            key_columns, dropna=False).cumcount())
+
+    merged_dataframe = _with_occurrence(previous_dataframe).merge(
+        _with_occurrence(updated_dataframe),
+        on=key_columns + ["_occurrence"],
+        how="outer",
+        suffixes=(" (previous)", " (updated)"),
+        indicator=True)
+    value_columns = [
+        column for column in previous_dataframe.columns
+        if column not in key_columns
+    ]
+
+    def _rows(merge_side, suffix):
+        side_dataframe = merged_dataframe[merged_dataframe["_merge"] ==
+                                          merge_side]
+        side_dataframe = side_dataframe[
+            key_columns + [f"{column}{suffix}" for column in value_columns]]
+        side_dataframe.columns = key_columns + value_columns
+        return side_dataframe[list(
+            previous_dataframe.columns)].to_dict(orient="records")
+
+    changed_rows = []
+    for row in merged_dataframe[merged_dataframe["_merge"] == "both"].to_dict(
+            orient="records"):
+        changed_columns = {
+            column: [row[f"{column} (previous)"], row[f"{column} (updated)"]]
+            for column in value_columns
+            if row[f"{column} (previous)"] != row[f"{column} (updated)"]
+        }
+        if changed_columns:
+            changed_rows.append({
+                "key": {
+                    column: row[column]
+                    for column in key_columns
+                },
+                "columns": changed_columns
+            })
+    return {
+        "added": _rows("right_only", " (updated)"),
+        "removed": _rows("left_only", " (previous)"),
+        "changed": changed_rows
+    }
+
+
+def _run_refresh_stages(csv_names: list = None,
+                        max_workers: int = None,
+                        catalog_directory: str = None) -> None:
+    # Run the updater of each CSV in csv_names once the CSV files it reads have been refreshed
+    # (coradr_jpl_options.csv -> swath_coverage_by_time_position.csv), where updaters that do not
+    # depend on each other (feature_name_details.csv) run at the same time, and the first
+    # updater that fails raises its error after the running updaters finish
+    # Each updater reads and writes the CSV files in catalog_directory (data/ folder when None)
+    pending_stages = list(csv_names)
+    running_stages = {}
+    refreshed_stages = set()
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="pydar_refresh") as executor:
+        while pending_stages or running_stages:
+            for csv_name in list(pending_stages):
+                updater, depends_on, _ = CATALOG_REFRESH_STAGES[csv_name]
+                if all(dependency in refreshed_stages
+                       or dependency not in csv_names
+                       for dependency in depends_on):
+                    logger.info(f"Starting refresh: {csv_name}")
+                    running_stages[executor.submit(
+                        updater,
+                        catalog_directory=catalog_directory)] = csv_name
+                    pending_stages.remove(csv_name)
+            finished_stages, _ = wait(running_stages,
+                                      return_when=FIRST_COMPLETED)
+            for future in finished_stages:
+                future.result()  # raise the error of a failed updater
+                refreshed_stages.add(running_stages.pop(future))
+
+
+def _refresh_catalog(csv_names: list = None,
+                     swap_files: bool = True,
+                     max_workers: int = None) -> dict:
+    # Refresh the web scraped CSV files (all of CATALOG_REFRESH_STAGES when csv_names is None) in
+    # one process, sharing the HTTP connection pool and caches between updaters
+    # The updaters write to a staging copy of data/ (next to data/, so a killed refresh does not
+    # leave files in the package data), and the refreshed CSV files are only renamed into data/
+    # (swap_files) after all updaters finish, so a failed refresh changes nothing. Each CSV is
+    # swapped atomically on its own (data/ never contains a half-written CSV), but not all CSV
+    # files at once: a refresh killed during the swap can leave some CSV files refreshed
+    #       Estimated runtime: 1 minute
+    #       Returns {csv_name: {"added": [rows], "removed": [rows], "changed": [rows]}}
+    if csv_names is None:
+        csv_names = list(CATALOG_REFRESH_STAGES.keys())
+    for csv_name in csv_names:
+        if csv_name not in CATALOG_REFRESH_STAGES:
+            raise ValueError(
+                f"[csv_names]: '{csv_name}' not in available catalog files to refresh {list(CATALOG_REFRESH_STAGES.keys())}"
+            )
+
+    catalog_directory = pydar.catalog.CATALOG_DIRECTORY
+    staging_directory = tempfile.mkdtemp(
+        prefix=".pydar_refresh_", dir=os.path.dirname(catalog_directory))
+    try:
+        for csv_name in os.listdir(catalog_directory):
+            if csv_name.endswith(".csv"):
+                shutil.copy2(os.path.join(catalog_directory, csv_name),
+                             staging_directory)
+
+        # updaters read and write the bundled CSV files in the staging directory
+        _run_refresh_stages(csv_names, max_workers, staging_directory)
+
+        catalog_diff = {}
+        for csv_name in csv_names:
+            previous_dataframe, updated_dataframe = [
+                pd.read_csv(os.path.join(directory, csv_name),
+                            dtype=str,
+                            keep_default_na=False)
+                for directory in [catalog_directory, staging_directory]
+            ]
+            catalog_diff[csv_name] = _diff_catalog_rows(
+                previous_dataframe, updated_dataframe,
+                CATALOG_REFRESH_STAGES[csv_name][2])
+            logger.info(
+                f"{csv_name}: {len(catalog_diff[csv_name]['added'])} added, {len(catalog_diff[csv_name]['removed'])} removed, {len(catalog_diff[csv_name]['changed'])} changed"
+            )
+
+        if swap_files:
+            for csv_name in csv_names:
+                if any(catalog_diff[csv_name].values()):
+                    os.replace(os.path.join(staging_directory, csv_name),
+                               os.path.join(catalog_directory, csv_name))
+    finally:
+        shutil.rmtree(staging_directory, ignore_errors=True)
+        pydar._clear_catalog_cache()  # drop swapped and staging CSV files
+    return catalog_diff
+
+
+if __name__ == '__main__':
+    print(json.dumps(_refresh_catalog(), indent=2))  # updates data/*.csv
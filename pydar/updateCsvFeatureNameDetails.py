@@ -4,6 +4,20 @@
 #      updateCsvFeatureNameDetails.py backend updates feature_name_details.csv                    #
 #                                                                                                 #
 #      This includes the functions for:                                                           #
+#                                       - _feature_cache_path: backend to return the              #
+#                                              JSON file of a cached feature page                 #
+#                                                                                                 #
+#                                       - _wait_for_rate_limit: backend to space the              #
+#                                              requests sent to the planetary names               #
+#                                              database                                           #
+#                                                                                                 #
+#                                       - _parse_feature_page: backend to parse the               #
+#                                              details of a Titan feature page                    #
+#                                                                                                 #
+#                                       - _retrieve_feature: backend to return the                #
+#                                              details of a Titan feature, only                   #
+#                                              retrieved again when the page changed              #
+#                                                                                                 #
 #                                       - _update_csv_feature_name_details: backend               #
 #                                              to update the CSV for feature names                #
 #                                              with details                                       #
@@ -15,15 +29,22 @@
 # Note: Script not accessible via __init__.py and is run directly by the developer
 
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
 import os
 import re
-import random
+import threading
+import time
+from urllib import parse
 
 # Related Third Party Imports
 from bs4 import BeautifulSoup
 import pandas as pd
-from urllib import request, error
+
+# Internal Local Imports
+import pydar
+import pydar.downloader
 
 ########################################################################
 
@@ -33,35 +54,141 @@ logger.setLevel(logging.INFO)
 stream_handler = logging.StreamHandler()
 logger.addHandler(stream_handler)
 
+PLANETARY_NAMES_URL = "https://planetarynames.wr.usgs.gov"
+FEATURE_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache",
+                                       "pydar", "features")
+FEATURE_REQUESTS_PER_SECOND = 10  # requests sent to the planetary names database per second, 0 for no limit
+
+_next_request_time = 0
+_rate_limit_lock = threading.Lock()
+
 
 ## FUNCTIONS TO WEB SCRAPE TO POPULATE feature_name_details.csv ################
-def _update_csv_feature_name_details() -> None:
+def _feature_cache_path(feature_url: str = None) -> str:
+    # Return the JSON file of a cached feature page, saved by host and path
+    # (for example: planetarynames.wr.usgs.gov/Feature/6981.json)
+    #   Returns the file path of the cached feature page
+    split_url = parse.urlsplit(feature_url)
+    path_parts = [split_url.netloc.replace(":", "_")
+                  ] + [part for part in split_url.path.split("/") if part]
+    return os.path.join(FEATURE_CACHE_DIRECTORY, *path_parts) + ".json"
+
+
+def _wait_for_rate_limit(requests_per_second: float = None) -> None:
+    # Wait until the next request can be sent, so that all threads together send at most
+    # requests_per_second requests (evenly spaced) to the planetary names database
+    global _next_request_time
+    if requests_per_second is None:
+        requests_per_second = FEATURE_REQUESTS_PER_SECOND
+    if requests_per_second <= 0:
+        return
+
+    with _rate_limit_lock:
+        request_time = max(time.monotonic(), _next_request_time)
+        _next_request_time = request_time + 1 / requests_per_second
+    time.sleep(max(0, request_time - time.monotonic()))
+
+
+def _parse_feature_page(feature_html: bytes = None,
+                        feature_url: str = None) -> list:
+    # Parse the details table of a Titan feature page
+    #   Returns [Feature Name, Northmost Latitude, Southmost Latitude, Eastmost Longitude,
+    #           Westmost Longitude, Center Latitude, Center Longitude, URL]
+    soup = BeautifulSoup(feature_html, 'html.parser')
+    tables = soup.find_all('table', class_='usa-table')
+    feature_object = [None, None, None, None, None, None, None, None]
+    for table in tables:
+        for row in table.tbody.find_all("tr"):
+            feature_row = ((row.text).lstrip()).split("\n")
+            feature_row = [
+                f.strip() for f in feature_row
+                if f != '' and re.search(r'[a-zA-Z-?\d+]', f)
+            ]
+            feature_object[7] = feature_url
+            if len(feature_row) == 2:
+                if feature_row[0] == "Feature Name":
+                    feature_object[0] = feature_row[1]
+                if feature_row[0] == "Northmost Latitude":
+                    feature_object[1] = feature_row[1].split(" ")[0]
+                if feature_row[0] == "Southmost Latitude":
+                    feature_object[2] = feature_row[1].split(" ")[0]
+                if feature_row[0] == "Eastmost Longitude":
+                    feature_object[3] = feature_row[1].split(" ")[0]
+                if feature_row[0] == "Westmost Longitude":
+                    feature_object[4] = feature_row[1].split(" ")[0]
+                if feature_row[0] == "Center Latitude":
+                    feature_object[5] = feature_row[1].split(" ")[0]
+                if feature_row[0] == "Center Longitude":
+                    feature_object[6] = feature_row[1].split(" ")[0]
+    return feature_object
+
+
+def _retrieve_feature(feature_url: str = None,
+                      requests_per_second: float = None) -> tuple:
+    # Return the details of a Titan feature from the feature cache, where the cached page is
+    # revalidated with its ETag and Last-Modified headers and only retrieved and parsed again
+    # when it has changed (304 Not Modified keeps the cached details)
+    #   Returns the feature details and True when the cached details were used
+    cache_path = _feature_cache_path(feature_url)
+    cached_feature = None
+    headers = {}
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as feature_file:
+                cached_feature = json.load(feature_file)
+            if cached_feature.get("etag"):
+                headers["If-None-Match"] = cached_feature["etag"]
+            if cached_feature.get("last_modified"):
+                headers["If-Modified-Since"] = cached_feature["last_modified"]
+        except (OSError, ValueError):
+            logger.debug(f"Unable to read {cache_path}")
+            cached_feature = None
+
+    _wait_for_rate_limit(requests_per_second)
+    response = pydar._http_request(url=feature_url, headers=headers)
+    if response.status == 304 and cached_feature is not None:
+        return cached_feature["feature"], True
+
+    feature_object = _parse_feature_page(response.data, feature_url)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag is not None or last_modified is not None:  # page can be revalidated
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(f"{cache_path}.part", "w") as feature_file:
+            json.dump(
+                {
+                    "url": feature_url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "feature": feature_object
+                },
+                feature_file,
+                separators=(",", ":"))
+        os.replace(f"{cache_path}.part", cache_path)
+    return feature_object, False
+
+
+def _update_csv_feature_name_details(max_workers: int = None,
+                                     requests_per_second: float = None,
+                                     catalog_directory: str = None) -> None:
     # Update the csv script for feature_name_details.csv from the planetary names database
-    # Retrieves information for each Titan feature
-    #       Estimated runtime: 3 minutes
+    # Retrieves information for each Titan feature, with max_workers pages retrieved and parsed
+    # at the same time and at most requests_per_second requests sent to the database
+    #       catalog_directory: directory the CSV is written to (data/ folder when None)
+    #       Estimated runtime: 30 seconds (limited by FEATURE_REQUESTS_PER_SECOND), where feature
+    #               pages that have not changed are not downloaded or parsed again
     #       Returns: feature_name_details.csv in data/ folder
+    if max_workers is None:
+        max_workers = pydar.downloader.DOWNLOAD_WORKERS
 
     logger.info("Refreshing: feature_name_details.csv")
 
-    user_agents = [
-        'Mozilla/6.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
-        'Mozilla/6.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/6.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 13_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15'
-    ]
-    random_agent = random.choice(user_agents)
-
     # BeautifulSoup web scrapping to find Titan feature names with details
+    titan_root_url = f"{PLANETARY_NAMES_URL}/SearchResults?Target=74_Titan"
     logger.info(
-        "Retrieving observation information from https://planetarynames.wr.usgs.gov/SearchResults?Target=74_Titan...."
-    )
-    titan_root_url = "https://planetarynames.wr.usgs.gov/SearchResults?Target=74_Titan"
-    req_with_headers = request.Request(url=titan_root_url,
-                                       headers={'User-Agent': random_agent})
-    titan_html = request.urlopen(req_with_headers).read()
+        f"Retrieving observation information from {titan_root_url}....")
+    _wait_for_rate_limit(requests_per_second)
+    titan_html = pydar._read_url(titan_root_url)
     soup = BeautifulSoup(titan_html, 'html.parser')
     ahref_feature_names = soup.findAll('a')
     ahref_lst = []
@@ -72,40 +199,21 @@ def _update_csv_feature_name_details() -> None:
                 if feature_link != "/Feature/7014":  # ignore a dropped column for 'Sotra Facula' (a feature that has been dropped from the table, but still exists)
                     ahref_lst.append(feature_link)
 
-    feature_options = []
-    base_url = "https://planetarynames.wr.usgs.gov"
-    for i, feature_ahref in enumerate(ahref_lst):
-        feature_html = request.urlopen(base_url + feature_ahref)
+    def _retrieve_feature_number(feature_number, feature_ahref):
+        feature_url = PLANETARY_NAMES_URL + feature_ahref
+        feature_object, is_cached = _retrieve_feature(feature_url,
+                                                      requests_per_second)
         logger.info(
-            f"[{i+1}/{len(ahref_lst)}] Retrieving: {base_url + feature_ahref}")
-        soup = BeautifulSoup(feature_html, 'html.parser')
-        tables = soup.find_all('table', class_='usa-table')
-        # [Feature Name, Northmost Latitude, Southmost Latitude, Eastmost Longitude, Westmost Longitude, Center Latitude, Center Longitude, URL]
-        feature_object = [None, None, None, None, None, None, None, None]
-        for table in tables:
-            for row in table.tbody.find_all("tr"):
-                feature_row = ((row.text).lstrip()).split("\n")
-                feature_row = [
-                    f.strip() for f in feature_row
-                    if f != '' and re.search(r'[a-zA-Z-?\d+]', f)
-                ]
-                feature_object[7] = base_url + feature_ahref
-                if len(feature_row) == 2:
-                    if feature_row[0] == "Feature Name":
-                        feature_object[0] = feature_row[1]
-                    if feature_row[0] == "Northmost Latitude":
-                        feature_object[1] = feature_row[1].split(" ")[0]
-                    if feature_row[0] == "Southmost Latitude":
-                        feature_object[2] = feature_row[1].split(" ")[0]
-                    if feature_row[0] == "Eastmost Longitude":
-                        feature_object[3] = feature_row[1].split(" ")[0]
-                    if feature_row[0] == "Westmost Longitude":
-                        feature_object[4] = feature_row[1].split(" ")[0]
-                    if feature_row[0] == "Center Latitude":
-                        feature_object[5] = feature_row[1].split(" ")[0]
-                    if feature_row[0] == "Center Longitude":
-                        feature_object[6] = feature_row[1].split(" ")[0]
-        feature_options.append(feature_object)
+            f"[{feature_number}/{len(ahref_lst)}] {'Not modified' if is_cached else 'Retrieved'}: {feature_url}"
+        )
+        return feature_object
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="pydar_feature") as executor:
+        feature_options = list(
+            executor.map(_retrieve_feature_number,
+                         range(1,
+                               len(ahref_lst) + 1), ahref_lst))
 
     # Add Huygens landing site manually
     huygens_landing_site = [
@@ -123,10 +231,7 @@ def _update_csv_feature_name_details() -> None:
     ]
     df = pd.DataFrame(feature_options, columns=header_options)
     df = df.sort_values(by=["Feature Name"])
-    df.to_csv(os.path.join(os.path.dirname(__file__), 'data',
-                           'feature_name_details.csv'),
-              header=header_options,
-              index=False)
+    pydar._write_catalog_csv("feature_name_details.csv", df, catalog_directory)
 
 
 if __name__ == '__main__':
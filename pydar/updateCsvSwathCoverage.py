@@ -4,6 +4,23 @@
 #      updateCsvSwathCoverage.py backend updates swath_coverage_by_time_position.csv              #
 #                                                                                                 #
 #      This includes the functions for:                                                           #
+#                                       - _latest_bidr_coradr_ids: backend to return              #
+#                                              the most recent version of each Titan              #
+#                                              flyby CORADR ID with BIDR data                     #
+#                                                                                                 #
+#                                       - _parse_lbl_keywords: backend to parse the               #
+#                                              keywords of a .LBL file                            #
+#                                                                                                 #
+#                                       - _read_lbl_keywords: backend to retrieve the             #
+#                                              keywords of a .LBL file with a Range               #
+#                                              request for its header                             #
+#                                                                                                 #
+#                                       - _swath_lbl_row: backend to return the swath             #
+#                                              coverage row of a BIDR .LBL file                   #
+#                                                                                                 #
+#                                       - _retrieve_swath_rows: backend to retrieve               #
+#                                              the .LBL rows of CORADR IDs concurrently           #
+#                                                                                                 #
 #                                       - _update_csv_swath_coverage: backend                     #
 #                                              to update the CSV for swath                        #
 #                                              coverage flyby and ids                             #
@@ -15,17 +32,16 @@
 # Note: Script not accessible via __init__.py and is run directly by the developer and Github Actions
 
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
-import random
 
 # Related Third Party Imports
-from bs4 import BeautifulSoup
 import pandas as pd
-from urllib import request, error
 
 # Internal Local Imports
 import pydar
+import pydar.downloader
 
 ########################################################################
 
@@ -35,148 +51,225 @@ logger.setLevel(logging.INFO)
 stream_handler = logging.StreamHandler()
 logger.addHandler(stream_handler)
 
+SWATH_COVERAGE_CSV = "swath_coverage_by_time_position.csv"
+SWATH_COVERAGE_HEADERS = [
+    "CORADR ID", "FLYBY ID", "SEGMENT NUMBER", "FILENAME", "DATE TYPE SYMBOL",
+    "DATE TYPE", "RESOLUTION (pixels/degrees)", "TARGET_NAME",
+    "MAXIMUM_LATITUDE (Degrees)", "MINIMUM_LATITUDE (Degrees)",
+    "EASTERNMOST_LONGITUDE (Degrees)", "WESTERNMOST_LONGITUDE (Degrees)",
+    "START_TIME", "STOP_TIME"
+]
+BIDR_DATA_TYPES = {
+    "F": "Primary Dataset (Linear Scale)",
+    "B": "Primary Dataset in Unsigned Byte Format (Normalized dB)",
+    "S":
+    "Normalized SAR (Physical Scale) with Thermal/Quantized Noise Removed",
+    "X": "Noise for SAR without Incidence Angle Correction (Physical Scale)",
+    "U": "Sigma0 without Incidence Angle (Linear Scale)",
+    "D": "Subtracted STD SAR",
+    "E": "Incidence Angle Map",
+    "T": "Latitude Map",
+    "N": "Longitude Map",
+    "M": "Beam Mask Map",
+    "L": "Number of Looks Map"
+}
+BIDR_RESOLUTIONS = {
+    "B": 2,
+    "D": 8,
+    "F": 32,
+    "G": 64,
+    "H": 128,
+    "I": 256
+}  #  pixels/degree
+LBL_KEYWORDS = [
+    "TARGET_NAME", "MAXIMUM_LATITUDE", "MINIMUM_LATITUDE",
+    "EASTERNMOST_LONGITUDE", "WESTERNMOST_LONGITUDE", "START_TIME", "STOP_TIME"
+]  # in the order of SWATH_COVERAGE_HEADERS
+LBL_HEADER_BYTES = 8192  # bytes of a .LBL requested before retrieving the full file, 0 to always retrieve the full file
+
 
 ## FUNCTIONS TO WEB SCRAPE TO POPULATE swath_coverage_by_time_position.csv ################
-def _update_csv_swath_coverage() -> None:
+def _latest_bidr_coradr_ids(catalog_directory: str = None) -> list:
+    # Return the most recent version of each Titan flyby CORADR ID in coradr_jpl_options.csv
+    # (CORADR_0211_V03 replaces CORADR_0211 and CORADR_0211_V02) that contains BIDR data
+    #   Returns a list of CORADR IDs
+    coradr_dataframe = pydar._read_catalog_csv("coradr_jpl_options.csv",
+                                               catalog_directory)
+    titan_flybys = coradr_dataframe[coradr_dataframe["Is a Titan Flyby"]]
+    coradr_base_ids = titan_flybys["CORADR ID"].str.split("_V").str[0]
+    latest_versions = titan_flybys[~coradr_base_ids.duplicated(keep="last")]
+    return list(latest_versions["CORADR ID"][latest_versions["Contains BIDR"]])
+
+
+def _parse_lbl_keywords(lbl_text: str = None) -> dict:
+    # Parse the "KEYWORD = value <unit>" lines of a .LBL file for each of LBL_KEYWORDS, where the
+    # unit of latitudes and longitudes is removed and the text before the unit is kept as-is, so a
+    # label with a space before the unit (most of the F, G, H and I resolution BIDR labels) keeps the
+    # trailing space in the same way as the rows of the bundled swath_coverage_by_time_position.csv
+    # Keywords are matched exactly and the first value of a keyword is kept (instead of the last
+    # line that contains the keyword), so a longer keyword or comment that contains a keyword is not
+    # used and parsing can stop within the first LBL_HEADER_BYTES of the .LBL file. A BIDR label
+    # gives each keyword once (the times in the label header and the latitudes and longitudes
+    # in the IMAGE_MAP_PROJECTION object), so the values are the same
+    #   Returns a dictionary of {keyword: value} for the keywords found
+    lbl_keywords = {}
+    for line in lbl_text.split("\n"):
+        keyword, separator, value = line.partition("=")
+        keyword = keyword.strip()
+        if separator and keyword in LBL_KEYWORDS and keyword not in lbl_keywords:
+            value = value.strip()
+            if keyword.endswith(("_LATITUDE", "_LONGITUDE")):
+                value = value.split("<")[0]
+            lbl_keywords[keyword] = value
+            if len(lbl_keywords) == len(LBL_KEYWORDS):
+                break
+    return lbl_keywords
+
+
+def _read_lbl_keywords(url: str = None, header_bytes: int = None) -> dict:
+    # Retrieve the LBL_KEYWORDS of a .LBL file from only its first header_bytes with a Range
+    # request, retrieving the full .LBL file when a keyword is not within the first header_bytes
+    # (header_bytes of 0 always retrieves the full .LBL file)
+    #   Returns a dictionary of {keyword: value} for the keywords found
+    if header_bytes is None:
+        header_bytes = LBL_HEADER_BYTES
+
+    if header_bytes > 0:
+        lbl_bytes, is_complete = pydar._read_url_head(url, header_bytes)
+        if not is_complete:  # ignore the partial last line
+            lbl_bytes = lbl_bytes[:lbl_bytes.rfind(b"\n") + 1]
+        lbl_keywords = _parse_lbl_keywords(lbl_bytes.decode("UTF-8"))
+        if is_complete or len(lbl_keywords) == len(LBL_KEYWORDS):
+            return lbl_keywords
+        logger.info(
+            f"Keywords not within the first {header_bytes} bytes, retrieving full LBL: {url}"
+        )
+    return _parse_lbl_keywords(pydar._read_url(url).decode("UTF-8"))
+
+
+def _swath_lbl_row(radar_id: str = None,
+                   filename: str = None,
+                   lbl_keywords: dict = None) -> list:
+    # Return the swath coverage information for a BIDR .LBL file from its filename and keywords
+    #   Returns a row with a value for each of SWATH_COVERAGE_HEADERS
+    lbl = [radar_id]
+    lbl.append(pydar.observation_to_id(radar_id.split("_")[1]))
+    lbl.append((filename.split("_")[2]).split("S")[1])  # Segment Number
+    lbl.append(filename)
+    lbl.append(filename[2])  # Data Type
+    lbl.append(BIDR_DATA_TYPES[filename[2]])  # Data Type, with full title
+    lbl.append(BIDR_RESOLUTIONS[filename[4]])  # Resolution
+    lbl.extend(lbl_keywords.get(keyword) for keyword in LBL_KEYWORDS)
+    return lbl
+
+
+def _retrieve_swath_rows(coradr_ids: list = None,
+                         cassini_orbiter_url: str = None,
+                         max_workers: int = None) -> list:
+    # Retrieve the swath coverage row for each .LBL file in DATA/BIDR/ of each CORADR ID, where the
+    # directory listings and then the .LBL files are retrieved concurrently by max_workers threads
+    #   Returns a list of rows in the order of coradr_ids and the directory listings
+    if cassini_orbiter_url is None:
+        cassini_orbiter_url = pydar.CASSINI_ORBITER_URL
+    if max_workers is None:
+        max_workers = pydar.downloader.DOWNLOAD_WORKERS
+
+    def _lbl_jobs(radar_id):
+        table_text = pydar._read_directory_listing(
+            f"{cassini_orbiter_url}/{radar_id}/DATA/BIDR/")
+        lbl_jobs = []
+        for txt in table_text:
+            if txt.startswith('BI'):
+                filename = (txt.split('/')[0]).split(".")[0]
+                if 'LBL' in (txt.split('/')[0]).split(".")[1]:
+                    filename += '.LBL'
+                    lbl_jobs.append((radar_id, filename))
+        return lbl_jobs
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="pydar_swath") as executor:
+        lbl_jobs = [
+            lbl_job for coradr_lbl_jobs in executor.map(_lbl_jobs, coradr_ids)
+            for lbl_job in coradr_lbl_jobs
+        ]
+
+        def _retrieve_row(lbl_number, lbl_job):
+            radar_id, filename = lbl_job
+            bidr_url = f"{cassini_orbiter_url}/{radar_id}/DATA/BIDR/{filename}"
+            logger.info(
+                f"Retrieving LBL information [{lbl_number}/{len(lbl_jobs)}]: {bidr_url}"
+            )
+            return _swath_lbl_row(radar_id, filename,
+                                  _read_lbl_keywords(bidr_url))
+
+        return list(
+            executor.map(_retrieve_row, range(1,
+                                              len(lbl_jobs) + 1), lbl_jobs))
+
+
+def _update_csv_swath_coverage(incremental: bool = True,
+                               cassini_orbiter_url: str = None,
+                               max_workers: int = None,
+                               catalog_directory: str = None) -> list:
     # Update the csv script for swath_coverage_by_time_position.csv from the most recent JPL webpage
     # Retrieves information for each .LBL file that exists for CASSINI data files
-    #       Estimated runtime: 15 minutes
-    #       Returns: swath_coverage_by_time_position.csv in data/ folder
+    #       incremental: only retrieves the .LBL files of CORADR IDs (versions) not already in the
+    #               CSV, the rows of the other CORADR IDs are kept as they are and the rows of
+    #               replaced versions are removed
+    #       catalog_directory: directory coradr_jpl_options.csv is read from and the CSV is
+    #               read from and written to (data/ folder when None)
+    #       Estimated runtime: seconds (incremental) or a few minutes (all .LBL files)
+    #       Returns the list of CORADR IDs retrieved, swath_coverage_by_time_position.csv in data/
+    #               folder is only rewritten when rows have changed
 
     logger.info("Refreshing: swath_coverage_by_time_position.csv")
 
     # Get all Titan Flybys with most up to date versions
-    coradr_ids = []
-    ids_with_no_bidr = []
-    coradr_csv_file = os.path.join(
-        os.path.dirname(__file__), 'data', 'coradr_jpl_options.csv'
-    )  # get file's directory, up one level, /data/*.csv
-    coradr_dataframe = pd.read_csv(coradr_csv_file)
-    for index, row in coradr_dataframe.iterrows():
-        row = row.tolist()
-        if row[1] == True:
-            if row[4] == False:  # if is a Titan flyby but "Contains BIDR" is False
-                ids_with_no_bidr.append(row[0])
-            if coradr_ids != []:
-                if coradr_ids[-1].split("_V")[0] in row[
-                        0]:  # replace the older version with the most recent version
-                    coradr_ids[-1] = row[0]
-                else:
-                    coradr_ids.append(row[0])
-            else:
-                coradr_ids.append(row[0])
-
-    data_type_dict = {
-        "F": "Primary Dataset (Linear Scale)",
-        "B": "Primary Dataset in Unsigned Byte Format (Normalized dB)",
-        "S":
-        "Normalized SAR (Physical Scale) with Thermal/Quantized Noise Removed",
-        "X":
-        "Noise for SAR without Incidence Angle Correction (Physical Scale)",
-        "U": "Sigma0 without Incidence Angle (Linear Scale)",
-        "D": "Subtracted STD SAR",
-        "E": "Incidence Angle Map",
-        "T": "Latitude Map",
-        "N": "Longitude Map",
-        "M": "Beam Mask Map",
-        "L": "Number of Looks Map"
-    }
-
-    resolution_dict = {
-        "B": 2,
-        "D": 8,
-        "F": 32,
-        "G": 64,
-        "H": 128,
-        "I": 256
-    }  #  pixels/degree
-
-    user_agents = [
-        'Mozilla/6.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
-        'Mozilla/6.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/6.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 13_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15'
-    ]
-    random_agent = random.choice(user_agents)
+    coradr_ids = _latest_bidr_coradr_ids(catalog_directory)
+
+    # Existing rows are read as text to be written back unchanged
+    csv_path = pydar._catalog_csv_path(SWATH_COVERAGE_CSV, catalog_directory)
+    if os.path.exists(csv_path):
+        current_dataframe = pd.read_csv(csv_path,
+                                        dtype=str,
+                                        keep_default_na=False)
+    else:
+        current_dataframe = pd.DataFrame(columns=SWATH_COVERAGE_HEADERS,
+                                         dtype=str)
+
+    if incremental:
+        current_ids = set(current_dataframe["CORADR ID"])
+        retrieve_ids = [
+            radar_id for radar_id in coradr_ids if radar_id not in current_ids
+        ]
+    else:
+        retrieve_ids = coradr_ids
+    logger.info(
+        f"Retrieving .LBL files for {len(retrieve_ids)} of {len(coradr_ids)} CORADR IDs"
+    )
 
     # Retrieve a list of all the .LBL for each CORADR ID (different for each resolution)
-    lbl_information = []
-    for radar_id in coradr_ids:
-        if radar_id not in ids_with_no_bidr:
-            base_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{radar_id}/DATA/BIDR/"
-            req_with_headers = request.Request(
-                url=base_url, headers={'User-Agent': random_agent})
-            base_html = request.urlopen(req_with_headers).read()
-            soup = BeautifulSoup(base_html, 'html.parser')
-            table = soup.find('table', {"id": "indexlist"})
-            table_text = (table.text).split("\n")
-            url_filenames = []
-            all_bidr_files = []
-            for txt in table_text:
-                if txt.startswith('BI'):
-                    filename = (txt.split('/')[0]).split(".")[0]
-                    if 'LBL' in (txt.split('/')[0]).split(".")[1]:
-                        lbl = []
-                        filename += '.LBL'
-                        bidr_url = f"https://planetarydata.jpl.nasa.gov/img/data/cassini/cassini_orbiter/{radar_id}/DATA/BIDR/{filename}"
-                        logger.info(f"Retrieving LBL information: {bidr_url}")
-                        lbl = [
-                            radar_id, None, None, None, None, None, None, None,
-                            None, None, None, None, None, None
-                        ]
-                        lbl[1] = pydar.observation_to_id(
-                            radar_id.split("_")[1])
-                        lbl[2] = (filename.split("_")[2]
-                                  ).split("S")[1]  # Segment Number
-                        lbl[3] = filename
-                        lbl[4] = filename[2]  # Data Type
-                        lbl[5] = data_type_dict[
-                            filename[2]]  # Data Type, with full title
-                        lbl[6] = resolution_dict[filename[4]]  # Resolution
-                        with request.urlopen(bidr_url) as lbl_file:
-                            for line in (lbl_file.read().decode("UTF-8")
-                                         ).split("\n"):
-                                if "TARGET_NAME" in line:
-                                    lbl[7] = line.split("=")[1].strip()
-                                if "MAXIMUM_LATITUDE" in line:
-                                    max_lat = line.split("=")[1].strip()
-                                    max_lat = max_lat.split("<")[0]
-                                    lbl[8] = max_lat
-                                if "MINIMUM_LATITUDE" in line:
-                                    min_lat = line.split("=")[1].strip()
-                                    min_lat = min_lat.split("<")[0]
-                                    lbl[9] = min_lat
-                                if "EASTERNMOST_LONGITUDE" in line:
-                                    east_long = line.split("=")[1].strip()
-                                    east_long = east_long.split("<")[0]
-                                    lbl[10] = east_long
-                                if "WESTERNMOST_LONGITUDE" in line:
-                                    west_long = line.split("=")[1].strip()
-                                    west_long = west_long.split("<")[0]
-                                    lbl[11] = west_long
-                                if "START_TIME" in line:
-                                    lbl[12] = line.split("=")[1].strip()
-                                if "STOP_TIME" in line:
-                                    lbl[13] = line.split("=")[1].strip()
-                            lbl_information.append(lbl)
+    lbl_information = _retrieve_swath_rows(
+        coradr_ids=retrieve_ids,
+        cassini_orbiter_url=cassini_orbiter_url,
+        max_workers=max_workers)
+    retrieved_dataframe = pd.DataFrame(lbl_information,
+                                       columns=SWATH_COVERAGE_HEADERS,
+                                       dtype=object).fillna("").astype(str)
+
+    # Merge: keep the current rows of CORADR IDs that are still the latest version and not retrieved
+    kept_dataframe = current_dataframe[
+        current_dataframe["CORADR ID"].isin(coradr_ids)
+        & ~current_dataframe["CORADR ID"].isin(retrieve_ids)]
+    df = pd.concat([kept_dataframe, retrieved_dataframe], ignore_index=True)
+    df = df.sort_values(by=["CORADR ID"], kind="stable", ignore_index=True)
 
     # Write to CSV
-    header_options = [
-        "CORADR ID", "FLYBY ID", "SEGMENT NUMBER", "FILENAME",
-        "DATE TYPE SYMBOL", "DATE TYPE", "RESOLUTION (pixels/degrees)",
-        "TARGET_NAME", "MAXIMUM_LATITUDE (Degrees)",
-        "MINIMUM_LATITUDE (Degrees)", "EASTERNMOST_LONGITUDE (Degrees)",
-        "WESTERNMOST_LONGITUDE (Degrees)", "START_TIME", "STOP_TIME"
-    ]
-    df = pd.DataFrame(lbl_information, columns=header_options)
-    df = df.sort_values(by=["CORADR ID"])
-    df.to_csv(os.path.join(os.path.dirname(__file__), 'data',
-                           'swath_coverage_by_time_position.csv'),
-              header=header_options,
-              index=False)
+    if df.equals(current_dataframe.reset_index(drop=True)):
+        logger.info(f"No changes to: {SWATH_COVERAGE_CSV}")
+    else:
+        pydar._write_catalog_csv(SWATH_COVERAGE_CSV, df, catalog_directory)
+    return retrieve_ids
 
 
 if __name__ == '__main__':
@@ -0,0 +1,212 @@
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#      zip_extraction.py extracts the IMG files of downloaded BIDR ZIPs or reads                  #
+#          them in place without extracting them                                                  #
+#                                                                                                 #
+#      This includes the functions for:                                                           #
+#                                       - _extract_zip_member: backend to extract a               #
+#                                              single file of a ZIP through a .part               #
+#                                              file, verifying its CRC-32                         #
+#                                                                                                 #
+#                                       - _extract_zip_file: backend to extract the               #
+#                                              IMG files of a BIDR ZIP                            #
+#                                                                                                 #
+#                                       - _extract_zip_files: backend to extract                  #
+#                                              downloaded BIDR ZIPs concurrently and              #
+#                                              record the extracted files in the                  #
+#                                              manifest                                           #
+#                                                                                                 #
+#                                       - _zip_member_data_offset: backend to return              #
+#                                              the position of the data of a file                 #
+#                                              stored in a ZIP                                    #
+#                                                                                                 #
+#                                       - read_zip_image: read an IMG file within a               #
+#                                              BIDR ZIP without extracting it                     #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+#                                                                                                 #
+
+# Extract or read the IMG files of BIDR ZIPs
+
+# Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import mmap
+import os
+import shutil
+import struct
+import time
+import zipfile
+import zlib
+
+# Internal Local Imports
+import pydar
+import pydar.downloader
+
+########################################################################
+
+## Logging set up for .INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+stream_handler = logging.StreamHandler()
+logger.addHandler(stream_handler)
+
+ZIP_EXTRACT_ENABLED = True  # False keeps the IMG files within the ZIPs, read with read_zip_image()
+ZIP_EXTRACT_WORKERS = 4  # ZIPs extracted at the same time
+ZIP_EXTRACT_CHUNK_SIZE = 1024 * 1024  # bytes written to the .part file at a time
+ZIP_DELETE_AFTER_EXTRACT = False  # remove each ZIP once all of its files are extracted and verified
+
+
+def _extract_zip_member(zip_ref: zipfile.ZipFile = None,
+                        zip_info: zipfile.ZipInfo = None,
+                        directory: str = None) -> int:
+    # Extract a single file of a ZIP into a directory in chunks through a .part file, where zipfile
+    # verifies the CRC-32 of the file once it has been read to the end (raises a BadZipFile)
+    #   Returns the size of the extracted file
+    member_name = os.path.normpath(zip_info.filename)
+    if os.path.isabs(member_name) or member_name.startswith(os.pardir):
+        raise ValueError(
+            f"Unable to extract '{zip_info.filename}' outside of {directory}")
+    member_path = os.path.join(directory, member_name)
+    os.makedirs(os.path.dirname(member_path), exist_ok=True)
+
+    part_path = f"{member_path}.part"
+    try:
+        with zip_ref.open(zip_info) as member_file, open(part_path,
+                                                         "wb") as part_file:
+            shutil.copyfileobj(member_file, part_file, ZIP_EXTRACT_CHUNK_SIZE)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    os.replace(part_path, member_path)
+    return zip_info.file_size
+
+
+def _extract_zip_file(zipfile_name: str = None,
+                      delete_zip_file: bool = None) -> dict:
+    # Extract the IMG files of a BIDR ZIP into the results directory of the ZIP, where the ZIP is
+    # removed once all of its files are extracted when delete_zip_file (defaults to
+    # ZIP_DELETE_AFTER_EXTRACT) is True, along with its copy in the download cache
+    #   Returns a dictionary of {extracted filename: size} to record in the manifest
+    if delete_zip_file is None:
+        delete_zip_file = ZIP_DELETE_AFTER_EXTRACT
+
+    extract_start = time.perf_counter()
+    with zipfile.ZipFile(zipfile_name, 'r') as zip_ref:
+        extracted_files = {
+            zip_info.filename:
+            _extract_zip_member(zip_ref, zip_info,
+                                os.path.dirname(zipfile_name))
+            for zip_info in zip_ref.infolist() if not zip_info.is_dir()
+        }
+    pydar.downloader._report_download_event({
+        "event":
+        "extract",
+        "file_path":
+        zipfile_name,
+        "files_extracted":
+        len(extracted_files),
+        "bytes_extracted":
+        sum(extracted_files.values()),
+        "duration_seconds":
+        time.perf_counter() - extract_start
+    })
+    if delete_zip_file:
+        logger.debug(f"Removing extracted ZIP: {zipfile_name}")
+        pydar._remove_downloaded_file(zipfile_name)
+    return extracted_files
+
+
+def _extract_zip_files(results_directory: str = None,
+                       zipfile_jobs: list = None,
+                       max_workers: int = None) -> None:
+    # Extract the IMG files of downloaded BIDR ZIPs with up to max_workers (defaults to
+    # ZIP_EXTRACT_WORKERS) ZIPs at once and record the extracted files in the manifest of the
+    # results directory (ZIPs are kept as is when ZIP_EXTRACT_ENABLED is False)
+    if not ZIP_EXTRACT_ENABLED or len(zipfile_jobs) == 0:
+        return
+    if max_workers is None:
+        max_workers = ZIP_EXTRACT_WORKERS
+
+    # the manifest entries of the ZIPs are read first, as the ZIPs may be removed once extracted
+    # (a ZIP missing from the manifest, for example a manifest written over, gets a new entry)
+    manifest = pydar._read_manifest(results_directory)
+    for url, zipfile_name in zipfile_jobs:
+        if os.path.basename(zipfile_name) not in manifest:
+            manifest[os.path.basename(zipfile_name)] = pydar._manifest_entry(
+                url, zipfile_name)
+    zipfile_names = [zipfile_name for _, zipfile_name in zipfile_jobs]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(zipfile_names)),
+                            thread_name_prefix="pydar_extract") as executor:
+        extracted_files = list(executor.map(_extract_zip_file, zipfile_names))
+
+    manifest_entries = {}
+    for zipfile_name, zipfile_extracted in zip(zipfile_names, extracted_files):
+        manifest_entry = dict(manifest[os.path.basename(zipfile_name)])
+        manifest_entry["extracted"] = zipfile_extracted
+        manifest_entries[os.path.basename(zipfile_name)] = manifest_entry
+    pydar._update_manifest(results_directory, manifest_entries)
+
+
+def _zip_member_data_offset(zip_ref: zipfile.ZipFile = None,
+                            zip_info: zipfile.ZipInfo = None) -> int:
+    # Return the position of the data of a file in a ZIP from its local file header
+    #   Returns the number of bytes from the start of the ZIP to the data of the file
+    zip_ref.fp.seek(zip_info.header_offset)
+    local_header = struct.unpack("<4s5H3L2H", zip_ref.fp.read(30))
+    if local_header[0] != b"PK\x03\x04":
+        raise zipfile.BadZipFile(
+            f"Bad local file header for '{zip_info.filename}'")
+    filename_length, extra_length = local_header[9], local_header[10]
+    return zip_info.header_offset + 30 + filename_length + extra_length
+
+
+def read_zip_image(zipfile_name: str = None,
+                   image_name: str = None) -> memoryview:
+    # Read an IMG file within a BIDR ZIP without extracting it to disk, where a stored (not
+    # compressed) IMG is memory-mapped in place within the ZIP and a compressed IMG is decompressed
+    # into an anonymous memory map, verifying the CRC-32 of the IMG
+    #   Returns a read-only memoryview of the bytes of the IMG file
+    pydar._error_handling_read_zip_image(zipfile_name=zipfile_name,
+                                         image_name=image_name)
+
+    with zipfile.ZipFile(zipfile_name, 'r') as zip_ref:
+        image_names = [
+            zip_info.filename for zip_info in zip_ref.infolist()
+            if zip_info.filename.upper().endswith(".IMG")
+        ]
+        if image_name is None:
+            if len(image_names) != 1:
+                raise ValueError(
+                    f"[image_name]: Requires image_name when {zipfile_name} does not contain a single IMG file, IMG files found = {image_names}"
+                )
+            image_name = image_names[0]
+        if image_name not in zip_ref.namelist():
+            raise ValueError(
+                f"[image_name]: '{image_name}' not in {zipfile_name}, IMG files found = {image_names}"
+            )
+        zip_info = zip_ref.getinfo(image_name)
+        if zip_info.file_size == 0:
+            return memoryview(b"")
+
+        if zip_info.compress_type == zipfile.ZIP_STORED and not zip_info.flag_bits & 0x1:
+            # stored IMG: map the ZIP and view the bytes of the IMG in place
+            data_offset = _zip_member_data_offset(zip_ref, zip_info)
+            with open(zipfile_name, "rb") as zip_file:
+                image_map = mmap.mmap(zip_file.fileno(),
+                                      0,
+                                      access=mmap.ACCESS_READ)
+            image_bytes = memoryview(image_map)[data_offset:data_offset +
+                                                zip_info.file_size]
+            if zlib.crc32(image_bytes) != zip_info.CRC:
+                raise zipfile.BadZipFile(f"Bad CRC-32 for file '{image_name}'")
+            return image_bytes
+
+        # compressed IMG: decompress into an anonymous memory map (zipfile verifies the CRC-32)
+        image_map = mmap.mmap(-1, zip_info.file_size)
+        with zip_ref.open(zip_info) as image_file:
+            shutil.copyfileobj(image_file, image_map, ZIP_EXTRACT_CHUNK_SIZE)
+        return memoryview(image_map).toreadonly()